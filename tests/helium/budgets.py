@@ -0,0 +1,46 @@
+"""
+Performance budgets for Helium tests
+
+Keyed by module (MODULES values) and tab (*_TABS entries). The "*" entry
+applies to the module view itself, i.e. right after navigate_to_module().
+Tests may click a tab by a shorter label ("Mould" for "Mould Loading"); a
+label uses the one key it is a prefix of (utils.perf.budget_tab()).
+A test that passes functionally but crosses a budget is reported as PERF_FAIL.
+
+Metrics (measured from the click that opened the view):
+    time_to_table   seconds until a table or grid is rendered
+    first_render    seconds until the view's last DOM update before going idle
+    api_calls       fetch/XHR requests started before the view went idle
+"""
+from config import (
+    MODULES,
+    MASTER_TABS,
+    STORE_TABS,
+    PRODUCTION_TABS,
+    QUALITY_TABS,
+)
+
+
+BUDGETS = {
+    MODULES["masters"]: {
+        "*": {"first_render": 3.0, "api_calls": 30},
+        **{tab: {"time_to_table": 2.5} for tab in MASTER_TABS},
+    },
+    MODULES["store"]: {
+        **{tab: {"first_render": 2.5, "api_calls": 20} for tab in STORE_TABS},
+    },
+    MODULES["prod_planner"]: {
+        "*": {"first_render": 3.0, "api_calls": 40},
+    },
+    MODULES["production"]: {
+        "*": {"first_render": 3.0},
+        **{tab: {"first_render": 2.5, "api_calls": 20} for tab in PRODUCTION_TABS},
+        "DPR": {"time_to_table": 2.5, "api_calls": 20},
+    },
+    MODULES["quality"]: {
+        **{tab: {"first_render": 2.5} for tab in QUALITY_TABS},
+    },
+    MODULES["reports"]: {
+        "*": {"first_render": 3.0, "api_calls": 30},
+    },
+}
@@ -2,6 +2,7 @@
 Configuration for Helium Selenium Tests
 """
 import os
+from datetime import date
 from pathlib import Path
 
 # Base URLs
@@ -9,6 +10,8 @@ BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:3000")
 LOGIN_URL = f"{BASE_URL}/auth/login"
 SIGNUP_URL = f"{BASE_URL}/auth/signup"
 ADMIN_URL = f"{BASE_URL}/admin"
+VERIFY_SESSION_URL = f"{BASE_URL}/api/auth/verify-session"
+LOGIN_API_URL = f"{BASE_URL}/api/auth/login"
 
 # Test Credentials
 TEST_USER = os.getenv("TEST_USER", "testuser@example.com")
@@ -16,16 +19,126 @@ TEST_PASSWORD = os.getenv("TEST_PASSWORD", "testpassword123")
 ADMIN_USER = os.getenv("ADMIN_USER", "admin@example.com")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "adminpassword123")
 
+# Reuse one authenticated session per browser instead of logging in per test
+REUSE_SESSION = os.getenv("REUSE_SESSION", "true").lower() == "true"
+
 # Timeouts (in seconds)
 TIMEOUT = 30
 SHORT_TIMEOUT = 5
 PAGE_LOAD_TIMEOUT = 60
+IMPLICIT_WAIT = 5
+TEST_TIMEOUT = int(os.getenv("TEST_TIMEOUT", "600"))  # --workers: a worker stuck in one test longer is killed
+
+# Event-driven waits: fixed sleeps return early once the app is idle.
+# Set EVENT_WAITS=false to reproduce the sleep-based run for comparison.
+EVENT_WAITS = os.getenv("EVENT_WAITS", "true").lower() == "true"
+IDLE_QUIET_MS = 200  # DOM must be unchanged this long to count as idle
+IDLE_POLL_INTERVAL = 0.05
 
 # Directories
 BASE_DIR = Path(__file__).parent
 SCREENSHOT_DIR = BASE_DIR / "screenshots"
 REPORT_DIR = BASE_DIR.parent.parent / "reports" / "helium"
 
+# Locator strategy cache (persisted between runs)
+LOCATOR_CACHE_FILE = REPORT_DIR / "locator_cache.json"
+LOCATOR_CACHE_MAX_MISSES = 2  # drop an entry after this many consecutive misses
+
+# Historical run database (per-test durations across runs)
+HISTORY_DB = REPORT_DIR / "history.sqlite3"
+HISTORY_RUNS = int(os.getenv("HISTORY_RUNS", "20"))  # runs included in trend percentiles
+
+# Append-only JSONL log per run: one line per test result, flushed as each test finishes
+RUN_LOG_DIR = REPORT_DIR / "runs"
+
+# Shard planning: estimated seconds for a test with no recorded history
+DEFAULT_TEST_DURATION = 8.0
+
+# Regression detection: repeat runs compared against a saved baseline run
+REGRESSION_REPEATS = int(os.getenv("REGRESSION_REPEATS", "10"))  # K runs per test
+REGRESSION_ALPHA = 0.05  # false discovery rate across all compared metrics
+REGRESSION_MAX_COMPARISONS = 2000  # metrics in a full-suite comparison (~100 tests x 20); sizes the --repeat check
+REGRESSION_MIN_EFFECT = 0.33  # Cliff's delta; below this a shift is too small to report
+REGRESSION_MIN_SAMPLES = 4  # per side; fewer cannot reach significance
+
+# Leak soak mode: cycle module tabs and watch heap / DOM growth
+SOAK_CYCLES = int(os.getenv("SOAK_CYCLES", "200"))
+SOAK_WARMUP_CYCLES = 5  # cycles ignored while caches fill
+SOAK_MIN_RHO = 0.8  # Spearman rank correlation with cycle number to call growth monotonic
+SOAK_MIN_GROWTH = 0.05  # and at least this much relative growth, start to end
+HEAP_SNAPSHOT_DIR = REPORT_DIR / "heap"
+
+# Prod Planner interaction benchmark: blocks per month -> (year, month) seeded with
+# that many blocks (see run.py planner-bench --seed-sql). Months two years ahead so
+# real plans are not touched and the planner reaches them in a few dozen clicks.
+PLANNER_BENCH_YEAR = int(os.getenv("PLANNER_BENCH_YEAR", str(date.today().year + 2)))
+PLANNER_BENCH_GRIDS = {10: (PLANNER_BENCH_YEAR, 1), 50: (PLANNER_BENCH_YEAR, 2), 200: (PLANNER_BENCH_YEAR, 3)}
+PLANNER_BENCH_GESTURES = int(os.getenv("PLANNER_BENCH_GESTURES", "5"))  # blocks dragged and resized per grid
+PLANNER_BENCH_STEPS = 30  # mouse moves each way per gesture
+PLANNER_BENCH_STEP_PX = 8
+PLANNER_BENCH_STEP_MS = 16  # pointer move duration, about one frame
+FRAME_BUDGET_MS = 1000 / 60
+
+# Master data scaling benchmark: rows seeded per master table through Supabase's
+# REST API (service role key needed, as for the app's server routes)
+SUPABASE_URL = os.getenv("NEXT_PUBLIC_SUPABASE_URL", "")
+SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+MASTER_BENCH_SIZES = [100, 1000, 10000, 50000]
+MASTER_BENCH_SEED_BATCH = 1000  # rows per insert request
+MASTER_BENCH_SCROLL_FRAMES = 120  # frames to scroll a table from top to bottom
+SCALING_SUPERLINEAR = 1.5  # growth exponent (1 = linear, 2 = quadratic) flagged in the report
+
+# API load generator (run.py load): virtual users replaying load_scenarios.py
+LOAD_USERS = int(os.getenv("LOAD_USERS", "10"))
+LOAD_DURATION = int(os.getenv("LOAD_DURATION", "60"))  # seconds at full load
+LOAD_RAMP_UP = 10  # seconds until all users are running
+LOAD_THINK_TIME = 0.5  # mean pause between one user's requests, seconds
+LOAD_REQUEST_TIMEOUT = 30
+LOAD_MAX_ERROR_RATE = 0.01  # run fails above this share of failed requests
+
+# Stock posting benchmark (run.py stock-bench): adjustments seeded through Supabase
+# and posted via /api/stock/post at each parallelism level, then ledger vs balance check
+STOCK_BENCH_DOCUMENTS = int(os.getenv("STOCK_BENCH_DOCUMENTS", "500"))  # per parallelism level
+STOCK_BENCH_PARALLELISM = [1, 2, 4, 8, 16]
+STOCK_BENCH_ITEMS = 20  # few items, so concurrent postings hit the same balance rows
+STOCK_BENCH_LEDGER_PAGE = 1000
+STOCK_BALANCE_TOLERANCE = 0.001  # ledger columns are DECIMAL(15, 4)
+
+# DPR Excel upload benchmark (run.py dpr-bench): generated workbooks for December of
+# DPR_BENCH_YEAR, two shifts a day, as (days, machines) per size
+DPR_BENCH_YEAR = int(os.getenv("DPR_BENCH_YEAR", str(date.today().year + 2)))
+DPR_BENCH_SIZES = [(1, 10), (7, 25), (31, 50), (31, 100)]
+DPR_BENCH_SHIFTS = ("DAY", "NIGHT")
+DPR_BENCH_UPLOAD_TIMEOUT = 600  # a whole month in one request can take minutes
+NEXT_SERVER_PID = os.getenv("NEXT_SERVER_PID", "")  # default: find a local next-server process
+MEMORY_SAMPLE_INTERVAL = 0.2
+
+# Report engine benchmark (run.py report-bench): dimension / metric combinations per
+# category, each run over every date range through /api/reports/generate and /query
+REPORT_BENCH_CATEGORIES = ["production", "dispatch", "stock", "store", "maintenance", "quality"]
+REPORT_BENCH_RANGES = {"1 day": 1, "1 month": 30, "1 year": 365}  # label -> days back from today
+REPORT_BENCH_SAMPLE = int(os.getenv("REPORT_BENCH_SAMPLE", "30"))  # combinations per category
+REPORT_BENCH_REPEATS = 3  # runs per request; the median is ranked
+REPORT_BENCH_TOP = 25  # slowest combinations listed first in the report
+
+# Server health preflight (before Chrome starts) and infrastructure circuit breaker
+PREFLIGHT = os.getenv("PREFLIGHT", "true").lower() == "true"
+HEALTH_CHECK_TIMEOUT = 10  # seconds per probe request; any status below 500 counts as up
+CIRCUIT_BREAKER_THRESHOLD = 3  # consecutive infrastructure errors that trip the breaker
+CIRCUIT_BREAKER_PAUSE = 10  # seconds to wait before each health probe after a trip
+CIRCUIT_BREAKER_PROBES = 3  # failed probes in a row before the remaining tests are skipped
+CIRCUIT_BREAKER_MAX_RECYCLES = 2  # browser restarts per browser before giving up
+
+# Warm Chrome pool: spares launched in the background and swapped in between tests
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))  # Chromes per runner or worker, the one in use included
+BROWSER_RECYCLE_TESTS = int(os.getenv("BROWSER_RECYCLE_TESTS", "50"))  # tests served before a browser is replaced; 0 = never
+BROWSER_RECYCLE_RSS_MB = int(os.getenv("BROWSER_RECYCLE_RSS_MB", "2048"))  # browser process tree memory; 0 = no limit
+BROWSER_START_TIMEOUT = 60  # seconds to wait for a spare that is still starting
+
+# Network capture: per-test request accounting from Chrome's performance log
+NETWORK_CAPTURE = os.getenv("NETWORK_CAPTURE", "true").lower() == "true"
+N_PLUS_ONE_THRESHOLD = 5  # distinct calls to one route in a test that count as N+1
+
 # Ensure directories exist
 SCREENSHOT_DIR.mkdir(exist_ok=True)
 REPORT_DIR.mkdir(parents=True, exist_ok=True)
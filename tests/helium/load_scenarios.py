@@ -0,0 +1,76 @@
+"""
+Load scenarios for the API load generator (run.py load)
+
+Each scenario is a weighted mix of requests that every virtual user repeats
+until the run ends. A request has a weight, method, path and optional
+params (query string) or json (body); callables are evaluated per request
+so date ranges stay current. Results are grouped by name, which defaults
+to "METHOD path".
+"""
+from datetime import date, timedelta
+
+
+def days_ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+DPR_WEEK = {
+    "weight": 4,
+    "method": "GET",
+    "path": "/api/dpr",
+    "params": lambda: {"from_date": days_ago(7), "to_date": days_ago(0)},
+}
+STOCK_SUMMARY = {
+    "weight": 3,
+    "method": "GET",
+    "path": "/api/stock/balance",
+    "params": {"summary": "true"},
+}
+SILO_INVENTORY = {
+    "weight": 2,
+    "method": "GET",
+    "path": "/api/production/silos/inventory",
+    "params": lambda: {"date": days_ago(0)},
+}
+PRODUCTION_BY_LINE = {
+    "name": "POST /api/reports/query (production)",
+    "weight": 1,
+    "method": "POST",
+    "path": "/api/reports/query",
+    "json": lambda: {
+        "dataSource": "production",
+        "select": [
+            {"field": "line_id"},
+            {"field": "ok_prod_qty", "aggregation": "SUM"},
+            {"field": "rej_kgs", "aggregation": "SUM"},
+        ],
+        "groupBy": ["line_id"],
+        "dateFrom": days_ago(30),
+        "dateTo": days_ago(0),
+    },
+}
+STOCK_MOVEMENTS = {
+    "name": "POST /api/reports/query (stock)",
+    "weight": 1,
+    "method": "POST",
+    "path": "/api/reports/query",
+    "json": lambda: {
+        "dataSource": "stock",
+        "select": [{"field": "document_type"}, {"field": "quantity", "aggregation": "SUM"}],
+        "groupBy": ["document_type"],
+        "dateFrom": days_ago(30),
+        "dateTo": days_ago(0),
+    },
+}
+
+
+SCENARIOS = {
+    # Supervisors and store staff refreshing their screens during a shift
+    "shop-floor": [DPR_WEEK, STOCK_SUMMARY, SILO_INVENTORY, PRODUCTION_BY_LINE],
+    # Month-end: managers running aggregate reports
+    "reports": [
+        {**PRODUCTION_BY_LINE, "weight": 3},
+        {**STOCK_MOVEMENTS, "weight": 2},
+        {**STOCK_SUMMARY, "weight": 1},
+    ],
+}
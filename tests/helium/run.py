@@ -3,19 +3,104 @@
 Main Test Runner for Helium Selenium Tests
 Runs all test modules in order and generates Excel report
 """
+import argparse
+import fnmatch
+import multiprocessing
+import os
+import queue
+import signal
 import sys
+import tempfile
 import time
 import traceback
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import BASE_URL, SCREENSHOT_DIR, REPORT_DIR
-from utils.browser import setup_browser, teardown_browser, take_screenshot, wait_for_page_load
-from utils.reporter import create_report_workbook, add_test_result, save_report, generate_summary
+from config import (
+    BASE_URL,
+    SCREENSHOT_DIR,
+    REPORT_DIR,
+    PAGE_LOAD_TIMEOUT,
+    TEST_TIMEOUT,
+    HISTORY_RUNS,
+    REGRESSION_REPEATS,
+    REGRESSION_ALPHA,
+    REGRESSION_MAX_COMPARISONS,
+    SOAK_CYCLES,
+    PLANNER_BENCH_GRIDS,
+    PLANNER_BENCH_GESTURES,
+    MASTER_BENCH_SIZES,
+    SUPABASE_URL,
+    SUPABASE_SERVICE_ROLE_KEY,
+    LOAD_USERS,
+    LOAD_DURATION,
+    LOAD_RAMP_UP,
+    LOAD_THINK_TIME,
+    LOAD_MAX_ERROR_RATE,
+    STOCK_BENCH_DOCUMENTS,
+    STOCK_BENCH_PARALLELISM,
+    STOCK_BENCH_ITEMS,
+    DPR_BENCH_SIZES,
+    REPORT_BENCH_CATEGORIES,
+    REPORT_BENCH_SAMPLE,
+    PREFLIGHT,
+    MODULES,
+    TEST_USER,
+    TEST_PASSWORD,
+)
+from utils.browser import (
+    setup_browser,
+    teardown_browser,
+    take_screenshot,
+    wait_for_page_load,
+    reset_implicit_wait_stats,
+    get_implicit_wait_stats,
+)
+from utils.reporter import (
+    create_result_store,
+    create_report_workbook,
+    add_test_result,
+    add_trends_sheet,
+    add_network_sheet,
+    add_browsers_sheet,
+    add_regressions_sheet,
+    create_soak_report,
+    create_planner_bench_report,
+    create_scaling_report,
+    create_load_report,
+    create_stock_bench_report,
+    create_dpr_upload_report,
+    create_report_bench_report,
+    load_report_results,
+    save_report,
+    generate_summary,
+)
+from utils.waits import reset_wait_stats, get_wait_stats
+from utils.vitals import reset_vitals, collect_vitals
+from utils.network import reset_network, collect_network
+from utils.perf import reset_views, get_views, get_breaches, format_breach
+from utils.history import record_run, duration_percentiles, save_baseline, resolve_baseline, get_run_results
+from utils.health import CIRCUIT_OPEN, probe_health, new_breaker, record_result, recover, open_circuit, skipped_result
+from utils.runlog import run_log_path, start_run_log, log_result, log_browser, finish_run_log, read_run_logs
+from utils.pool import start_pool, stop_pool, after_test, recycle_browser, format_browser
+from utils.procmem import process_tree
+from utils.locators import save_cache
+from utils.sharding import parse_shard, select_shard, flatten_modules, group_by_module, export_durations
+from utils.regression import find_regressions, format_regression, min_q_value
+from utils.soak import SOAK_TABS, soak_module
+from utils.planner_bench import planner_seed_sql, run_planner_bench, GESTURES
+from utils.scaling import SEED_TABLES, run_master_bench
+from utils.load import TOTAL_ROUTE, api_login, run_load
+from utils.stock_bench import run_stock_bench
+from utils.dpr_bench import FILE_PREFIX, write_dpr_workbook, run_dpr_bench
+from utils.report_bench import run_report_bench
+from load_scenarios import SCENARIOS
+from utils.helpers import login
 
 # Import test modules
 import test_auth
@@ -61,29 +146,89 @@ def run_single_test(test_func: Callable, module_name: str) -> Dict[str, Any]:
         "status": "PASS",
         "duration": 0,
         "error": None,
+        "error_class": None,
         "screenshot": None,
+        "wait_saved": 0,
+        "implicit_wait": 0,
+        "implicit_wait_timeouts": 0,
+        "vitals": None,
+        "network": None,
+        "views": [],
+        "budget_breaches": [],
     }
     
+    reset_wait_stats()
+    reset_implicit_wait_stats()
+    reset_vitals()
+    reset_network()
+    reset_views()
+    
     try:
         # Run the test
         test_func()
         result["status"] = "PASS"
-        print(f"  ✓ {test_name}")
         
     except AssertionError as e:
         result["status"] = "FAIL"
         result["error"] = str(e)
+        result["error_class"] = type(e).__name__
         result["screenshot"] = capture_failure(test_name, str(e))
         print(f"  ✗ {test_name} - ASSERTION: {str(e)[:50]}")
         
     except Exception as e:
         result["status"] = "FAIL"
         result["error"] = f"{type(e).__name__}: {str(e)}"
+        result["error_class"] = type(e).__name__
         result["screenshot"] = capture_failure(test_name, traceback.format_exc())
         print(f"  ✗ {test_name} - ERROR: {type(e).__name__}")
     
     finally:
         result["duration"] = time.time() - start_time
+        result["wait_saved"] = get_wait_stats()["saved"]
+        implicit_stats = get_implicit_wait_stats()
+        result["implicit_wait"] = implicit_stats["seconds"]
+        result["implicit_wait_timeouts"] = implicit_stats["timeouts"]
+        result["vitals"] = collect_vitals()
+        result["network"] = collect_network()
+        result["views"] = get_views()
+        result["budget_breaches"] = [format_breach(b) for b in get_breaches()]
+    
+    # A functional pass that crossed a performance budget blocks like a failure
+    if result["status"] == "PASS" and result["budget_breaches"]:
+        result["status"] = "PERF_FAIL"
+        print(f"  ⚠ {test_name} - BUDGET: {result['budget_breaches'][0]}")
+    elif result["status"] == "PASS":
+        print(f"  ✓ {test_name}")
+    
+    return result
+
+
+def run_guarded(
+    test_func: Callable,
+    module_name: str,
+    breaker: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Run one test behind the circuit breaker: skip it while the circuit is
+    open, and when this result trips the breaker, restart the browser if
+    the server is healthy or open the circuit if not. The browser pool
+    gets every result, to recycle the browser when it is due.
+    Returns the test result.
+    """
+    if breaker["open"]:
+        print(f"  ○ {test_func.__name__} - SKIP (circuit open)")
+        return skipped_result(module_name, test_func.__name__, breaker["reason"])
+    
+    result = run_single_test(test_func, module_name)
+    
+    try:
+        recycled = after_test(result)
+        if record_result(breaker, result) and recover(breaker):
+            print("    Server is up, continuing with a fresh browser")
+            if not recycled:
+                recycle_browser("circuit breaker")
+    except Exception as e:
+        open_circuit(breaker, f"Browser restart failed: {type(e).__name__}: {e}")
     
     return result
 
@@ -99,11 +244,17 @@ def capture_failure(test_name: str, error: str) -> str:
         return ""
 
 
-def run_test_module(module_name: str, test_functions: List[Callable]) -> List[Dict[str, Any]]:
+def run_test_module(
+    module_name: str,
+    test_functions: List[Callable],
+    run_log: Optional[Path] = None,
+    breaker: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
     """
-    Execute all tests in a module.
+    Execute all tests in a module, appending each result to run_log if given.
     Returns list of test results.
     """
+    breaker = breaker if breaker is not None else new_breaker()
     print(f"\n{'─' * 40}")
     print(f"MODULE: {module_name} ({len(test_functions)} tests)")
     print('─' * 40)
@@ -111,40 +262,515 @@ def run_test_module(module_name: str, test_functions: List[Callable]) -> List[Di
     results = []
     
     for test_func in test_functions:
-        result = run_single_test(test_func, module_name)
+        result = run_guarded(test_func, module_name, breaker)
         results.append(result)
+        if run_log:
+            log_result(run_log, result)
     
     # Module summary
     passed = sum(1 for r in results if r["status"] == "PASS")
     failed = sum(1 for r in results if r["status"] == "FAIL")
-    print(f"\n  Module Summary: {passed} passed, {failed} failed")
+    perf_failed = sum(1 for r in results if r["status"] == "PERF_FAIL")
+    print(f"\n  Module Summary: {passed} passed, {failed} failed, {perf_failed} over budget")
+    
+    return results
+
+
+def get_test_modules() -> List[Tuple[str, List[Callable]]]:
+    """
+    Define test modules in execution order.
+    Returns list of (module_name, test_functions) tuples.
+    """
+    return [
+        ("Auth", test_auth.get_all_tests()),
+        ("Masters", test_masters.get_all_tests()),
+        ("Store & Dispatch", test_store.get_all_tests()),
+        ("Prod Planner", test_prod_planner.get_all_tests()),
+        ("Production", test_production.get_all_tests()),
+        ("Quality", test_quality.get_all_tests()),
+        ("Maintenance", test_maintenance.get_all_tests()),
+        ("Reports", test_reports.get_all_tests()),
+        ("Approvals", test_approvals.get_all_tests()),
+        ("Profile", test_profile.get_all_tests()),
+        ("Admin", test_admin.get_all_tests()),
+    ]
+
+
+def run_serial(
+    test_modules: List[Tuple[str, List[Callable]]],
+    run_log: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run all test modules in order through one browser at a time, taken
+    from the warm browser pool. Each browser's metrics go to run_log.
+    Returns list of test results.
+    """
+    results = []
+    breaker = new_breaker()
+    
+    print("Starting browser...")
+    start_pool()
+    print("Browser started successfully!\n")
+    
+    try:
+        for module_name, test_functions in test_modules:
+            module_results = run_test_module(module_name, test_functions, run_log, breaker)
+            results.extend(module_results)
+    finally:
+        save_cache()
+        print("\nClosing browsers...")
+        browsers = stop_pool()
+        for metrics in browsers:
+            print(f"  {format_browser(metrics)}")
+            if run_log:
+                log_browser(run_log, metrics)
+        print("Browsers closed.")
+    
+    return results
+
+
+def run_soak(
+    modules: List[str],
+    cycles: int,
+    snapshots: bool = False,
+    collect_garbage: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Leak soak: cycle each module's tabs in one long-lived browser session
+    and flag metrics that grow monotonically.
+    Returns one soak result per module.
+    """
+    print("\n" + "=" * 60)
+    print(f"LEAK SOAK: {', '.join(modules)} x {cycles} cycles")
+    print("=" * 60)
+    
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results = []
+    
+    setup_browser()
+    try:
+        login(TEST_USER, TEST_PASSWORD)
+        for module in modules:
+            results.append(soak_module(module, cycles, snapshots, collect_garbage, run_id))
+    finally:
+        save_cache()
+        teardown_browser()
+    
+    report_path = create_soak_report(results, f"soak_{run_id}.xlsx")
+    
+    print("\n" + "=" * 60)
+    print("SOAK SUMMARY")
+    print("=" * 60)
+    for result in results:
+        status = f"LEAK: {', '.join(result['leaking'])}" if result["leaking"] else "no monotonic growth"
+        print(f"  • {result['module']}: {status}")
+        for metric in result["leaking"]:
+            trend = result["trends"][metric]
+            print(f"    {metric}: {trend['start']:.0f} -> {trend['end']:.0f} "
+                  f"(+{trend['growth'] * 100:.1f}%, rho {trend['rho']:.2f})")
+        if result["errors"]:
+            print(f"    {result['errors']} tab clicks failed")
+        for path in result["snapshots"]:
+            print(f"    Heap snapshot: {path}")
+    print(f"\nReport: {report_path}")
+    
+    return results
+
+
+def run_planner_benchmark(gestures: int = PLANNER_BENCH_GESTURES) -> List[Dict[str, Any]]:
+    """
+    Drag / resize frame-rate benchmark on the seeded Prod Planner months.
+    Returns one result per grid size.
+    """
+    print("\n" + "=" * 60)
+    print(f"PLANNER BENCHMARK: {', '.join(str(n) for n in sorted(PLANNER_BENCH_GRIDS))} blocks per month")
+    print("=" * 60)
+    
+    setup_browser()
+    try:
+        login(TEST_USER, TEST_PASSWORD)
+        results = run_planner_bench(PLANNER_BENCH_GRIDS, gestures)
+    finally:
+        save_cache()
+        teardown_browser()
+    
+    report_path = create_planner_bench_report(results)
+    
+    for result in results:
+        if result["blocks"] < result["grid"]:
+            print(f"  ⚠ {result['month']}: {result['blocks']} of {result['grid']} blocks rendered "
+                  f"(seed with: python run.py planner-bench --seed-sql FILE)")
+        for gesture in GESTURES:
+            if result[gesture]["errors"]:
+                print(f"  ⚠ {result['month']}: {result[gesture]['errors']} {gesture} gestures failed")
+    print(f"\nReport: {report_path}")
+    
+    return results
+
+
+def run_master_scaling(sizes: List[int], tabs: List[str], keep: bool = False) -> List[Dict[str, Any]]:
+    """
+    Master data scaling benchmark: seed each size, measure every Master tab.
+    Returns one result per size.
+    """
+    print("\n" + "=" * 60)
+    print(f"MASTER SCALING: {', '.join(str(n) for n in sorted(sizes))} rows x {len(tabs)} tabs")
+    print("=" * 60)
+    
+    setup_browser()
+    try:
+        login(TEST_USER, TEST_PASSWORD)
+        results = run_master_bench(sizes, tabs, keep)
+    finally:
+        save_cache()
+        teardown_browser()
+    
+    report_path = create_scaling_report(results)
+    print(f"\nReport: {report_path}")
+    
+    return results
+
+
+def run_load_test(scenario: str, users: int, duration: float, ramp_up: float, think_time: float) -> Optional[Dict[str, Any]]:
+    """
+    API load test: log in over HTTP and replay a scenario with concurrent users.
+    Returns the run_load() result, or None if login failed.
+    """
+    print("\n" + "=" * 60)
+    print(f"API LOAD: {scenario}, {users} users, {ramp_up:.0f}s ramp-up + {duration:.0f}s against {BASE_URL}")
+    print("=" * 60)
+    
+    token = api_login(TEST_USER, TEST_PASSWORD)
+    if not token:
+        return None
+    
+    result = run_load(token, scenario, users, duration, ramp_up, think_time)
+    report_path = create_load_report(result)
+    
+    routes = result["routes"]
+    for route in sorted(routes, key=lambda r: (r == TOTAL_ROUTE, r)):
+        stats = routes[route]
+        print(
+            f"  {route}: {stats['requests']} req, {stats['throughput']:.1f}/s, "
+            f"p50 {stats['p50_ms']:.0f} / p95 {stats['p95_ms']:.0f} / p99 {stats['p99_ms']:.0f} ms, "
+            f"errors {stats['error_rate'] * 100:.1f}%"
+        )
+    print(f"\nReport: {report_path}")
+    
+    return result
+
+
+def run_stock_benchmark(levels: List[int], documents: int, items: int, keep: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Stock posting benchmark: post seeded adjustments at each parallelism
+    level, then check balances against the ledger.
+    Returns the run_stock_bench() result, or None if login failed.
+    """
+    print("\n" + "=" * 60)
+    print(f"STOCK POSTING: {documents} documents x parallelism {', '.join(str(n) for n in levels)} against {BASE_URL}")
+    print("=" * 60)
+    
+    token = api_login(TEST_USER, TEST_PASSWORD)
+    if not token:
+        return None
+    
+    result = run_stock_bench(token, levels, documents, items, keep)
+    report_path = create_stock_bench_report(result)
+    
+    inconsistent = [row for row in result["consistency"] if not row["consistent"]]
+    if inconsistent:
+        print(f"\n  ⚠ {len(inconsistent)} item/location balances disagree with the ledger:")
+        for row in inconsistent:
+            print(
+                f"    {row['item_code']} @ {row['location']}: expected {row['expected']:g}, "
+                f"ledger {row['ledger_sum']:g}, balance {row['balance']:g}, {row['chain_breaks']} chain breaks"
+            )
+    else:
+        print(f"\n  Balances match the ledger for all {len(result['consistency'])} item/locations")
+    print(f"\nReport: {report_path}")
+    
+    return result
+
+
+def run_dpr_upload_benchmark(sizes: List[Tuple[int, int]], keep: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """
+    DPR Excel upload benchmark: generate a workbook per size and upload it
+    through /api/dpr/upload-excel and /api/dpr-excel.
+    Returns one result per size, or None if login failed.
+    """
+    print("\n" + "=" * 60)
+    print(f"DPR UPLOAD: {', '.join(f'{d}d x {m}m' for d, m in sizes)} against {BASE_URL}")
+    print("=" * 60)
+    
+    token = api_login(TEST_USER, TEST_PASSWORD)
+    if not token:
+        return None
+    
+    with tempfile.TemporaryDirectory(prefix="helium_dpr_") as workdir:
+        results = run_dpr_bench(token, sizes, Path(workdir), keep)
+    report_path = create_dpr_upload_report(results)
+    print(f"\nReport: {report_path}")
     
     return results
 
 
-def create_excel_report(results: List[Dict[str, Any]]) -> str:
+def run_report_benchmark(categories: List[str], sample: int) -> Optional[Dict[str, Any]]:
+    """
+    Report engine benchmark: time sampled dimension / metric combinations
+    per category through /api/reports/generate and /api/reports/query.
+    Returns the run_report_bench() result, or None if login failed.
+    """
+    print("\n" + "=" * 60)
+    print(f"REPORT ENGINE: {sample} combinations x {', '.join(categories)} against {BASE_URL}")
+    print("=" * 60)
+    
+    token = api_login(TEST_USER, TEST_PASSWORD)
+    if not token:
+        return None
+    
+    result = run_report_bench(token, categories, sample)
+    report_path = create_report_bench_report(result)
+    
+    results = result["results"]
+    print(f"\n  {len(results)} requests, {sum(1 for r in results if not r['ok'])} failed. Slowest:")
+    for r in [r for r in results if r["ok"]][:10]:
+        print(f"    {r['ms']:7.0f} ms {r['bytes'] / 1024:8.1f} KB  {r['category']} {r['route']}: "
+              f"{r['combination']} ({r['range']})")
+    print(f"\nReport: {report_path}")
+    
+    return result
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    """
+    Parse a DAYSxMACHINES workbook size such as 31x100.
+    """
+    try:
+        days, machines = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected DAYSxMACHINES, got {value!r}")
+    if not (1 <= days <= 31 and machines >= 1):
+        raise argparse.ArgumentTypeError(f"days must be 1-31 and machines at least 1, got {value!r}")
+    return days, machines
+
+
+def worker_main(worker_id: int, task_queue, result_queue):
+    """
+    Worker process entry point.
+    Starts the worker's own browser pool (every Chrome with its own
+    user-data dir) and runs tests from the task queue until it receives a
+    None sentinel. Messages are (worker_id, index, payload): payload None
+    when a test starts, then its result; finally (worker_id, None, browser
+    metrics).
+    """
+    try:
+        start_pool(worker=worker_id)
+    except Exception as e:
+        # Report every remaining task as failed so the parent never blocks
+        error = f"Browser start failed: {type(e).__name__}: {e}"
+        for index, module_name, test_func in iter(task_queue.get, None):
+            result_queue.put((worker_id, index, {
+                "module": module_name,
+                "test_name": test_func.__name__,
+                "status": "FAIL",
+                "duration": 0,
+                "error": error,
+                "error_class": type(e).__name__,
+                "screenshot": None,
+                "worker": worker_id,
+            }))
+        result_queue.put((worker_id, None, []))
+        return
+    
+    breaker = new_breaker()
+    try:
+        for index, module_name, test_func in iter(task_queue.get, None):
+            result_queue.put((worker_id, index, None))
+            result = run_guarded(test_func, module_name, breaker)
+            result["worker"] = worker_id
+            result_queue.put((worker_id, index, result))
+    finally:
+        save_cache()
+        result_queue.put((worker_id, None, stop_pool()))
+
+
+def worker_exited(module_name: str, test_func: Callable, error: str, worker_id: int = None) -> Dict[str, Any]:
+    """
+    FAIL result for a test whose worker died or was stopped before reporting.
+    """
+    return {
+        "module": module_name,
+        "test_name": test_func.__name__,
+        "status": "FAIL",
+        "duration": 0,
+        "error": error,
+        "error_class": "WorkerExited",
+        "screenshot": None,
+        "worker": worker_id,
+    }
+
+
+def kill_worker(process) -> None:
+    """
+    Kill a worker process and what it started (chromedriver, Chrome).
+    """
+    children = process_tree(process.pid)[1:]
+    process.kill()
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+    process.join()
+
+
+def run_parallel(
+    test_modules: List[Tuple[str, List[Callable]]],
+    workers: int,
+    run_log: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run tests across N worker processes, each driving its own Chrome.
+    Tests are handed out one at a time from a shared queue so fast
+    workers pick up more work. Results are appended to run_log as they
+    arrive, and each worker's browser metrics when it finishes. A worker
+    stuck in one test for more than TEST_TIMEOUT seconds is killed and
+    the test reported as WorkerExited.
+    Returns results in the original test order.
+    """
+    tasks = flatten_modules(test_modules)
+    
+    # Spawn gives each worker a clean interpreter with its own Helium driver
+    ctx = multiprocessing.get_context("spawn")
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    
+    for index, (module_name, test_func) in enumerate(tasks):
+        task_queue.put((index, module_name, test_func))
+    for _ in range(workers):
+        task_queue.put(None)
+    
+    print(f"Starting {workers} workers for {len(tasks)} tests...\n")
+    processes = {
+        worker_id: ctx.Process(target=worker_main, args=(worker_id, task_queue, result_queue))
+        for worker_id in range(1, workers + 1)
+    }
+    for process in processes.values():
+        process.start()
+    
+    indexed_results = {}
+    running = {}  # worker_id -> (task index, start time) of the test in progress
+    finished = set()
+    while len(indexed_results) < len(tasks) or len(finished) < workers:
+        try:
+            worker_id, index, payload = result_queue.get(timeout=1)
+            if index is None:
+                # A worker's last message: its browser metrics
+                finished.add(worker_id)
+                running.pop(worker_id, None)
+                for metrics in payload:
+                    print(f"  {format_browser(metrics)}")
+                    if run_log:
+                        log_browser(run_log, metrics)
+            elif payload is None:
+                running[worker_id] = (index, time.monotonic())
+            else:
+                running.pop(worker_id, None)
+                indexed_results[index] = payload
+                if run_log:
+                    log_result(run_log, payload)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes.values()):
+                break
+        
+        for worker_id, (index, started) in list(running.items()):
+            if time.monotonic() - started <= TEST_TIMEOUT:
+                continue
+            module_name, test_func = tasks[index]
+            print(f"\n  ✗ Worker {worker_id} stuck in {module_name}::{test_func.__name__} "
+                  f"for over {TEST_TIMEOUT}s, stopping it")
+            kill_worker(processes[worker_id])
+            del running[worker_id]
+            finished.add(worker_id)
+            indexed_results[index] = worker_exited(
+                module_name, test_func, f"Test exceeded TEST_TIMEOUT ({TEST_TIMEOUT}s); worker stopped", worker_id
+            )
+            if run_log:
+                log_result(run_log, indexed_results[index])
+    
+    for process in processes.values():
+        process.join(timeout=PAGE_LOAD_TIMEOUT)
+        if process.is_alive():
+            kill_worker(process)
+    
+    # Tests lost to a crashed worker are reported rather than dropped
+    for index, (module_name, test_func) in enumerate(tasks):
+        if index not in indexed_results:
+            indexed_results[index] = worker_exited(
+                module_name, test_func, "Worker process exited before reporting a result"
+            )
+            if run_log:
+                log_result(run_log, indexed_results[index])
+    
+    return [indexed_results[index] for index in range(len(tasks))]
+
+
+def create_excel_report(
+    results: List[Dict[str, Any]],
+    filename: str = None,
+    regressions: List[Dict[str, Any]] = None,
+    baseline: str = None,
+    browsers: List[Dict[str, Any]] = None
+) -> str:
     """
     Generate Excel report from test results.
+    Adds a Regressions sheet when the run was compared against a baseline,
+    and a Browsers sheet with the metrics of each pooled browser.
     Returns path to saved report.
     """
     print("\n" + "=" * 60)
     print("GENERATING EXCEL REPORT")
     print("=" * 60)
     
-    wb = create_report_workbook()
+    store = create_result_store()
     
     for result in results:
         add_test_result(
-            wb,
+            store,
             module=result["module"],
             test_name=result["test_name"],
             status=result["status"],
             duration=result["duration"],
             error=result.get("error"),
             screenshot=result.get("screenshot"),
+            wait_saved=result.get("wait_saved"),
+            implicit_wait=result.get("implicit_wait"),
+            vitals=result.get("vitals"),
+            network=result.get("network"),
+            budget_breaches=result.get("budget_breaches"),
         )
     
-    report_path = save_report(wb)
+    # Summary and Test Results, streamed from the store
+    wb = create_report_workbook(store)
+    
+    add_network_sheet(wb, results)
+    add_browsers_sheet(wb, browsers or [])
+    
+    if regressions is not None:
+        add_regressions_sheet(wb, regressions, baseline)
+    
+    # Trends across recent runs (includes this run once recorded)
+    try:
+        add_trends_sheet(
+            wb,
+            duration_percentiles(by="test", last_n=HISTORY_RUNS),
+            duration_percentiles(by="module", last_n=HISTORY_RUNS),
+            HISTORY_RUNS,
+        )
+    except Exception as e:
+        print(f"Warning: Could not build Trends sheet: {e}")
+    
+    report_path = save_report(wb, filename)
     print(f"\nReport saved to: {report_path}")
     
     return report_path
@@ -157,6 +783,7 @@ def print_final_summary(results: List[Dict[str, Any]], report_path: str):
     total = len(results)
     passed = sum(1 for r in results if r["status"] == "PASS")
     failed = sum(1 for r in results if r["status"] == "FAIL")
+    perf_failed = sum(1 for r in results if r["status"] == "PERF_FAIL")
     skipped = sum(1 for r in results if r["status"] == "SKIP")
     total_duration = sum(r["duration"] for r in results)
     pass_rate = (passed / total * 100) if total > 0 else 0
@@ -168,6 +795,7 @@ def print_final_summary(results: List[Dict[str, Any]], report_path: str):
     Total Tests:    {total}
     Passed:         {passed} ✓
     Failed:         {failed} ✗
+    Over Budget:    {perf_failed} ⚠
     Skipped:        {skipped} ○
     Pass Rate:      {pass_rate:.1f}%
     Total Duration: {total_duration:.2f}s
@@ -186,59 +814,631 @@ def print_final_summary(results: List[Dict[str, Any]], report_path: str):
                 if r.get("error"):
                     print(f"    Error: {r['error'][:80]}...")
         print()
+    
+    # Print budget breaches
+    if perf_failed > 0:
+        print("\nOVER BUDGET:")
+        print("-" * 40)
+        for r in results:
+            if r["status"] == "PERF_FAIL":
+                print(f"  • {r['module']}: {r['test_name']}")
+                for breach in r.get("budget_breaches") or []:
+                    print(f"    {breach}")
+        print()
+
+
+def sort_results(results: List[Dict[str, Any]]) -> None:
+    """
+    Sort results in place into canonical test order; tests that no longer
+    exist go last.
+    """
+    order = {
+        (module_name, test_func.__name__): index
+        for index, (module_name, test_func) in enumerate(flatten_modules(get_test_modules()))
+    }
+    results.sort(key=lambda r: order.get((r["module"], r["test_name"]), len(order)))
+
+
+def merge_reports(report_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Combine shard reports into one report, in canonical test order.
+    A shard whose run log is at hand (RUN_LOG_DIR/<run_id>.jsonl) is read
+    from the log, which keeps what the report does not: error class, worker,
+    per-route network calls and browser metrics. Other shards are read from
+    the report.
+    Returns the merged results.
+    """
+    results = []
+    browsers = []
+    for path in report_paths:
+        log_path = run_log_path(Path(path).stem.removeprefix("results_"))
+        if log_path.is_file():
+            log = read_run_logs([log_path])
+            shard_results = drop_superseded_skips(log["results"])
+            browsers.extend(log["browsers"])
+            print(f"Loaded {len(shard_results)} results from {log_path}")
+        else:
+            shard_results = load_report_results(path)
+            print(f"Loaded {len(shard_results)} results from {path} "
+                  f"(no run log: error classes, workers and network routes are missing)")
+        results.extend(shard_results)
+    
+    sort_results(results)
+    
+    report_path = create_excel_report(results, browsers=browsers)
+    print_final_summary(results, report_path)
+    
+    return results
+
+
+def drop_superseded_skips(logged: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Logged results without the circuit-open skips of tests that a later
+    --resume ran: such a test counts once, with its real result.
+    """
+    results = []
+    superseded = Counter()
+    for r in reversed(logged):
+        key = (r["run_id"], r["module"], r["test_name"])
+        if r.get("error_class") != CIRCUIT_OPEN:
+            superseded[key] += 1
+        elif superseded[key] > 0:
+            superseded[key] -= 1
+            continue
+        results.append(r)
+    results.reverse()
+    return results
+
+
+def report_from_logs(log_paths: List[Path]) -> List[Dict[str, Any]]:
+    """
+    Rebuild the Excel report, summary and trends from run logs, including
+    runs that never finished and the logs of several shards. Each logged
+    run is recorded in the run history again (replacing its rows), so runs
+    that crashed before recording show up in the Trends sheet.
+    Returns the logged results in canonical test order.
+    """
+    log = read_run_logs(log_paths)
+    results = drop_superseded_skips(log["results"])
+    
+    for run_id, run in log["runs"].items():
+        planned = f" of {run['tests']}" if run["tests"] is not None else ""
+        state = "finished" if run["finished"] else "did not finish"
+        print(f"Loaded {run['results']}{planned} results of run {run_id} ({state})")
+        
+        run_results = [r for r in results if r["run_id"] == run_id]
+        if not run_results:
+            continue
+        try:
+            started_at = datetime.strptime(run["started_at"], "%Y-%m-%d %H:%M:%S") if run["started_at"] else None
+            record_run(run_id, run_results, started_at=started_at, workers=run["workers"])
+        except Exception as e:
+            print(f"Warning: Could not record run history: {e}")
+    
+    sort_results(results)
+    
+    # A single run keeps its own report name; shards get a fresh one
+    filename = f"results_{next(iter(log['runs']))}.xlsx" if len(log["runs"]) == 1 else None
+    report_path = create_excel_report(results, filename, browsers=log["browsers"])
+    print_final_summary(results, report_path)
+    
+    return results
+
+
+def select_tests(
+    test_modules: List[Tuple[str, List[Callable]]],
+    patterns: List[str]
+) -> List[Tuple[str, List[Callable]]]:
+    """
+    Keep tests whose name or "Module::test_name" matches any glob pattern.
+    """
+    return group_by_module([
+        (module_name, test_func)
+        for module_name, test_func in flatten_modules(test_modules)
+        if any(
+            fnmatch.fnmatch(test_func.__name__, pattern) or
+            fnmatch.fnmatch(f"{module_name}::{test_func.__name__}", pattern)
+            for pattern in patterns
+        )
+    ])
+
+
+def previous_results(run_id: str) -> List[Dict[str, Any]]:
+    """
+    Results of an earlier run: from its run log, or from the run history
+    for runs without one. Returns [] if neither has the run.
+    """
+    path = run_log_path(run_id)
+    if path.is_file():
+        return read_run_logs([path])["results"]
+    return get_run_results(run_id)
+
+
+def select_failed(
+    test_modules: List[Tuple[str, List[Callable]]],
+    previous: List[Dict[str, Any]]
+) -> List[Tuple[str, List[Callable]]]:
+    """
+    Keep tests with at least one FAIL result among previous, and tests
+    skipped because the circuit breaker was open (they never ran).
+    """
+    failed = {
+        (r["module"], r["test_name"])
+        for r in previous
+        if r["status"] == "FAIL" or r.get("error_class") == CIRCUIT_OPEN
+    }
+    return group_by_module([
+        (module_name, test_func)
+        for module_name, test_func in flatten_modules(test_modules)
+        if (module_name, test_func.__name__) in failed
+    ])
+
+
+def skip_finished(
+    test_modules: List[Tuple[str, List[Callable]]],
+    finished: List[Dict[str, Any]]
+) -> List[Tuple[str, List[Callable]]]:
+    """
+    Drop tests that already have a result in the run being resumed. A test
+    selected K times (--repeat) is dropped once per logged result. Skips
+    behind an open circuit breaker do not count: those tests never ran.
+    """
+    done = Counter(
+        (r["module"], r["test_name"])
+        for r in finished
+        if r.get("error_class") != CIRCUIT_OPEN
+    )
+    remaining = []
+    for module_name, test_func in flatten_modules(test_modules):
+        key = (module_name, test_func.__name__)
+        if done[key] > 0:
+            done[key] -= 1
+        else:
+            remaining.append((module_name, test_func))
+    return group_by_module(remaining)
+
+
+def compare_to_baseline(run_id: str, baseline: str) -> List[Dict[str, Any]]:
+    """
+    Find significant slowdowns of this run against a baseline name or run id.
+    Returns the regressions (empty if none or the baseline is unknown).
+    """
+    baseline_run_id = resolve_baseline(baseline)
+    if baseline_run_id is None:
+        print(f"Warning: No baseline or run named {baseline!r}; skipping regression check")
+        return []
+    
+    regressions = find_regressions(run_id, baseline_run_id)
+    
+    print("\n" + "=" * 60)
+    print(f"REGRESSIONS vs {baseline_run_id}")
+    print("=" * 60)
+    if regressions:
+        for regression in regressions:
+            print(f"  • {format_regression(regression)}")
+    else:
+        print("  No significant slowdowns")
+    
+    return regressions
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """
+    Parse command line options.
+    """
+    parser = argparse.ArgumentParser(description="Run Helium Selenium tests")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel Chrome sessions (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help="Run only shard I of N, balanced by recorded test durations",
+    )
+    parser.add_argument(
+        "--durations",
+        type=Path,
+        metavar="FILE",
+        help="Durations JSON (from export-durations) to plan shards from",
+    )
+    
+    parser.add_argument(
+        "--select",
+        action="append",
+        metavar="PATTERN",
+        help="Run only tests matching a glob on test_name or Module::test_name (repeatable)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        metavar="K",
+        help=f"Run each selected test K times (default: 1, or {REGRESSION_REPEATS} with --baseline/--save-baseline)",
+    )
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const="default",
+        metavar="NAME",
+        help="Report significant slowdowns against a saved baseline name or run id",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const="default",
+        metavar="NAME",
+        help="Save this run as a named baseline (default name: default)",
+    )
+    
+    rerun_group = parser.add_mutually_exclusive_group()
+    rerun_group.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continue an interrupted run from its run log, skipping tests that already have a result",
+    )
+    rerun_group.add_argument(
+        "--rerun-failed",
+        metavar="RUN_ID",
+        help="Run only the tests that failed in an earlier run (with --repeat K, K times each)",
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    
+    merge_parser = subparsers.add_parser("merge", help="Merge shard reports into one report")
+    merge_parser.add_argument("reports", nargs="+", help="Shard .xlsx reports")
+    
+    rebuild_parser = subparsers.add_parser("report", help="Rebuild the Excel report from run logs")
+    rebuild_parser.add_argument(
+        "--from-log", type=Path, nargs="+", required=True, metavar="LOG",
+        help="Run logs (reports/helium/runs/<run_id>.jsonl), e.g. all shards of one run",
+    )
+    
+    export_parser = subparsers.add_parser(
+        "export-durations", help="Write per-test p50 durations from run history as JSON"
+    )
+    export_parser.add_argument("path", type=Path, help="Output JSON file")
+    
+    soak_parser = subparsers.add_parser(
+        "soak", help="Cycle module tabs for many cycles and flag JS heap / DOM growth"
+    )
+    soak_parser.add_argument(
+        "modules",
+        nargs="*",
+        help=f"Modules to soak: {', '.join(SOAK_TABS)} (default: Production, Prod Planner)",
+    )
+    soak_parser.add_argument("--cycles", type=int, default=SOAK_CYCLES, help="Cycles per module")
+    soak_parser.add_argument(
+        "--snapshots", action="store_true", help="Save heap snapshots at the start and end"
+    )
+    soak_parser.add_argument(
+        "--no-gc", action="store_true", help="Do not force garbage collection before sampling"
+    )
+    
+    bench_parser = subparsers.add_parser(
+        "planner-bench", help="Measure frame times while dragging / resizing Prod Planner blocks"
+    )
+    bench_parser.add_argument(
+        "--gestures", type=int, default=PLANNER_BENCH_GESTURES, help="Blocks dragged and resized per grid"
+    )
+    bench_parser.add_argument(
+        "--seed-sql", type=Path, metavar="FILE", help="Write SQL that seeds the benchmark months, then exit"
+    )
+    
+    scaling_parser = subparsers.add_parser(
+        "master-bench", help="Seed growing master tables and measure how the Master tabs scale"
+    )
+    scaling_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=MASTER_BENCH_SIZES, metavar="ROWS",
+        help=f"Rows seeded per table (default: {' '.join(str(n) for n in MASTER_BENCH_SIZES)})",
+    )
+    scaling_parser.add_argument(
+        "--tabs", nargs="+", metavar="TAB", help=f"Master tabs to measure: {', '.join(SEED_TABLES)} (default: all)"
+    )
+    scaling_parser.add_argument("--keep", action="store_true", help="Keep the seeded rows afterwards")
+    
+    load_parser = subparsers.add_parser("load", help="Concurrent API load test against the route handlers")
+    load_parser.add_argument(
+        "scenario", nargs="?", default="shop-floor", choices=sorted(SCENARIOS), help="Scenario from load_scenarios.py"
+    )
+    load_parser.add_argument("--users", type=int, default=LOAD_USERS, help="Concurrent virtual users")
+    load_parser.add_argument("--duration", type=float, default=LOAD_DURATION, help="Seconds at full load")
+    load_parser.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP, help="Seconds to start all users")
+    load_parser.add_argument(
+        "--think-time", type=float, default=LOAD_THINK_TIME, help="Mean pause between a user's requests (s)"
+    )
+    
+    stock_parser = subparsers.add_parser(
+        "stock-bench", help="Post seeded stock documents concurrently and check balances against the ledger"
+    )
+    stock_parser.add_argument(
+        "--documents", type=int, default=STOCK_BENCH_DOCUMENTS, help="Documents posted per parallelism level"
+    )
+    stock_parser.add_argument(
+        "--parallelism", type=int, nargs="+", default=STOCK_BENCH_PARALLELISM, metavar="N",
+        help=f"Concurrent posters per level (default: {' '.join(str(n) for n in STOCK_BENCH_PARALLELISM)})",
+    )
+    stock_parser.add_argument("--items", type=int, default=STOCK_BENCH_ITEMS, help="Stock items the documents share")
+    stock_parser.add_argument("--keep", action="store_true", help="Keep the seeded documents and ledger entries")
+    
+    dpr_parser = subparsers.add_parser(
+        "dpr-bench", help="Upload generated DPR workbooks of growing size and time both Excel import routes"
+    )
+    dpr_parser.add_argument(
+        "--sizes", type=parse_size, nargs="+", default=DPR_BENCH_SIZES, metavar="DAYSxMACHINES",
+        help=f"Workbook sizes, two shifts a day (default: {' '.join(f'{d}x{m}' for d, m in DPR_BENCH_SIZES)})",
+    )
+    dpr_parser.add_argument(
+        "--workbooks", type=Path, metavar="DIR", help="Only write the generated workbooks to DIR, then exit"
+    )
+    dpr_parser.add_argument("--keep", action="store_true", help="Keep the uploaded DPRs afterwards")
+    
+    report_parser = subparsers.add_parser(
+        "report-bench", help="Time sampled dimension / metric combinations through the reports API"
+    )
+    report_parser.add_argument(
+        "--categories", nargs="+", metavar="CATEGORY",
+        help=f"Report categories: {', '.join(REPORT_BENCH_CATEGORIES)} (default: all)",
+    )
+    report_parser.add_argument(
+        "--sample", type=int, default=REPORT_BENCH_SAMPLE, help="Combinations per category"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    if args.command == "soak":
+        args.modules = args.modules or [MODULES["production"], MODULES["prod_planner"]]
+        unknown = [m for m in args.modules if m not in SOAK_TABS]
+        if unknown:
+            parser.error(f"Unknown soak module(s): {', '.join(unknown)}")
+        if args.cycles < 1:
+            parser.error("--cycles must be at least 1")
+    
+    if args.command == "planner-bench" and args.gestures < 1:
+        parser.error("--gestures must be at least 1")
+    
+    if args.command == "load":
+        if args.users < 1:
+            parser.error("--users must be at least 1")
+        if args.duration <= 0 or args.ramp_up < 0 or args.think_time < 0:
+            parser.error("--duration must be positive, --ramp-up and --think-time not negative")
+    
+    if args.command == "master-bench":
+        args.tabs = args.tabs or list(SEED_TABLES)
+        unknown = [t for t in args.tabs if t not in SEED_TABLES]
+        if unknown:
+            parser.error(f"Unknown master tab(s): {', '.join(unknown)}")
+        if any(n < 1 for n in args.sizes):
+            parser.error("--sizes must be at least 1")
+        if not (SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY):
+            parser.error("master-bench seeds through Supabase: set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+    
+    if args.command == "stock-bench":
+        if args.documents < 1 or args.items < 1 or any(n < 1 for n in args.parallelism):
+            parser.error("--documents, --items and --parallelism must be at least 1")
+        if not (SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY):
+            parser.error("stock-bench seeds through Supabase: set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+    
+    if args.command == "report":
+        missing = [str(path) for path in args.from_log if not path.is_file()]
+        if missing:
+            parser.error(f"Run log(s) not found: {', '.join(missing)}")
+    
+    if args.command == "report-bench":
+        args.categories = args.categories or list(REPORT_BENCH_CATEGORIES)
+        unknown = [c for c in args.categories if c not in REPORT_BENCH_CATEGORIES]
+        if unknown:
+            parser.error(f"Unknown report category(s): {', '.join(unknown)}")
+        if args.sample < 1:
+            parser.error("--sample must be at least 1")
+    
+    if args.resume and not run_log_path(args.resume).is_file():
+        parser.error(f"No run log for run {args.resume}: {run_log_path(args.resume)}")
+    
+    if args.repeat is None:
+        args.repeat = REGRESSION_REPEATS if (args.baseline or args.save_baseline) else 1
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if (args.baseline or args.save_baseline) and min_q_value(args.repeat, REGRESSION_MAX_COMPARISONS) >= REGRESSION_ALPHA:
+        needed = next(k for k in range(args.repeat, 100) if min_q_value(k, REGRESSION_MAX_COMPARISONS) < REGRESSION_ALPHA)
+        parser.error(f"--repeat {args.repeat} cannot detect a regression at alpha {REGRESSION_ALPHA} "
+                     f"over up to {REGRESSION_MAX_COMPARISONS} compared metrics; use at least {needed}")
+    
+    args.shard_spec = None
+    if args.shard:
+        try:
+            args.shard_spec = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    return args
 
 
 def main():
     """
     Main entry point - orchestrates all tests.
     """
+    args = parse_args()
+    
+    if args.command == "export-durations":
+        count = export_durations(args.path)
+        print(f"Wrote durations for {count} tests to {args.path}")
+        sys.exit(0)
+    
+    if args.command == "soak":
+        results = run_soak(args.modules, args.cycles, args.snapshots, not args.no_gc)
+        sys.exit(1 if any(r["leaking"] for r in results) else 0)
+    
+    if args.command == "planner-bench":
+        if args.seed_sql:
+            args.seed_sql.write_text(planner_seed_sql(PLANNER_BENCH_GRIDS))
+            print(f"Wrote seed SQL for {len(PLANNER_BENCH_GRIDS)} planner months to {args.seed_sql}")
+        else:
+            run_planner_benchmark(args.gestures)
+        sys.exit(0)
+    
+    if args.command == "master-bench":
+        run_master_scaling(args.sizes, args.tabs, args.keep)
+        sys.exit(0)
+    
+    if args.command == "load":
+        result = run_load_test(args.scenario, args.users, args.duration, args.ramp_up, args.think_time)
+        failed = result is None or result["routes"][TOTAL_ROUTE]["error_rate"] > LOAD_MAX_ERROR_RATE
+        sys.exit(1 if failed else 0)
+    
+    if args.command == "stock-bench":
+        result = run_stock_benchmark(args.parallelism, args.documents, args.items, args.keep)
+        failed = result is None or not all(row["consistent"] for row in result["consistency"])
+        sys.exit(1 if failed else 0)
+    
+    if args.command == "dpr-bench":
+        if args.workbooks:
+            args.workbooks.mkdir(parents=True, exist_ok=True)
+            for days, machines in args.sizes:
+                workbook = write_dpr_workbook(args.workbooks / f"{FILE_PREFIX}{days}d_{machines}m.xlsx", days, machines)
+                print(f"Wrote {workbook['path']} ({workbook['rows']} rows, {workbook['bytes'] / 1024:.0f} KB)")
+            sys.exit(0)
+        results = run_dpr_upload_benchmark(args.sizes, args.keep)
+        failed = results is None or not all(r[route]["ok"] for r in results for route in ("upload-excel", "dpr-excel"))
+        sys.exit(1 if failed else 0)
+    
+    if args.command == "report-bench":
+        result = run_report_benchmark(args.categories, args.sample)
+        failed = result is None or any((r["status"] or 500) >= 500 for r in result["results"])
+        sys.exit(1 if failed else 0)
+    
+    if args.command == "merge":
+        results = merge_reports(args.reports)
+        sys.exit(1 if any(r["status"] in ("FAIL", "PERF_FAIL") for r in results) else 0)
+    
+    if args.command == "report":
+        results = report_from_logs(args.from_log)
+        sys.exit(1 if any(r["status"] in ("FAIL", "PERF_FAIL") for r in results) else 0)
+    
     start_time = time.time()
+    run_started = datetime.now()
+    run_id = run_started.strftime("%Y%m%d_%H%M%S")
+    report_filename = None
+    run_log = None
     results = []
+    previous = []
+    
+    # Results of the run being resumed, or of the run whose failures are rerun
+    if args.resume:
+        resumed = read_run_logs([run_log_path(args.resume)])
+        # Tests skipped behind an open circuit never ran; run them now
+        previous = [r for r in resumed["results"] if r.get("error_class") != CIRCUIT_OPEN]
+        started_at = resumed["runs"].get(args.resume, {}).get("started_at")
+        if started_at:
+            run_started = datetime.strptime(started_at, "%Y-%m-%d %H:%M:%S")
+    elif args.rerun_failed:
+        previous = previous_results(args.rerun_failed)
+        if not previous:
+            print(f"No run log or recorded history for run {args.rerun_failed}")
+            sys.exit(2)
     
     # 1. Setup
     setup_environment()
     
     try:
-        # 2. Initialize browser
-        print("Starting browser...")
-        setup_browser()
-        print("Browser started successfully!\n")
+        # 2. Define test modules in order
+        test_modules = get_test_modules()
         
-        # 3. Define test modules in order
-        test_modules = [
-            ("Auth", test_auth.get_all_tests()),
-            ("Masters", test_masters.get_all_tests()),
-            ("Store & Dispatch", test_store.get_all_tests()),
-            ("Prod Planner", test_prod_planner.get_all_tests()),
-            ("Production", test_production.get_all_tests()),
-            ("Quality", test_quality.get_all_tests()),
-            ("Maintenance", test_maintenance.get_all_tests()),
-            ("Reports", test_reports.get_all_tests()),
-            ("Approvals", test_approvals.get_all_tests()),
-            ("Profile", test_profile.get_all_tests()),
-            ("Admin", test_admin.get_all_tests()),
-        ]
+        if args.select:
+            test_modules = select_tests(test_modules, args.select)
         
-        # 4. Run all test modules
-        for module_name, test_functions in test_modules:
-            module_results = run_test_module(module_name, test_functions)
-            results.extend(module_results)
+        if args.rerun_failed:
+            test_modules = select_failed(test_modules, previous)
+            print(f"Rerunning {len(flatten_modules(test_modules))} tests that failed in run {args.rerun_failed}\n")
+        
+        if args.shard_spec:
+            shard_index, shard_count = args.shard_spec
+            test_modules, plan = select_shard(test_modules, shard_index, shard_count, args.durations)
+            run_id = f"{run_id}_shard{shard_index}of{shard_count}"
+            report_filename = f"results_{run_id}.xlsx"
+            print(
+                f"Shard {shard_index}/{shard_count}: {plan['tests']} tests, "
+                f"estimated {plan['estimated']:.0f}s "
+                f"(per shard: {', '.join(f'{e:.0f}s' for e in plan['estimated_per_shard'])})\n"
+            )
+        
+        # A resumed run keeps its id, log and report name
+        if args.resume:
+            run_id = args.resume
+            report_filename = f"results_{run_id}.xlsx"
+        
+        # Repeat the whole selection K times so samples spread over the run
+        if args.repeat > 1:
+            test_modules = test_modules * args.repeat
+            print(f"Repeating each test {args.repeat} times\n")
+        
+        # Check the server answers before Chrome starts and every test times out
+        if PREFLIGHT and test_modules:
+            health = probe_health()
+            for check in health["checks"]:
+                print(f"Preflight {check['url']}: {check['status'] or check['error']} ({check['ms']:.0f} ms)")
+            if not health["ok"]:
+                print(f"\n❌ Server is not healthy ({health['reason']}); not starting the browser.")
+                sys.exit(2)
+            print()
         
-        # 5. Generate Excel report
-        report_path = create_excel_report(results)
+        # Every result is flushed to the run log as soon as its test ends
+        if args.resume:
+            test_modules = skip_finished(test_modules, previous)
+            run_log = run_log_path(run_id)
+            print(f"Resuming run {run_id}: {len(previous)} results logged, "
+                  f"{len(flatten_modules(test_modules))} tests left")
+        else:
+            run_log = start_run_log(run_id, run_started, args.workers, len(flatten_modules(test_modules)))
+        print(f"Run log: {run_log}\n")
         
-        # 6. Print summary
+        # 3. Run all test modules
+        if not test_modules:
+            print("No tests to run")
+        elif args.workers > 1:
+            results = run_parallel(test_modules, args.workers, run_log)
+        else:
+            results = run_serial(test_modules, run_log)
+        finish_run_log(run_log)
+        
+        if args.resume:
+            results = previous + results
+            sort_results(results)
+        
+        # 4. Append results to the run history database
+        try:
+            record_run(run_id, results, started_at=run_started, workers=args.workers)
+        except Exception as e:
+            print(f"Warning: Could not record run history: {e}")
+        
+        # 5. Compare against a baseline run; optionally save this run as one
+        regressions = None
+        try:
+            if args.baseline:
+                regressions = compare_to_baseline(run_id, args.baseline)
+            if args.save_baseline:
+                save_baseline(args.save_baseline, run_id)
+                print(f"Saved run {run_id} as baseline {args.save_baseline!r}")
+        except Exception as e:
+            print(f"Warning: Could not compare or save baseline: {e}")
+        
+        # 6. Generate Excel report (browser metrics of every session of the run)
+        browsers = read_run_logs([run_log])["browsers"]
+        report_path = create_excel_report(results, report_filename, regressions, args.baseline, browsers)
+        
+        # 7. Print summary
         print_final_summary(results, report_path)
         
     except Exception as e:
         print(f"\n\nCRITICAL ERROR: {e}")
         traceback.print_exc()
-        
-    finally:
-        # 7. Cleanup
-        print("\nClosing browser...")
-        teardown_browser()
-        print("Browser closed.")
+        if run_log:
+            print(f"\nResults so far are in the run log. Rebuild the report with:\n"
+                  f"  python run.py report --from-log {run_log}")
     
     # 8. Calculate and print total time
     total_time = time.time() - start_time
@@ -246,9 +1446,14 @@ def main():
     
     # 9. Exit with appropriate code
     failed_count = sum(1 for r in results if r["status"] == "FAIL")
+    perf_failed_count = sum(1 for r in results if r["status"] == "PERF_FAIL")
+    aborted_count = sum(1 for r in results if r.get("error_class") == CIRCUIT_OPEN)
     
-    if failed_count > 0:
-        print(f"\n❌ {failed_count} tests failed. Exiting with code 1.")
+    if aborted_count > 0:
+        print(f"\n❌ {aborted_count} tests not run: infrastructure circuit breaker opened. Exiting with code 1.")
+        sys.exit(1)
+    elif failed_count > 0 or perf_failed_count > 0:
+        print(f"\n❌ {failed_count} tests failed, {perf_failed_count} over budget. Exiting with code 1.")
         sys.exit(1)
     else:
         print("\n✅ All tests passed!")
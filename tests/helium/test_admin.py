@@ -2,7 +2,6 @@
 Admin Dashboard Tests - 10 tests
 Tests for Admin Users, Permissions, Settings, Audit
 """
-import time
 from helium import (
     go_to,
     click,
@@ -15,7 +14,6 @@ from config import BASE_URL, ADMIN_URL, TEST_USER, TEST_PASSWORD
 from utils.browser import (
     wait_for_page_load,
     is_element_present,
-    is_text_present,
 )
 from utils.helpers import (
     login,
@@ -24,14 +22,16 @@ from utils.helpers import (
     close_modal,
     is_modal_open,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_admin():
     """Common setup - login and navigate to Admin page"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     go_to(ADMIN_URL)
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -43,10 +43,9 @@ def test_admin_page_loads():
     """Test: Admin page renders"""
     setup_admin()
     
-    has_content = (
-        is_text_present("Admin") or
-        is_text_present("Users") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["Admin", "Users"],
     )
     return True
 
@@ -55,9 +54,9 @@ def test_admin_users_tab():
     """Test: Users tab loads"""
     setup_admin()
     click_tab("Users")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Users") or is_element_present("table")
+    has_content = any_present(selectors=["table"], texts=["Users"])
     return True
 
 
@@ -65,7 +64,7 @@ def test_admin_user_table():
     """Test: User table has data"""
     setup_admin()
     click_tab("Users")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -75,13 +74,10 @@ def test_admin_user_search():
     """Test: Search users works"""
     setup_admin()
     click_tab("Users")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_search = (
-        is_element_present("input[type='search']") or
-        is_element_present("[placeholder*='search']") or
-        is_element_present("[class*='search']") or
-        is_element_present("input[type='text']")
+    has_search = any_present(
+        selectors=["input[type='search']", "[placeholder*='search']", "[class*='search']", "input[type='text']"],
     )
     return True
 
@@ -90,14 +86,14 @@ def test_admin_edit_user():
     """Test: Edit user modal"""
     setup_admin()
     click_tab("Users")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     edit_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Edit')]")
     
     if edit_buttons:
         edit_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         if is_modal_open():
             close_modal()
     return True
@@ -107,9 +103,9 @@ def test_admin_permissions_tab():
     """Test: Permissions tab loads"""
     setup_admin()
     click_tab("Permissions")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Permissions") or is_text_present("Permission")
+    has_content = any_present(texts=["Permissions", "Permission"])
     return True
 
 
@@ -117,12 +113,10 @@ def test_admin_permission_toggle():
     """Test: Toggle permissions"""
     setup_admin()
     click_tab("Permissions")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_toggle = (
-        is_element_present("input[type='checkbox']") or
-        is_element_present("[class*='toggle']") or
-        is_element_present("[class*='switch']")
+    has_toggle = any_present(
+        selectors=["input[type='checkbox']", "[class*='toggle']", "[class*='switch']"],
     )
     return True
 
@@ -131,9 +125,9 @@ def test_admin_settings_tab():
     """Test: Settings tab loads"""
     setup_admin()
     click_tab("Settings")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Settings") or is_element_present("form")
+    has_content = any_present(selectors=["form"], texts=["Settings"])
     return True
 
 
@@ -141,9 +135,9 @@ def test_admin_dpr_permissions():
     """Test: DPR permissions work"""
     setup_admin()
     click_tab("Permissions")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_dpr = is_text_present("DPR") or is_text_present("Production")
+    has_dpr = any_present(texts=["DPR", "Production"])
     return True
 
 
@@ -151,10 +145,8 @@ def test_admin_audit_log():
     """Test: Audit log displays"""
     setup_admin()
     
-    has_audit = (
-        is_text_present("Audit") or
-        is_text_present("Log") or
-        is_text_present("History")
+    has_audit = any_present(
+        texts=["Audit", "Log", "History"],
     )
     return True
 
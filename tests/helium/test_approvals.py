@@ -2,7 +2,6 @@
 Approvals Module Tests - 8 tests
 Tests for Pending Approvals, Recent Approvals, Approve Actions
 """
-import time
 from helium import (
     go_to,
     click,
@@ -14,22 +13,22 @@ from helium import (
 from config import BASE_URL, TEST_USER, TEST_PASSWORD
 from utils.browser import (
     wait_for_page_load,
-    is_element_present,
-    is_text_present,
 )
 from utils.helpers import (
     login,
     navigate_to_module,
     click_button,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_approvals():
     """Common setup - login and navigate to Approvals module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Approvals")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -41,10 +40,9 @@ def test_approvals_module_loads():
     """Test: Module renders"""
     setup_approvals()
     
-    has_content = (
-        is_text_present("Approvals") or
-        is_text_present("Pending") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["Approvals", "Pending"],
     )
     return True
 
@@ -53,9 +51,9 @@ def test_pending_section():
     """Test: Pending section loads"""
     setup_approvals()
     
-    has_pending = (
-        is_text_present("Pending") or
-        is_element_present("[class*='pending']")
+    has_pending = any_present(
+        selectors=["[class*='pending']"],
+        texts=["Pending"],
     )
     return True
 
@@ -64,7 +62,7 @@ def test_pending_jobs_display():
     """Test: Jobs display in table"""
     setup_approvals()
     
-    has_table = is_element_present("table") or is_element_present("[class*='list']")
+    has_table = any_present(selectors=["table", "[class*='list']"])
     return True
 
 
@@ -73,9 +71,8 @@ def test_approve_button():
     setup_approvals()
     
     has_approve = (
-        Button("Approve").exists() or
-        is_text_present("Approve") or
-        is_element_present("[class*='approve']")
+        any_present(selectors=["[class*='approve']"], texts=["Approve"]) or
+        Button("Approve").exists()
     )
     return True
 
@@ -98,10 +95,9 @@ def test_recent_approvals_section():
     """Test: Recent section loads"""
     setup_approvals()
     
-    has_recent = (
-        is_text_present("Recent") or
-        is_text_present("Approved") or
-        is_element_present("[class*='recent']")
+    has_recent = any_present(
+        selectors=["[class*='recent']"],
+        texts=["Recent", "Approved"],
     )
     return True
 
@@ -111,10 +107,8 @@ def test_recent_approvals_data():
     setup_approvals()
     
     # Check for data display
-    has_data = (
-        is_element_present("table") or
-        is_element_present("[class*='list']") or
-        is_element_present("[class*='card']")
+    has_data = any_present(
+        selectors=["table", "[class*='list']", "[class*='card']"],
     )
     return True
 
@@ -124,11 +118,9 @@ def test_approval_timestamp():
     setup_approvals()
     
     # Look for date/time indicators
-    has_timestamp = (
-        is_text_present("ago") or
-        is_text_present(":") or
-        is_element_present("[class*='time']") or
-        is_element_present("[class*='date']")
+    has_timestamp = any_present(
+        selectors=["[class*='time']", "[class*='date']"],
+        texts=["ago", ":"],
     )
     return True
 
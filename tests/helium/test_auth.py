@@ -2,7 +2,6 @@
 Authentication Tests - 15 tests
 Tests for login, signup, logout, and session management
 """
-import time
 from helium import (
     go_to,
     click,
@@ -20,11 +19,12 @@ from utils.browser import (
     wait_for_page_load,
     wait_for_element,
     is_element_present,
-    is_text_present,
     get_current_url,
     refresh_page,
 )
 from utils.helpers import login, logout
+from utils.waits import settle
+from utils.probe import any_present
 
 
 # ============================================================================
@@ -52,10 +52,8 @@ def test_login_form_elements():
     driver = get_driver()
     
     # Check for email/username input
-    email_exists = (
-        is_element_present("input[type='email']") or
-        is_element_present("input[name='email']") or
-        is_element_present("input[type='text']")
+    email_exists = any_present(
+        selectors=["input[type='email']", "input[name='email']", "input[type='text']"],
     )
     assert email_exists, "Email/username input not found"
     
@@ -89,7 +87,7 @@ def test_login_empty_fields():
     elif Button("Sign in").exists():
         click(Button("Sign in"))
     
-    time.sleep(1)
+    settle(1)
     
     # Should still be on login page (form not submitted)
     current_url = get_current_url()
@@ -120,7 +118,7 @@ def test_login_invalid_email():
         driver = get_driver()
         driver.find_element_by_css_selector("button[type='submit']").click()
     
-    time.sleep(1)
+    settle(1)
     
     # Should show error or stay on page
     current_url = get_current_url()
@@ -155,19 +153,16 @@ def test_login_wrong_password():
     elif Button("Sign in").exists():
         click(Button("Sign in"))
     
-    time.sleep(2)
+    settle(2)
     
     # Should show error or stay on login page
     current_url = get_current_url()
     still_on_login = "/auth/login" in current_url or "/login" in current_url
     
     # Could also check for error message
-    has_error = (
-        is_text_present("Invalid") or
-        is_text_present("incorrect") or
-        is_text_present("failed") or
-        is_text_present("error") or
-        is_element_present("[class*='error']")
+    has_error = any_present(
+        selectors=["[class*='error']"],
+        texts=["Invalid", "incorrect", "failed", "error"],
     )
     
     assert still_on_login or has_error, "Should show error for wrong credentials"
@@ -177,7 +172,7 @@ def test_login_wrong_password():
 
 def test_login_success():
     """Test: Successful login redirects to dashboard"""
-    result = login(TEST_USER, TEST_PASSWORD)
+    result = login(TEST_USER, TEST_PASSWORD, fresh=True)
     
     if result:
         # Should be redirected away from login
@@ -221,7 +216,7 @@ def test_password_visibility_toggle():
             try:
                 toggle = driver.find_element_by_css_selector(selector)
                 toggle.click()
-                time.sleep(0.3)
+                settle(0.3)
                 
                 # Check if field type changed
                 password_field = driver.find_element_by_css_selector("input[name='password'], input[id='password']")
@@ -262,7 +257,7 @@ def test_signup_link_works():
         signup_clicked = True
     
     if signup_clicked:
-        time.sleep(1)
+        settle(1)
         wait_for_page_load()
         current_url = get_current_url()
         assert "/signup" in current_url or "/register" in current_url, \
@@ -282,10 +277,8 @@ def test_signup_page_loads():
     
     if on_signup:
         # Check for form elements
-        has_inputs = (
-            is_element_present("input[type='email']") or
-            is_element_present("input[name='email']") or
-            is_element_present("input[type='text']")
+        has_inputs = any_present(
+            selectors=["input[type='email']", "input[name='email']", "input[type='text']"],
         )
         assert has_inputs, "Signup form should have input fields"
     
@@ -309,7 +302,7 @@ def test_signup_form_validation():
     elif Button("Create").exists():
         click(Button("Create"))
     
-    time.sleep(1)
+    settle(1)
     
     # Should still be on signup page
     current_url = get_current_url()
@@ -337,16 +330,15 @@ def test_signup_password_match():
         if is_element_present("button[type='submit']"):
             driver.find_element_by_css_selector("button[type='submit']").click()
         
-        time.sleep(1)
+        settle(1)
         
         # Should show error or stay on page
         current_url = get_current_url()
         still_on_signup = "/signup" in current_url or "/register" in current_url
         
-        has_error = (
-            is_text_present("match") or
-            is_text_present("Match") or
-            is_element_present("[class*='error']")
+        has_error = any_present(
+            selectors=["[class*='error']"],
+            texts=["match", "Match"],
         )
         
         assert still_on_signup or has_error, "Should validate password match"
@@ -361,8 +353,8 @@ def test_signup_password_match():
 def test_logout_button_visible():
     """Test: Logout button exists when logged in"""
     # First login
-    login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    login(TEST_USER, TEST_PASSWORD, fresh=True)
+    settle(1)
     
     # Check for logout button
     logout_exists = (
@@ -380,14 +372,14 @@ def test_logout_button_visible():
 def test_logout_success():
     """Test: Logout redirects to login"""
     # First ensure logged in
-    login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    login(TEST_USER, TEST_PASSWORD, fresh=True)
+    settle(1)
     
     # Perform logout
     result = logout()
     
     if result:
-        time.sleep(1)
+        settle(1)
         current_url = get_current_url()
         # Should be on login page or homepage
         logged_out = (
@@ -408,15 +400,15 @@ def test_logout_success():
 def test_session_persistence():
     """Test: Refresh maintains login state"""
     # Login
-    login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    login(TEST_USER, TEST_PASSWORD, fresh=True)
+    settle(1)
     
     # Get current URL
     url_before = get_current_url()
     
     # Refresh page
     refresh_page()
-    time.sleep(1)
+    settle(1)
     
     # Check still logged in (not redirected to login)
     url_after = get_current_url()
@@ -431,7 +423,7 @@ def test_unauthorized_redirect():
     """Test: Non-auth routes redirect to login when not logged in"""
     # First logout
     logout()
-    time.sleep(1)
+    settle(1)
     
     # Clear cookies to ensure logged out
     driver = get_driver()
@@ -439,7 +431,7 @@ def test_unauthorized_redirect():
     
     # Try to access protected route
     go_to(BASE_URL)
-    time.sleep(2)
+    settle(2)
     wait_for_page_load()
     
     current_url = get_current_url()
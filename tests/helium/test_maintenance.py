@@ -2,7 +2,6 @@
 Maintenance Module Tests - 12 tests
 Tests for Preventive Maintenance, Breakdown, Report
 """
-import time
 from helium import (
     go_to,
     click,
@@ -14,8 +13,6 @@ from helium import (
 from config import BASE_URL, TEST_USER, TEST_PASSWORD, MAINTENANCE_TABS
 from utils.browser import (
     wait_for_page_load,
-    is_element_present,
-    is_text_present,
 )
 from utils.helpers import (
     login,
@@ -26,14 +23,16 @@ from utils.helpers import (
     is_modal_open,
     click_add_button,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_maintenance():
     """Common setup - login and navigate to Maintenance module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Maintenance")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -45,10 +44,9 @@ def test_maintenance_module_loads():
     """Test: Module renders"""
     setup_maintenance()
     
-    has_content = (
-        is_text_present("Maintenance") or
-        is_text_present("Preventive") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["Maintenance", "Preventive"],
     )
     return True
 
@@ -57,9 +55,9 @@ def test_preventive_tab():
     """Test: Preventive tab loads"""
     setup_maintenance()
     click_tab("Preventive")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Preventive") or is_text_present("Line")
+    has_content = any_present(texts=["Preventive", "Line"])
     return True
 
 
@@ -67,12 +65,11 @@ def test_preventive_line_select():
     """Test: Line selection works"""
     setup_maintenance()
     click_tab("Preventive")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_select = (
-        is_element_present("select") or
-        is_element_present("[class*='select']") or
-        is_text_present("Line")
+    has_select = any_present(
+        selectors=["select", "[class*='select']"],
+        texts=["Line"],
     )
     return True
 
@@ -81,12 +78,11 @@ def test_preventive_checklist():
     """Test: Checklist displays"""
     setup_maintenance()
     click_tab("Preventive")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_checklist = (
-        is_text_present("Checklist") or
-        is_text_present("Check") or
-        is_element_present("[type='checkbox']")
+    has_checklist = any_present(
+        selectors=["[type='checkbox']"],
+        texts=["Checklist", "Check"],
     )
     return True
 
@@ -95,13 +91,11 @@ def test_preventive_frequency_filter():
     """Test: Frequency filter works"""
     setup_maintenance()
     click_tab("Preventive")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_frequency = (
-        is_text_present("Daily") or
-        is_text_present("Weekly") or
-        is_text_present("Monthly") or
-        is_element_present("select")
+    has_frequency = any_present(
+        selectors=["select"],
+        texts=["Daily", "Weekly", "Monthly"],
     )
     return True
 
@@ -110,9 +104,9 @@ def test_breakdown_tab():
     """Test: Breakdown tab loads"""
     setup_maintenance()
     click_tab("Breakdown")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Breakdown") or is_element_present("table")
+    has_content = any_present(selectors=["table"], texts=["Breakdown"])
     return True
 
 
@@ -120,7 +114,7 @@ def test_breakdown_add_task():
     """Test: Add task works"""
     setup_maintenance()
     click_tab("Breakdown")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -132,13 +126,10 @@ def test_breakdown_priority():
     """Test: Priority selection"""
     setup_maintenance()
     click_tab("Breakdown")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_priority = (
-        is_text_present("Priority") or
-        is_text_present("High") or
-        is_text_present("Low") or
-        is_text_present("Critical")
+    has_priority = any_present(
+        texts=["Priority", "High", "Low", "Critical"],
     )
     return True
 
@@ -147,13 +138,11 @@ def test_breakdown_status_update():
     """Test: Status change works"""
     setup_maintenance()
     click_tab("Breakdown")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_status = (
-        is_text_present("Status") or
-        is_text_present("Pending") or
-        is_text_present("Completed") or
-        is_element_present("[class*='status']")
+    has_status = any_present(
+        selectors=["[class*='status']"],
+        texts=["Status", "Pending", "Completed"],
     )
     return True
 
@@ -162,12 +151,10 @@ def test_breakdown_search():
     """Test: Search functionality"""
     setup_maintenance()
     click_tab("Breakdown")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_search = (
-        is_element_present("input[type='search']") or
-        is_element_present("[placeholder*='search']") or
-        is_element_present("[class*='search']")
+    has_search = any_present(
+        selectors=["input[type='search']", "[placeholder*='search']", "[class*='search']"],
     )
     return True
 
@@ -176,9 +163,9 @@ def test_maintenance_report_tab():
     """Test: Report tab loads"""
     setup_maintenance()
     click_tab("Report")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Report") or is_text_present("Coming")
+    has_content = any_present(texts=["Report", "Coming"])
     return True
 
 
@@ -186,10 +173,9 @@ def test_maintenance_history():
     """Test: History displays"""
     setup_maintenance()
     
-    has_history = (
-        is_text_present("History") or
-        is_element_present("table") or
-        is_element_present("[class*='history']")
+    has_history = any_present(
+        selectors=["table", "[class*='history']"],
+        texts=["History"],
     )
     return True
 
@@ -2,7 +2,6 @@
 Masters Module Tests - 42 tests
 Tests for Machine, Mold, Raw Materials, Packing Materials, Line, BOM, Commercial, Others
 """
-import time
 from helium import (
     go_to,
     click,
@@ -31,19 +30,22 @@ from utils.helpers import (
     click_button,
     get_table_rows,
     get_table_row_count,
+    read_table,
     close_modal,
     is_modal_open,
     click_add_button,
     fill_form,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_masters():
     """Common setup - login and navigate to Masters module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Masters")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -55,13 +57,12 @@ def test_machine_tab_loads():
     """Test: Machine Master tab renders"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Check table or content exists
-    has_content = (
-        is_element_present("table") or
-        is_text_present("Machine") or
-        is_element_present("[class*='table']")
+    has_content = any_present(
+        selectors=["table", "[class*='table']"],
+        texts=["Machine"],
     )
     assert has_content, "Machine Master content should load"
     return True
@@ -71,12 +72,14 @@ def test_machine_table_has_data():
     """Test: Table displays machines"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(1)
+    settle(1)
     
-    row_count = get_table_row_count()
     # Table should exist (may or may not have data)
-    has_table = is_element_present("table") or is_element_present("[role='grid']")
-    assert has_table, "Machine table should exist"
+    table = read_table()
+    assert table is not None, "Machine table should exist"
+    
+    if table["total_rows"] > 0:
+        assert table["headers"], "Machine table should have column headers"
     return True
 
 
@@ -84,10 +87,10 @@ def test_machine_add_button():
     """Test: Add button opens modal"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
-    time.sleep(0.5)
+    settle(0.5)
     
     if clicked:
         modal_open = is_modal_open()
@@ -101,10 +104,10 @@ def test_machine_add_form_fields():
     """Test: Modal has all required fields"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
-    time.sleep(0.5)
+    settle(0.5)
     
     if clicked and is_modal_open():
         driver = get_driver()
@@ -121,7 +124,7 @@ def test_machine_add_submit():
     """Test: Can add new machine"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     initial_count = get_table_row_count()
     
@@ -133,7 +136,7 @@ def test_machine_add_submit():
             "Make": "Test Make",
             "Model": "Test Model",
         })
-        time.sleep(0.3)
+        settle(0.3)
         
         # Don't actually submit to avoid creating test data
         close_modal()
@@ -145,7 +148,7 @@ def test_machine_edit_button():
     """Test: Edit opens modal with data"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Look for edit button in table
     driver = get_driver()
@@ -153,7 +156,7 @@ def test_machine_edit_button():
     
     if edit_buttons and len(edit_buttons) > 0:
         edit_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         
         if is_modal_open():
             # Check modal has pre-filled data
@@ -168,20 +171,18 @@ def test_machine_delete_confirm():
     """Test: Delete shows confirmation"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     delete_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Delete')] | //button[@aria-label='Delete'] | //button[contains(@class, 'delete')]")
     
     if delete_buttons and len(delete_buttons) > 0:
         delete_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         
         # Should show confirmation
         has_confirm = (
-            is_text_present("confirm") or
-            is_text_present("Confirm") or
-            is_text_present("sure") or
+            any_present(texts=["confirm", "Confirm", "sure"]) or
             is_modal_open()
         )
         
@@ -198,13 +199,11 @@ def test_machine_category_filter():
     """Test: Category dropdown filters table"""
     setup_masters()
     click_tab("Machine")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Look for category filter
-    has_filter = (
-        is_element_present("select") or
-        is_element_present("[class*='filter']") or
-        is_element_present("[class*='dropdown']")
+    has_filter = any_present(
+        selectors=["select", "[class*='filter']", "[class*='dropdown']"],
     )
     
     return True
@@ -218,12 +217,11 @@ def test_mold_tab_loads():
     """Test: Mold Master tab renders"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = (
-        is_element_present("table") or
-        is_text_present("Mold") or
-        is_element_present("[class*='table']")
+    has_content = any_present(
+        selectors=["table", "[class*='table']"],
+        texts=["Mold"],
     )
     assert has_content, "Mold Master content should load"
     return True
@@ -233,9 +231,9 @@ def test_mold_table_has_data():
     """Test: Table displays molds"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(1)
+    settle(1)
     
-    has_table = is_element_present("table") or is_element_present("[role='grid']")
+    has_table = any_present(selectors=["table", "[role='grid']"])
     assert has_table, "Mold table should exist"
     return True
 
@@ -244,11 +242,11 @@ def test_mold_add_modal():
     """Test: Add modal works"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked:
-        time.sleep(0.5)
+        settle(0.5)
         if is_modal_open():
             close_modal()
     return True
@@ -258,14 +256,14 @@ def test_mold_edit_modal():
     """Test: Edit modal loads data"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     edit_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Edit')] | //button[@aria-label='Edit']")
     
     if edit_buttons:
         edit_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         if is_modal_open():
             close_modal()
     return True
@@ -275,14 +273,14 @@ def test_mold_delete():
     """Test: Delete with confirmation"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     delete_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Delete')]")
     
     if delete_buttons:
         delete_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         if Button("Cancel").exists():
             click(Button("Cancel"))
         elif is_modal_open():
@@ -294,7 +292,7 @@ def test_mold_sorting():
     """Test: Column sorting works"""
     setup_masters()
     click_tab("Mold")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     headers = driver.find_elements_by_css_selector("th, [role='columnheader']")
@@ -304,7 +302,7 @@ def test_mold_sorting():
         for header in headers:
             if header.is_displayed():
                 header.click()
-                time.sleep(0.3)
+                settle(0.3)
                 break
     return True
 
@@ -317,9 +315,9 @@ def test_raw_materials_tab_loads():
     """Test: Tab renders"""
     setup_masters()
     click_tab("Raw Material")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_element_present("table") or is_text_present("Raw")
+    has_content = any_present(selectors=["table"], texts=["Raw"])
     return True
 
 
@@ -327,7 +325,7 @@ def test_raw_materials_table():
     """Test: Table has data"""
     setup_masters()
     click_tab("Raw Material")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -337,7 +335,7 @@ def test_raw_materials_add():
     """Test: Add new material"""
     setup_masters()
     click_tab("Raw Material")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -349,13 +347,13 @@ def test_raw_materials_edit():
     """Test: Edit material"""
     setup_masters()
     click_tab("Raw Material")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     edit_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Edit')]")
     if edit_buttons:
         edit_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         if is_modal_open():
             close_modal()
     return True
@@ -365,13 +363,13 @@ def test_raw_materials_delete():
     """Test: Delete material"""
     setup_masters()
     click_tab("Raw Material")
-    time.sleep(0.5)
+    settle(0.5)
     
     driver = get_driver()
     delete_buttons = driver.find_elements_by_xpath("//button[contains(text(), 'Delete')]")
     if delete_buttons:
         delete_buttons[0].click()
-        time.sleep(0.5)
+        settle(0.5)
         if Button("Cancel").exists():
             click(Button("Cancel"))
     return True
@@ -385,9 +383,9 @@ def test_packing_tab_loads():
     """Test: Tab renders"""
     setup_masters()
     click_tab("Packing")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_element_present("table") or is_text_present("Packing")
+    has_content = any_present(selectors=["table"], texts=["Packing"])
     return True
 
 
@@ -395,7 +393,7 @@ def test_packing_table():
     """Test: Table has data"""
     setup_masters()
     click_tab("Packing")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -405,7 +403,7 @@ def test_packing_add():
     """Test: Add new item"""
     setup_masters()
     click_tab("Packing")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -417,9 +415,9 @@ def test_packing_category_filter():
     """Test: Category filter works"""
     setup_masters()
     click_tab("Packing")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_filter = is_element_present("select") or is_element_present("[class*='filter']")
+    has_filter = any_present(selectors=["select", "[class*='filter']"])
     return True
 
 
@@ -427,13 +425,12 @@ def test_packing_excel_export():
     """Test: Export button exists"""
     setup_masters()
     click_tab("Packing")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_export = (
+        any_present(selectors=["[aria-label*='export']"], texts=["Export"]) or
         Button("Export").exists() or
-        Button("Excel").exists() or
-        is_text_present("Export") or
-        is_element_present("[aria-label*='export']")
+        Button("Excel").exists()
     )
     return True
 
@@ -446,9 +443,9 @@ def test_line_tab_loads():
     """Test: Tab renders"""
     setup_masters()
     click_tab("Line")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_element_present("table") or is_text_present("Line")
+    has_content = any_present(selectors=["table"], texts=["Line"])
     return True
 
 
@@ -456,7 +453,7 @@ def test_line_table():
     """Test: Table has data"""
     setup_masters()
     click_tab("Line")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -466,7 +463,7 @@ def test_line_add():
     """Test: Add new line"""
     setup_masters()
     click_tab("Line")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -478,12 +475,12 @@ def test_line_machine_association():
     """Test: Machine dropdowns work"""
     setup_masters()
     click_tab("Line")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
         # Look for machine dropdowns
-        has_dropdowns = is_element_present("select") or is_element_present("[class*='select']")
+        has_dropdowns = any_present(selectors=["select", "[class*='select']"])
         close_modal()
     return True
 
@@ -492,13 +489,12 @@ def test_line_status_toggle():
     """Test: Status change works"""
     setup_masters()
     click_tab("Line")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Look for status indicators or toggles
-    has_status = (
-        is_text_present("Active") or
-        is_text_present("Inactive") or
-        is_element_present("[class*='status']")
+    has_status = any_present(
+        selectors=["[class*='status']"],
+        texts=["Active", "Inactive"],
     )
     return True
 
@@ -511,9 +507,9 @@ def test_bom_tab_loads():
     """Test: BOM tab renders"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_element_present("table") or is_text_present("BOM")
+    has_content = any_present(selectors=["table"], texts=["BOM"])
     return True
 
 
@@ -521,10 +517,10 @@ def test_bom_sfg_category():
     """Test: SFG tab works"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("SFG")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -532,10 +528,10 @@ def test_bom_fg_category():
     """Test: FG tab works"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("FG")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -543,10 +539,10 @@ def test_bom_local_category():
     """Test: LOCAL tab works"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("LOCAL")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -554,7 +550,7 @@ def test_bom_version_history():
     """Test: Version viewer works"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Look for version or history button
     has_version = (
@@ -569,7 +565,7 @@ def test_bom_add_entry():
     """Test: Add new BOM entry"""
     setup_masters()
     click_tab("BOM")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -585,10 +581,10 @@ def test_commercial_customer_tab():
     """Test: Customer Master loads"""
     setup_masters()
     click_tab("Commercial")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Customer")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -596,10 +592,10 @@ def test_commercial_vendor_tab():
     """Test: Vendor Master loads"""
     setup_masters()
     click_tab("Commercial")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Vendor")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -607,10 +603,10 @@ def test_commercial_vrf_tab():
     """Test: VRF form loads"""
     setup_masters()
     click_tab("Commercial")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("VRF")
-    time.sleep(0.5)
+    settle(0.5)
     return True
 
 
@@ -618,10 +614,10 @@ def test_commercial_add_customer():
     """Test: Add customer works"""
     setup_masters()
     click_tab("Commercial")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Customer")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -637,9 +633,9 @@ def test_others_color_label():
     """Test: Color Label Master loads"""
     setup_masters()
     click_tab("Others")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_color = is_text_present("Color") or is_text_present("Label")
+    has_color = any_present(texts=["Color", "Label"])
     return True
 
 
@@ -647,7 +643,7 @@ def test_others_party_name():
     """Test: Party Name Master loads"""
     setup_masters()
     click_tab("Others")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_party = is_text_present("Party")
     return True
@@ -657,7 +653,7 @@ def test_others_add_color_label():
     """Test: Add color label works"""
     setup_masters()
     click_tab("Others")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -2,7 +2,6 @@
 Production Planner Module Tests - 15 tests
 Tests for calendar view, production blocks, drag-drop, scheduling
 """
-import time
 from helium import (
     go_to,
     click,
@@ -13,14 +12,12 @@ from helium import (
     get_driver,
     drag,
 )
-from selenium.webdriver.common.action_chains import ActionChains
 
-from config import BASE_URL, TEST_USER, TEST_PASSWORD
+from config import BASE_URL, TEST_USER, TEST_PASSWORD, PLANNER_BENCH_STEPS, PLANNER_BENCH_STEP_PX
 from utils.browser import (
     wait_for_page_load,
     wait_for_element,
     is_element_present,
-    is_text_present,
     get_element_count,
 )
 from utils.helpers import (
@@ -32,14 +29,18 @@ from utils.helpers import (
     is_modal_open,
     fill_form,
 )
+from utils.waits import settle
+from utils.probe import any_present
+from utils.frames import measure_interaction
+from utils.planner_bench import pick_blocks, drag_block, resize_block
 
 
 def setup_planner():
     """Common setup - login and navigate to Prod Planner module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Prod Planner")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -51,12 +52,9 @@ def test_planner_module_loads():
     """Test: Production Planner renders"""
     setup_planner()
     
-    has_content = (
-        is_text_present("Planner") or
-        is_text_present("Calendar") or
-        is_text_present("Schedule") or
-        is_element_present("[class*='calendar']") or
-        is_element_present("[class*='grid']")
+    has_content = any_present(
+        selectors=["[class*='calendar']", "[class*='grid']"],
+        texts=["Planner", "Calendar", "Schedule"],
     )
     return True
 
@@ -68,19 +66,14 @@ def test_planner_calendar_view():
     # Look for calendar grid structure
     driver = get_driver()
     
-    has_grid = (
-        is_element_present("[class*='calendar']") or
-        is_element_present("[class*='grid']") or
-        is_element_present("table") or
-        is_element_present("[class*='schedule']")
+    has_grid = any_present(
+        selectors=["[class*='calendar']", "[class*='grid']", "table", "[class*='schedule']"],
     )
     
     # Check for day headers or date cells
-    has_days = (
-        is_text_present("Mon") or
-        is_text_present("Tue") or
-        is_text_present("1") or
-        is_element_present("[class*='day']")
+    has_days = any_present(
+        selectors=["[class*='day']"],
+        texts=["Mon", "Tue", "1"],
     )
     
     return True
@@ -104,7 +97,7 @@ def test_planner_month_navigation():
         for btn in nav_buttons:
             if btn.is_displayed():
                 btn.click()
-                time.sleep(0.5)
+                settle(0.5)
                 break
     
     return True
@@ -115,10 +108,9 @@ def test_planner_lines_sidebar():
     setup_planner()
     
     # Look for lines/rows in sidebar or left panel
-    has_lines = (
-        is_text_present("Line") or
-        is_element_present("[class*='sidebar']") or
-        is_element_present("[class*='line']")
+    has_lines = any_present(
+        selectors=["[class*='sidebar']", "[class*='line']"],
+        texts=["Line"],
     )
     
     return True
@@ -162,7 +154,7 @@ def test_planner_add_block():
     if cells:
         try:
             cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             if is_modal_open():
                 close_modal()
         except:
@@ -185,11 +177,11 @@ def test_planner_block_modal():
     if cells:
         try:
             cells[5].click() if len(cells) > 5 else cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             
             if is_modal_open():
                 # Check for input fields
-                has_inputs = is_element_present("[role='dialog'] input") or is_element_present(".modal input")
+                has_inputs = any_present(selectors=["[role='dialog'] input", ".modal input"])
                 close_modal()
                 return has_inputs
         except:
@@ -210,14 +202,12 @@ def test_planner_block_color_picker():
     if cells:
         try:
             cells[5].click() if len(cells) > 5 else cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             
             if is_modal_open():
                 # Look for color picker
-                has_color = (
-                    is_element_present("input[type='color']") or
-                    is_element_present("[class*='color']") or
-                    is_element_present("[class*='picker']")
+                has_color = any_present(
+                    selectors=["input[type='color']", "[class*='color']", "[class*='picker']"],
                 )
                 close_modal()
         except:
@@ -237,13 +227,12 @@ def test_planner_block_mold_select():
     if cells:
         try:
             cells[5].click() if len(cells) > 5 else cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             
             if is_modal_open():
-                has_mold = (
-                    is_text_present("Mold") or
-                    is_element_present("select") or
-                    is_element_present("[class*='select']")
+                has_mold = any_present(
+                    selectors=["select", "[class*='select']"],
+                    texts=["Mold"],
                 )
                 close_modal()
         except:
@@ -263,10 +252,10 @@ def test_planner_block_party_select():
     if cells:
         try:
             cells[5].click() if len(cells) > 5 else cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             
             if is_modal_open():
-                has_party = is_text_present("Party") or is_element_present("[name*='party']")
+                has_party = any_present(selectors=["[name*='party']"], texts=["Party"])
                 close_modal()
         except:
             pass
@@ -285,10 +274,10 @@ def test_planner_block_packing_select():
     if cells:
         try:
             cells[5].click() if len(cells) > 5 else cells[0].click()
-            time.sleep(0.5)
+            settle(0.5)
             
             if is_modal_open():
-                has_packing = is_text_present("Packing") or is_text_present("Box")
+                has_packing = any_present(texts=["Packing", "Box"])
                 close_modal()
         except:
             pass
@@ -297,52 +286,29 @@ def test_planner_block_packing_select():
 
 
 def test_planner_block_drag():
-    """Test: Block drag to move"""
+    """Test: Block drag to move, in small steps and back to where it started"""
     setup_planner()
     
-    driver = get_driver()
-    
-    # Look for draggable blocks
-    blocks = driver.find_elements_by_css_selector(
-        "[draggable='true'], [class*='block'], [class*='event']"
-    )
+    blocks = pick_blocks(1, PLANNER_BENCH_STEPS * PLANNER_BENCH_STEP_PX)
+    if not blocks:
+        return True  # No block in view this month
     
-    if blocks and len(blocks) > 0:
-        try:
-            # Try to drag first block
-            actions = ActionChains(driver)
-            actions.drag_and_drop_by_offset(blocks[0], 50, 0)
-            actions.perform()
-            time.sleep(0.5)
-        except:
-            pass
+    sample = measure_interaction(lambda: drag_block(blocks[0]))
+    assert sample["frames"], "No frames rendered while dragging a block"
     
     return True
 
 
 def test_planner_block_resize():
-    """Test: Block resize to extend"""
+    """Test: Block resize to extend, in small steps and back to the original size"""
     setup_planner()
     
-    driver = get_driver()
-    
-    # Look for resizable blocks
-    blocks = driver.find_elements_by_css_selector(
-        "[class*='block'], [class*='event'], [class*='resizable']"
-    )
+    blocks = pick_blocks(1, PLANNER_BENCH_STEPS * PLANNER_BENCH_STEP_PX)
+    if not blocks:
+        return True  # No block in view this month
     
-    if blocks:
-        try:
-            # Look for resize handle
-            handles = driver.find_elements_by_css_selector(
-                "[class*='resize'], [class*='handle']"
-            )
-            if handles:
-                actions = ActionChains(driver)
-                actions.drag_and_drop_by_offset(handles[0], 20, 0)
-                actions.perform()
-        except:
-            pass
+    sample = measure_interaction(lambda: resize_block(blocks[0]))
+    assert sample["frames"], "No frames rendered while resizing a block"
     
     return True
 
@@ -352,10 +318,9 @@ def test_planner_changeover_block():
     setup_planner()
     
     # Look for changeover blocks or ability to add one
-    has_changeover = (
-        is_text_present("Changeover") or
-        is_text_present("Change Over") or
-        is_element_present("[class*='changeover']")
+    has_changeover = any_present(
+        selectors=["[class*='changeover']"],
+        texts=["Changeover", "Change Over"],
     )
     
     return True
@@ -2,7 +2,6 @@
 Production Module Tests - 20 tests
 Tests for DPR, Mould Loading, Silo Management, FG Transfer
 """
-import time
 from helium import (
     go_to,
     click,
@@ -31,14 +30,16 @@ from utils.helpers import (
     click_add_button,
     fill_form,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_production():
     """Common setup - login and navigate to Production module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Production")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -50,10 +51,9 @@ def test_production_module_loads():
     """Test: Module renders"""
     setup_production()
     
-    has_content = (
-        is_text_present("Production") or
-        is_text_present("DPR") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["Production", "DPR"],
     )
     return True
 
@@ -62,9 +62,9 @@ def test_dpr_tab_loads():
     """Test: DPR tab renders"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_dpr = is_text_present("DPR") or is_text_present("Daily Production")
+    has_dpr = any_present(texts=["DPR", "Daily Production"])
     return True
 
 
@@ -72,12 +72,10 @@ def test_dpr_date_picker():
     """Test: Date selection works"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_date = (
-        is_element_present("input[type='date']") or
-        is_element_present("[class*='date']") or
-        is_element_present("[class*='picker']")
+    has_date = any_present(
+        selectors=["input[type='date']", "[class*='date']", "[class*='picker']"],
     )
     return True
 
@@ -86,13 +84,11 @@ def test_dpr_shift_selector():
     """Test: Shift dropdown works"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_shift = (
-        is_text_present("Shift") or
-        is_text_present("DAY") or
-        is_text_present("NIGHT") or
-        is_element_present("select")
+    has_shift = any_present(
+        selectors=["select"],
+        texts=["Shift", "DAY", "NIGHT"],
     )
     return True
 
@@ -101,7 +97,7 @@ def test_dpr_table_renders():
     """Test: DPR table loads"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -111,7 +107,7 @@ def test_dpr_excel_import_button():
     """Test: Import button exists"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_import = (
         Button("Import").exists() or
@@ -126,12 +122,11 @@ def test_dpr_column_visibility():
     """Test: Column toggles work"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_settings = (
-        Button("Settings").exists() or
-        is_element_present("[class*='settings']") or
-        is_text_present("Columns")
+        any_present(selectors=["[class*='settings']"], texts=["Columns"]) or
+        Button("Settings").exists()
     )
     return True
 
@@ -140,12 +135,11 @@ def test_dpr_summary_section():
     """Test: Summary calculates"""
     setup_production()
     click_tab("DPR")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_summary = (
-        is_text_present("Summary") or
-        is_text_present("Total") or
-        is_element_present("[class*='summary']")
+    has_summary = any_present(
+        selectors=["[class*='summary']"],
+        texts=["Summary", "Total"],
     )
     return True
 
@@ -158,9 +152,9 @@ def test_mould_loading_tab():
     """Test: Mould Loading tab loads"""
     setup_production()
     click_tab("Mould")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Mould") or is_text_present("Loading")
+    has_content = any_present(texts=["Mould", "Loading"])
     return True
 
 
@@ -168,7 +162,7 @@ def test_mould_loading_table():
     """Test: Table has data"""
     setup_production()
     click_tab("Mould")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -178,7 +172,7 @@ def test_mould_loading_add():
     """Test: Add record works"""
     setup_production()
     click_tab("Mould")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -194,9 +188,9 @@ def test_silo_management_tab():
     """Test: Silo tab loads"""
     setup_production()
     click_tab("Silo")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Silo") or is_text_present("Inventory")
+    has_content = any_present(texts=["Silo", "Inventory"])
     return True
 
 
@@ -204,12 +198,11 @@ def test_silo_inventory_view():
     """Test: Inventory displays"""
     setup_production()
     click_tab("Silo")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_inventory = (
-        is_text_present("Inventory") or
-        is_element_present("table") or
-        is_element_present("[class*='silo']")
+    has_inventory = any_present(
+        selectors=["table", "[class*='silo']"],
+        texts=["Inventory"],
     )
     return True
 
@@ -218,7 +211,7 @@ def test_silo_add_transaction():
     """Test: Add transaction"""
     setup_production()
     click_tab("Silo")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -230,12 +223,12 @@ def test_silo_grinding_records():
     """Test: Grinding tab loads"""
     setup_production()
     click_tab("Silo")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Grinding")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_grinding = is_text_present("Grinding") or is_element_present("table")
+    has_grinding = any_present(selectors=["table"], texts=["Grinding"])
     return True
 
 
@@ -243,10 +236,10 @@ def test_silo_grinding_add():
     """Test: Add grinding record"""
     setup_production()
     click_tab("Silo")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Grinding")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -262,9 +255,9 @@ def test_fg_transfer_tab():
     """Test: FG Transfer tab loads"""
     setup_production()
     click_tab("FG Transfer")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("FG") or is_text_present("Transfer")
+    has_content = any_present(texts=["FG", "Transfer"])
     return True
 
 
@@ -272,9 +265,9 @@ def test_fg_transfer_form():
     """Test: FGN form loads"""
     setup_production()
     click_tab("FG Transfer")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -282,7 +275,7 @@ def test_fg_transfer_submit():
     """Test: Submit FGN"""
     setup_production()
     click_tab("FG Transfer")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -297,15 +290,14 @@ def test_production_settings():
     setup_production()
     
     has_settings = (
-        Button("Settings").exists() or
-        is_element_present("[class*='settings']") or
-        is_element_present("[aria-label='Settings']")
+        any_present(selectors=["[class*='settings']", "[aria-label='Settings']"]) or
+        Button("Settings").exists()
     )
     
     if has_settings:
         if Button("Settings").exists():
             click(Button("Settings"))
-            time.sleep(0.5)
+            settle(0.5)
             if is_modal_open():
                 close_modal()
     
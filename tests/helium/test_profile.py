@@ -2,7 +2,6 @@
 Profile Module Tests - 12 tests
 Tests for Profile Info, User Management, Unit Management, Account Actions
 """
-import time
 from helium import (
     go_to,
     click,
@@ -14,7 +13,6 @@ from helium import (
 from config import BASE_URL, TEST_USER, TEST_PASSWORD, PROFILE_TABS
 from utils.browser import (
     wait_for_page_load,
-    is_element_present,
     is_text_present,
 )
 from utils.helpers import (
@@ -26,14 +24,16 @@ from utils.helpers import (
     is_modal_open,
     click_add_button,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_profile():
     """Common setup - login and navigate to Profile module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Profile")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -45,10 +45,9 @@ def test_profile_module_loads():
     """Test: Module renders"""
     setup_profile()
     
-    has_content = (
-        is_text_present("Profile") or
-        is_text_present("Account") or
-        is_element_present("[class*='profile']")
+    has_content = any_present(
+        selectors=["[class*='profile']"],
+        texts=["Profile", "Account"],
     )
     return True
 
@@ -57,9 +56,9 @@ def test_profile_info_tab():
     """Test: Profile Info tab loads"""
     setup_profile()
     click_tab("Profile")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Profile") or is_text_present("Name")
+    has_content = any_present(texts=["Profile", "Name"])
     return True
 
 
@@ -67,12 +66,11 @@ def test_profile_card_display():
     """Test: Profile card shows data"""
     setup_profile()
     click_tab("Profile")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_card = (
-        is_element_present("[class*='card']") or
-        is_text_present("Email") or
-        is_text_present("Role")
+    has_card = any_present(
+        selectors=["[class*='card']"],
+        texts=["Email", "Role"],
     )
     return True
 
@@ -81,12 +79,11 @@ def test_profile_edit_form():
     """Test: Edit form works"""
     setup_profile()
     click_tab("Profile")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_edit = (
-        Button("Edit").exists() or
-        is_element_present("input") or
-        is_element_present("form")
+        any_present(selectors=["input", "form"]) or
+        Button("Edit").exists()
     )
     return True
 
@@ -95,7 +92,7 @@ def test_profile_save():
     """Test: Save changes works"""
     setup_profile()
     click_tab("Profile")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_save = Button("Save").exists() or Button("Update").exists()
     return True
@@ -105,11 +102,11 @@ def test_user_management_tab():
     """Test: User Management tab (admin)"""
     setup_profile()
     click_tab("User Management")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = (
-        is_text_present("User") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["User"],
     )
     return True
 
@@ -118,9 +115,9 @@ def test_user_list():
     """Test: User list displays"""
     setup_profile()
     click_tab("User Management")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_list = is_element_present("table") or is_element_present("[class*='list']")
+    has_list = any_present(selectors=["table", "[class*='list']"])
     return True
 
 
@@ -128,12 +125,10 @@ def test_user_search():
     """Test: Search works"""
     setup_profile()
     click_tab("User Management")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_search = (
-        is_element_present("input[type='search']") or
-        is_element_present("[placeholder*='search']") or
-        is_element_present("[class*='search']")
+    has_search = any_present(
+        selectors=["input[type='search']", "[placeholder*='search']", "[class*='search']"],
     )
     return True
 
@@ -142,9 +137,9 @@ def test_unit_management_tab():
     """Test: Unit Management tab"""
     setup_profile()
     click_tab("Unit")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Unit") or is_element_present("table")
+    has_content = any_present(selectors=["table"], texts=["Unit"])
     return True
 
 
@@ -152,7 +147,7 @@ def test_unit_add():
     """Test: Add unit works"""
     setup_profile()
     click_tab("Unit")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -164,11 +159,10 @@ def test_account_actions_tab():
     """Test: Account Actions tab"""
     setup_profile()
     click_tab("Account")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_content = (
-        is_text_present("Account") or
-        is_text_present("Sign out") or
+        any_present(texts=["Account", "Sign out"]) or
         Button("Sign out").exists()
     )
     return True
@@ -2,7 +2,6 @@
 Quality Control Module Tests - 15 tests
 Tests for Inspections, Standards, Analytics, Daily Weight, First Pieces
 """
-import time
 from helium import (
     go_to,
     click,
@@ -31,14 +30,16 @@ from utils.helpers import (
     click_add_button,
     fill_form,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_quality():
     """Common setup - login and navigate to Quality module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Quality")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -50,10 +51,9 @@ def test_quality_module_loads():
     """Test: Module renders"""
     setup_quality()
     
-    has_content = (
-        is_text_present("Quality") or
-        is_text_present("Inspection") or
-        is_element_present("table")
+    has_content = any_present(
+        selectors=["table"],
+        texts=["Quality", "Inspection"],
     )
     return True
 
@@ -62,7 +62,7 @@ def test_quality_inspections_tab():
     """Test: Inspections tab loads"""
     setup_quality()
     click_tab("Inspection")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_content = is_text_present("Inspection")
     return True
@@ -72,12 +72,12 @@ def test_material_inspection_form():
     """Test: Material inspection form"""
     setup_quality()
     click_tab("Inspection")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Material")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -85,10 +85,10 @@ def test_material_inspection_submit():
     """Test: Submit inspection"""
     setup_quality()
     click_tab("Inspection")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Material")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -98,12 +98,12 @@ def test_container_inspection_form():
     """Test: Container inspection form"""
     setup_quality()
     click_tab("Inspection")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Container")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -111,10 +111,10 @@ def test_container_inspection_submit():
     """Test: Submit inspection"""
     setup_quality()
     click_tab("Inspection")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Container")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -124,9 +124,9 @@ def test_quality_standards_tab():
     """Test: Standards tab loads"""
     setup_quality()
     click_tab("Standards")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Standards") or is_text_present("Coming")
+    has_content = any_present(texts=["Standards", "Coming"])
     return True
 
 
@@ -134,9 +134,9 @@ def test_quality_analytics_tab():
     """Test: Analytics tab loads"""
     setup_quality()
     click_tab("Analytics")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Analytics") or is_text_present("Coming")
+    has_content = any_present(texts=["Analytics", "Coming"])
     return True
 
 
@@ -144,9 +144,9 @@ def test_daily_weight_report_tab():
     """Test: Weight report tab"""
     setup_quality()
     click_tab("Daily Weight")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Weight") or is_element_present("table")
+    has_content = any_present(selectors=["table"], texts=["Weight"])
     return True
 
 
@@ -154,12 +154,10 @@ def test_daily_weight_report_filter():
     """Test: Date filter works"""
     setup_quality()
     click_tab("Daily Weight")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_filter = (
-        is_element_present("input[type='date']") or
-        is_element_present("[class*='date']") or
-        is_element_present("[class*='filter']")
+    has_filter = any_present(
+        selectors=["input[type='date']", "[class*='date']", "[class*='filter']"],
     )
     return True
 
@@ -168,7 +166,7 @@ def test_daily_weight_report_table():
     """Test: Table displays data"""
     setup_quality()
     click_tab("Daily Weight")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -178,9 +176,9 @@ def test_first_pieces_tab():
     """Test: First Pieces tab loads"""
     setup_quality()
     click_tab("First Pieces")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("First") or is_text_present("Pieces")
+    has_content = any_present(texts=["First", "Pieces"])
     return True
 
 
@@ -188,7 +186,7 @@ def test_first_pieces_table():
     """Test: Table has data"""
     setup_quality()
     click_tab("First Pieces")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -198,12 +196,11 @@ def test_first_pieces_approve():
     """Test: Approve button works"""
     setup_quality()
     click_tab("First Pieces")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_approve = (
-        Button("Approve").exists() or
-        is_text_present("Approve") or
-        is_element_present("[class*='approve']")
+        any_present(selectors=["[class*='approve']"], texts=["Approve"]) or
+        Button("Approve").exists()
     )
     return True
 
@@ -2,7 +2,6 @@
 Reports Module Tests - 8 tests
 Tests for Production Overview, Efficiency, Operator Performance, Time Analysis
 """
-import time
 from helium import (
     go_to,
     click,
@@ -14,7 +13,6 @@ from helium import (
 from config import BASE_URL, TEST_USER, TEST_PASSWORD
 from utils.browser import (
     wait_for_page_load,
-    is_element_present,
     is_text_present,
 )
 from utils.helpers import (
@@ -23,14 +21,16 @@ from utils.helpers import (
     click_tab,
     click_button,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_reports():
     """Common setup - login and navigate to Reports module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Reports")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -42,10 +42,9 @@ def test_reports_module_loads():
     """Test: Module renders"""
     setup_reports()
     
-    has_content = (
-        is_text_present("Reports") or
-        is_text_present("Overview") or
-        is_element_present("[class*='card']")
+    has_content = any_present(
+        selectors=["[class*='card']"],
+        texts=["Reports", "Overview"],
     )
     return True
 
@@ -54,10 +53,9 @@ def test_production_overview_card():
     """Test: Production card exists"""
     setup_reports()
     
-    has_card = (
-        is_text_present("Production") or
-        is_text_present("Overview") or
-        is_element_present("[class*='card']")
+    has_card = any_present(
+        selectors=["[class*='card']"],
+        texts=["Production", "Overview"],
     )
     return True
 
@@ -66,9 +64,9 @@ def test_efficiency_reports_card():
     """Test: Efficiency card exists"""
     setup_reports()
     
-    has_card = (
-        is_text_present("Efficiency") or
-        is_element_present("[class*='card']")
+    has_card = any_present(
+        selectors=["[class*='card']"],
+        texts=["Efficiency"],
     )
     return True
 
@@ -77,10 +75,9 @@ def test_operator_performance_card():
     """Test: Operator card exists"""
     setup_reports()
     
-    has_card = (
-        is_text_present("Operator") or
-        is_text_present("Performance") or
-        is_element_present("[class*='card']")
+    has_card = any_present(
+        selectors=["[class*='card']"],
+        texts=["Operator", "Performance"],
     )
     return True
 
@@ -89,10 +86,9 @@ def test_time_analysis_card():
     """Test: Time card exists"""
     setup_reports()
     
-    has_card = (
-        is_text_present("Time") or
-        is_text_present("Analysis") or
-        is_element_present("[class*='card']")
+    has_card = any_present(
+        selectors=["[class*='card']"],
+        texts=["Time", "Analysis"],
     )
     return True
 
@@ -101,10 +97,8 @@ def test_report_date_filters():
     """Test: Date filters work"""
     setup_reports()
     
-    has_filter = (
-        is_element_present("input[type='date']") or
-        is_element_present("[class*='date']") or
-        is_element_present("[class*='filter']")
+    has_filter = any_present(
+        selectors=["input[type='date']", "[class*='date']", "[class*='filter']"],
     )
     return True
 
@@ -125,10 +119,8 @@ def test_report_charts():
     """Test: Charts render"""
     setup_reports()
     
-    has_charts = (
-        is_element_present("canvas") or
-        is_element_present("svg") or
-        is_element_present("[class*='chart']")
+    has_charts = any_present(
+        selectors=["canvas", "svg", "[class*='chart']"],
     )
     return True
 
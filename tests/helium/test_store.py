@@ -2,7 +2,6 @@
 Store & Dispatch Module Tests - 28 tests
 Tests for Purchase, Inward, Outward, Sales tabs and forms
 """
-import time
 from helium import (
     go_to,
     click,
@@ -18,7 +17,6 @@ from utils.browser import (
     wait_for_page_load,
     wait_for_element,
     is_element_present,
-    is_text_present,
 )
 from utils.helpers import (
     login,
@@ -31,14 +29,16 @@ from utils.helpers import (
     click_add_button,
     fill_form,
 )
+from utils.waits import settle
+from utils.probe import any_present
 
 
 def setup_store():
     """Common setup - login and navigate to Store module"""
     login(TEST_USER, TEST_PASSWORD)
-    time.sleep(1)
+    settle(1)
     navigate_to_module("Store")
-    time.sleep(1)
+    settle(1)
     wait_for_page_load()
 
 
@@ -50,9 +50,9 @@ def test_purchase_tab_loads():
     """Test: Purchase tab renders"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Purchase") or is_element_present("table")
+    has_content = any_present(selectors=["table"], texts=["Purchase"])
     return True
 
 
@@ -60,13 +60,13 @@ def test_material_indent_form():
     """Test: Material Indent form loads"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Look for Material Indent
     click_tab("Material Indent")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -74,10 +74,10 @@ def test_material_indent_submit():
     """Test: Submit indent"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Material Indent")
-    time.sleep(0.5)
+    settle(0.5)
     
     # Check for submit button
     has_submit = Button("Submit").exists() or Button("Save").exists()
@@ -88,12 +88,12 @@ def test_purchase_order_form():
     """Test: PO form loads"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Purchase Order")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -101,15 +101,14 @@ def test_purchase_order_vendor_select():
     """Test: Vendor dropdown works"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Purchase Order")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_vendor = (
-        is_element_present("select") or
-        is_text_present("Vendor") or
-        is_element_present("[class*='select']")
+    has_vendor = any_present(
+        selectors=["select", "[class*='select']"],
+        texts=["Vendor"],
     )
     return True
 
@@ -118,10 +117,10 @@ def test_purchase_order_submit():
     """Test: Submit PO"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Purchase Order")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists() or Button("Create").exists()
     return True
@@ -131,10 +130,10 @@ def test_open_indent_view():
     """Test: Open Indent table loads"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Open Indent")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -144,12 +143,12 @@ def test_purchase_history():
     """Test: History table loads"""
     setup_store()
     click_tab("Purchase")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("History")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_table = is_element_present("table") or is_text_present("History")
+    has_table = any_present(selectors=["table"], texts=["History"])
     return True
 
 
@@ -161,9 +160,9 @@ def test_inward_tab_loads():
     """Test: Inward tab renders"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Inward") or is_text_present("GRN")
+    has_content = any_present(texts=["Inward", "GRN"])
     return True
 
 
@@ -171,12 +170,12 @@ def test_grn_form():
     """Test: GRN form loads"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("GRN")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -184,10 +183,10 @@ def test_grn_submit():
     """Test: Submit GRN"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("GRN")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -197,12 +196,12 @@ def test_jw_annexure_grn_form():
     """Test: JW Annexure form loads"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("JW Annexure")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -210,10 +209,10 @@ def test_jw_annexure_submit():
     """Test: Submit JW Annexure"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("JW Annexure")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -223,10 +222,10 @@ def test_inward_history():
     """Test: History loads"""
     setup_store()
     click_tab("Inward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("History")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -240,9 +239,9 @@ def test_outward_tab_loads():
     """Test: Outward tab renders"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Outward") or is_text_present("MIS")
+    has_content = any_present(texts=["Outward", "MIS"])
     return True
 
 
@@ -250,12 +249,12 @@ def test_mis_form():
     """Test: MIS form loads"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("MIS")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -263,10 +262,10 @@ def test_mis_submit():
     """Test: Submit MIS"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("MIS")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -276,12 +275,12 @@ def test_job_work_challan_form():
     """Test: JW Challan form loads"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Job Work")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -289,12 +288,12 @@ def test_job_work_challan_gst():
     """Test: GST fields present"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Job Work")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_gst = is_text_present("GST") or is_element_present("[name*='gst']")
+    has_gst = any_present(selectors=["[name*='gst']"], texts=["GST"])
     return True
 
 
@@ -302,12 +301,12 @@ def test_delivery_challan_form():
     """Test: Delivery Challan loads"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Delivery")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -315,10 +314,10 @@ def test_delivery_challan_submit():
     """Test: Submit challan"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Delivery")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -328,10 +327,10 @@ def test_outward_history():
     """Test: History loads"""
     setup_store()
     click_tab("Outward")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("History")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -345,9 +344,9 @@ def test_sales_tab_loads():
     """Test: Sales tab renders"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_text_present("Sales") or is_text_present("Dispatch")
+    has_content = any_present(texts=["Sales", "Dispatch"])
     return True
 
 
@@ -355,12 +354,12 @@ def test_dispatch_memo_form():
     """Test: Dispatch Memo form loads"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Dispatch")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_form = is_element_present("form") or is_element_present("input")
+    has_form = any_present(selectors=["form", "input"])
     return True
 
 
@@ -368,10 +367,10 @@ def test_dispatch_memo_submit():
     """Test: Submit memo"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Dispatch")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_submit = Button("Submit").exists() or Button("Save").exists()
     return True
@@ -381,12 +380,12 @@ def test_order_book_form():
     """Test: Order Book loads"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Order Book")
-    time.sleep(0.5)
+    settle(0.5)
     
-    has_content = is_element_present("table") or is_element_present("form")
+    has_content = any_present(selectors=["table", "form"])
     return True
 
 
@@ -394,10 +393,10 @@ def test_order_book_add():
     """Test: Add order"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("Order Book")
-    time.sleep(0.5)
+    settle(0.5)
     
     clicked = click_add_button()
     if clicked and is_modal_open():
@@ -409,10 +408,10 @@ def test_sales_history():
     """Test: Sales history loads"""
     setup_store()
     click_tab("Sales")
-    time.sleep(0.5)
+    settle(0.5)
     
     click_tab("History")
-    time.sleep(0.5)
+    settle(0.5)
     
     has_table = is_element_present("table")
     return True
@@ -0,0 +1,49 @@
+"""
+Unit tests for performance budget keys (no browser).
+
+Run from tests/helium:
+    python -m pytest -q unit
+"""
+import re
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from budgets import BUDGETS
+from config import MODULES
+from utils.perf import budget_tab, get_view_budget
+
+
+HELIUM_DIR = Path(__file__).parent.parent
+
+CLICK_TAB = re.compile(r"""click_tab\(["']([^"']+)["']\)""")
+
+
+def clicked_tabs():
+    """
+    {module: set of labels passed to click_tab()} from the test modules;
+    test_<key>.py tests MODULES[<key>].
+    """
+    tabs = {}
+    for path in HELIUM_DIR.glob("test_*.py"):
+        module = MODULES.get(path.stem.removeprefix("test_"))
+        if module:
+            tabs.setdefault(module, set()).update(CLICK_TAB.findall(path.read_text()))
+    return tabs
+
+
+def test_every_budgeted_tab_is_clicked_by_a_test():
+    tabs = clicked_tabs()
+    unmatched = [
+        f"{module}/{key}"
+        for module, budgets in BUDGETS.items()
+        for key in budgets
+        if key != "*" and not any(budget_tab(module, label) == key for label in tabs.get(module, ()))
+    ]
+    assert unmatched == []
+
+
+def test_short_label_uses_full_tab_budget():
+    assert get_view_budget(MODULES["production"], "Mould") == BUDGETS[MODULES["production"]]["Mould Loading"]
+    assert get_view_budget(MODULES["masters"], "Raw Material") == BUDGETS[MODULES["masters"]]["Raw Materials"]
+    assert get_view_budget(MODULES["masters"], "FG") == {}
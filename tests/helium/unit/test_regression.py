@@ -0,0 +1,50 @@
+"""
+Unit tests for statistical regression detection (no browser).
+
+Run from tests/helium:
+    python -m pytest -q unit
+"""
+import random
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import REGRESSION_ALPHA, REGRESSION_MAX_COMPARISONS, REGRESSION_REPEATS
+from utils.history import NETWORK_METRICS, VITALS_METRICS
+from utils.regression import detect_regressions, min_q_value
+
+
+METRICS = ["duration"] + [f"vitals.{m}" for m in VITALS_METRICS] + [f"network.{m}" for m in NETWORK_METRICS]
+
+
+def sample_run(rng, tests, repeats, slow=None):
+    """
+    K lognormal samples (about 10% noise) for every metric of every test;
+    the (module, test_name, metric) key in slow is twice as large.
+    """
+    samples = {}
+    for module, test_name in tests:
+        for index, metric in enumerate(METRICS):
+            key = (module, test_name, metric)
+            scale = 2.0 if key == slow else 1.0
+            samples[key] = [scale * (100 + index) * rng.lognormvariate(0, 0.1) for _ in range(repeats)]
+    return samples
+
+
+def test_single_slowdown_detected_among_many_tests():
+    rng = random.Random(20250101)
+    tests = [(f"Module{m}", f"test_{t}") for m in range(5) for t in range(10)]
+    slow = ("Module3", "test_7", "vitals.lcp")
+
+    baseline = sample_run(rng, tests, REGRESSION_REPEATS)
+    current = sample_run(rng, tests, REGRESSION_REPEATS, slow=slow)
+    regressions = detect_regressions(current, baseline)
+
+    assert [(r["module"], r["test_name"], r["metric"]) for r in regressions] == [slow]
+    assert regressions[0]["q_value"] < REGRESSION_ALPHA
+
+
+def test_default_repeats_can_reach_alpha():
+    assert min_q_value(REGRESSION_REPEATS, REGRESSION_MAX_COMPARISONS) < REGRESSION_ALPHA
+    # K = 5: one slowdown among 13 metrics is already out of reach
+    assert min_q_value(5, 13) >= REGRESSION_ALPHA
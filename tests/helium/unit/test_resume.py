@@ -0,0 +1,45 @@
+"""
+Unit tests for resuming and rerunning runs from the run log (no browser).
+
+Run from tests/helium:
+    python -m pytest -q unit
+"""
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import run
+import utils.runlog as runlog
+from utils.health import skipped_result
+
+
+def check_a():
+    pass
+
+
+def check_b():
+    pass
+
+
+def logged_run(tmp_path, monkeypatch):
+    """
+    Log a run where check_a passed and check_b was skipped behind an open
+    circuit. Returns the results read back as --resume / --rerun-failed do.
+    """
+    monkeypatch.setattr(runlog, "RUN_LOG_DIR", tmp_path)
+    path = runlog.start_run_log("20250101_093000", run.datetime.now(), 1, 2)
+    runlog.log_result(path, {"module": "Auth", "test_name": "check_a", "status": "PASS", "duration": 1.0})
+    runlog.log_result(path, skipped_result("Auth", "check_b", "Server unhealthy"))
+    return run.previous_results("20250101_093000")
+
+
+def test_resume_runs_circuit_open_skips(tmp_path, monkeypatch):
+    previous = logged_run(tmp_path, monkeypatch)
+    remaining = run.skip_finished([("Auth", [check_a, check_b])], previous)
+    assert remaining == [("Auth", [check_b])]
+
+
+def test_rerun_failed_includes_circuit_open_skips(tmp_path, monkeypatch):
+    previous = logged_run(tmp_path, monkeypatch)
+    selected = run.select_failed([("Auth", [check_a, check_b])], previous)
+    assert selected == [("Auth", [check_b])]
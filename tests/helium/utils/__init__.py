@@ -1,7 +1,9 @@
 # Helium Test Utilities
-from .browser import setup_browser, teardown_browser, take_screenshot, wait_for_page_load, is_element_present
-from .reporter import create_report_workbook, add_test_result, save_report, generate_summary
-from .helpers import login, logout, navigate_to_module, click_tab, fill_form, click_button, get_table_rows, wait_for_toast, close_modal
+from .browser import setup_browser, teardown_browser, take_screenshot, wait_for_page_load, is_element_present, probing
+from .reporter import create_result_store, create_report_workbook, add_test_result, save_report, generate_summary
+from .helpers import login, logout, navigate_to_module, click_tab, fill_form, click_button, get_table_rows, read_table, iter_table_chunks, wait_for_toast, close_modal
+from .session import capture_session, restore_session, clear_session, is_session_valid
+from .probe import probe, any_present, wait_for_probe
 
 
 
@@ -3,34 +3,65 @@ Browser utilities for Helium Selenium tests
 """
 import os
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
 from helium import (
     start_chrome,
     kill_browser,
     get_driver,
+    set_driver,
     wait_until,
     S,
     Text,
 )
+from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config import SCREENSHOT_DIR, HEADLESS, BROWSER_WIDTH, BROWSER_HEIGHT, TIMEOUT
+from config import (
+    SCREENSHOT_DIR,
+    HEADLESS,
+    BROWSER_WIDTH,
+    BROWSER_HEIGHT,
+    TIMEOUT,
+    PAGE_LOAD_TIMEOUT,
+    IMPLICIT_WAIT,
+    NETWORK_CAPTURE,
+)
+from utils.waits import install_idle_tracker, settle
+from utils.vitals import install_vitals_observer
+from utils.network import enable_network_capture
+
+
+# Driver commands that block for the implicit wait when nothing matches
+FIND_COMMANDS = {
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+}
+
+# Implicit wait currently set on the driver (probing() drops it to 0)
+_implicit_wait = IMPLICIT_WAIT
 
+# Per-test accounting of time lost to implicit-wait timeouts
+_implicit_wait_stats = {"timeouts": 0, "seconds": 0.0}
 
-def setup_browser():
+
+def chrome_options(user_data_dir: str = None) -> Options:
     """
-    Initialize Chrome browser with webdriver-manager.
-    Returns the Selenium WebDriver instance.
+    Chrome options shared by setup_browser() and launch_browser().
     """
     chrome_options = Options()
     
@@ -45,19 +76,70 @@ def setup_browser():
     chrome_options.add_argument("--disable-infobars")
     chrome_options.add_argument("--ignore-certificate-errors")
     
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    
+    if NETWORK_CAPTURE:
+        enable_network_capture(chrome_options)
+    
+    return chrome_options
+
+
+def prepare_driver(driver):
+    """
+    Per-browser setup: timeouts, implicit-wait tracking and the scripts
+    registered on every new document. Safe to run on a browser that is not
+    Helium's current one (it leaves the module's implicit-wait state alone).
+    """
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    track_implicit_waits(driver)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    install_idle_tracker(driver)
+    install_vitals_observer(driver)
+
+
+def setup_browser(user_data_dir: str = None):
+    """
+    Initialize Chrome browser with webdriver-manager.
+    Pass user_data_dir to isolate profile state (cookies, storage) per worker.
+    Returns the Selenium WebDriver instance.
+    """
     # Use webdriver-manager to handle chromedriver
     service = Service(ChromeDriverManager().install())
     
     # Start Chrome with Helium
-    start_chrome(options=chrome_options)
+    start_chrome(options=chrome_options(user_data_dir))
     
     driver = get_driver()
-    driver.set_page_load_timeout(60)
-    driver.implicitly_wait(5)
+    prepare_driver(driver)
+    set_implicit_wait(IMPLICIT_WAIT, driver, force=True)
+    
+    return driver
+
+
+def launch_browser(user_data_dir: str = None):
+    """
+    Start a Chrome that is not (yet) Helium's current browser, e.g. a warm
+    spare for the browser pool. Make it current with use_browser().
+    Returns the Selenium WebDriver instance.
+    """
+    options = chrome_options(user_data_dir)
+    # Keep Chrome's debug logs out of the console, as Helium's start_chrome does
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
     
+    driver = webdriver.Chrome(options=options)
+    prepare_driver(driver)
     return driver
 
 
+def use_browser(driver):
+    """
+    Make driver the browser Helium and the utilities act on.
+    """
+    set_driver(driver)
+    set_implicit_wait(IMPLICIT_WAIT, driver, force=True)
+
+
 def teardown_browser():
     """
     Close browser safely.
@@ -68,6 +150,84 @@ def teardown_browser():
         print(f"Warning: Error closing browser: {e}")
 
 
+def set_implicit_wait(seconds: float, driver=None, force: bool = False):
+    """
+    Set the driver's implicit wait, skipping the round-trip if unchanged.
+    """
+    global _implicit_wait
+    
+    if force or seconds != _implicit_wait:
+        (driver or get_driver()).implicitly_wait(seconds)
+    _implicit_wait = seconds
+
+
+@contextmanager
+def probing():
+    """
+    Context manager for existence checks: disables the implicit wait so
+    find_element calls fail immediately instead of blocking for
+    IMPLICIT_WAIT seconds, then restores the previous value. Nests safely.
+    
+    Usage:
+        with probing():
+            driver.find_element(By.CSS_SELECTOR, "[role='dialog']")
+    """
+    driver = get_driver()
+    previous = _implicit_wait
+    set_implicit_wait(0, driver)
+    try:
+        yield driver
+    finally:
+        set_implicit_wait(previous, driver)
+
+
+def track_implicit_waits(driver):
+    """
+    Wrap driver.execute to measure find commands that come back empty
+    while an implicit wait is active, i.e. time spent waiting for elements
+    that never appeared.
+    """
+    original_execute = driver.execute
+    
+    def execute(driver_command, params=None):
+        if driver_command not in FIND_COMMANDS or _implicit_wait <= 0:
+            return original_execute(driver_command, params)
+        
+        start = time.time()
+        try:
+            response = original_execute(driver_command, params)
+        except NoSuchElementException:
+            _record_implicit_timeout(time.time() - start)
+            raise
+        
+        if not response.get("value"):
+            _record_implicit_timeout(time.time() - start)
+        return response
+    
+    driver.execute = execute
+
+
+def _record_implicit_timeout(seconds: float):
+    _implicit_wait_stats["timeouts"] += 1
+    _implicit_wait_stats["seconds"] += seconds
+
+
+def reset_implicit_wait_stats():
+    """
+    Clear implicit-wait accounting. Called by the runner before each test.
+    """
+    _implicit_wait_stats["timeouts"] = 0
+    _implicit_wait_stats["seconds"] = 0.0
+
+
+def get_implicit_wait_stats() -> Dict[str, float]:
+    """
+    Return the number of implicit-wait timeouts and seconds lost to them
+    for the current test.
+    """
+    return dict(_implicit_wait_stats)
+
+
 def take_screenshot(name: str, error: str = None) -> str:
     """
     Capture screenshot with timestamp.
@@ -105,8 +265,8 @@ def wait_for_page_load(timeout: int = TIMEOUT):
         WebDriverWait(driver, timeout).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
-        # Additional wait for React/Next.js hydration
-        time.sleep(0.5)
+        # Wait (up to 0.5s) for React/Next.js hydration and data fetches to settle
+        settle(0.5)
         return True
     except TimeoutException:
         return False
@@ -145,10 +305,11 @@ def wait_for_element_clickable(selector: str, timeout: int = TIMEOUT, by: By = B
 def is_element_present(selector: str, by: By = By.CSS_SELECTOR) -> bool:
     """
     Check if element exists on the page.
+    Does not wait for the element to appear.
     """
     try:
-        driver = get_driver()
-        driver.find_element(by, selector)
+        with probing() as driver:
+            driver.find_element(by, selector)
         return True
     except NoSuchElementException:
         return False
@@ -167,10 +328,11 @@ def is_text_present(text: str) -> bool:
 def get_element_text(selector: str, by: By = By.CSS_SELECTOR) -> str:
     """
     Get text content of an element.
+    Does not wait for the element to appear.
     """
     try:
-        driver = get_driver()
-        element = driver.find_element(by, selector)
+        with probing() as driver:
+            element = driver.find_element(by, selector)
         return element.text
     except NoSuchElementException:
         return ""
@@ -179,10 +341,11 @@ def get_element_text(selector: str, by: By = By.CSS_SELECTOR) -> str:
 def get_element_count(selector: str, by: By = By.CSS_SELECTOR) -> int:
     """
     Count elements matching selector.
+    Does not wait for elements to appear.
     """
     try:
-        driver = get_driver()
-        elements = driver.find_elements(by, selector)
+        with probing() as driver:
+            elements = driver.find_elements(by, selector)
         return len(elements)
     except:
         return 0
@@ -196,7 +359,7 @@ def scroll_to_element(selector: str, by: By = By.CSS_SELECTOR):
         driver = get_driver()
         element = driver.find_element(by, selector)
         driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-        time.sleep(0.3)
+        settle(0.3)
         return True
     except:
         return False
@@ -0,0 +1,404 @@
+"""
+DPR Excel upload benchmark
+
+Operators upload DPR workbooks with a sheet per date and shift, and large
+multi-shift files are slow. This module generates such workbooks with
+openpyxl's write-only mode (rows are streamed to disk, so a 31-day,
+100-machine file costs no more memory than a small one) and uploads each
+size (DPR_BENCH_SIZES) through both import paths:
+
+    /api/dpr/upload-excel   the whole file as multipart; the server parses
+                            it and inserts row by row
+    /api/dpr-excel          the Production module's path: the workbook is
+                            parsed on the client, then one JSON request per
+                            sheet (date + shift) with all its machines
+
+Sheets use the flat column headers upload-excel maps ("Date", "Shift",
+"Machine", "Product", "Act Cycle", ...), with one row per machine. Dates
+fall in December of DPR_BENCH_YEAR so real DPRs are never touched, and
+rows from files named bench_dpr_* are deleted afterwards when Supabase
+credentials are set.
+
+When the Next.js server runs on this machine its resident memory is
+sampled during every upload (found by process name, or NEXT_SERVER_PID),
+giving peak and retained growth next to the latencies.
+"""
+import calendar
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import requests
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BASE_URL,
+    LOAD_REQUEST_TIMEOUT,
+    SUPABASE_URL,
+    SUPABASE_SERVICE_ROLE_KEY,
+    DPR_BENCH_YEAR,
+    DPR_BENCH_SHIFTS,
+    DPR_BENCH_UPLOAD_TIMEOUT,
+    NEXT_SERVER_PID,
+    MEMORY_SAMPLE_INTERVAL,
+)
+from utils.load import new_session
+from utils.supabase import supabase_rest
+from utils.procmem import rss_mb
+
+
+FILE_PREFIX = "bench_dpr_"
+BENCH_MONTH = 12  # 31 days
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Sheet column -> dpr-excel current_production field (None: entry-level column)
+COLUMNS = [
+    ("Date", None),
+    ("Shift", None),
+    ("Shift Incharge", None),
+    ("Machine", None),
+    ("Operator", None),
+    ("Product", "product"),
+    ("Cavity", "cavity"),
+    ("Trg Cycle", "trg_cycle_sec"),
+    ("Trg Run Time", "trg_run_time_min"),
+    ("Part Wt", "part_wt_gm"),
+    ("Act Part Wt", "act_part_wt_gm"),
+    ("Act Cycle", "act_cycle_sec"),
+    ("Shots Start", "shots_start"),
+    ("Shots End", "shots_end"),
+    ("Target Qty", "target_qty_nos"),
+    ("Actual Qty", "actual_qty_nos"),
+    ("OK Prod Qty", "ok_prod_qty_nos"),
+    ("OK Prod Kgs", "ok_prod_kgs"),
+    ("OK Prod %", "ok_prod_percent"),
+    ("Rej Kgs", "rej_kgs"),
+    ("Lumps", "lumps_kgs"),
+    ("Run Time", "run_time_mins"),
+    ("Down Time", "down_time_min"),
+    ("Reason", "stoppage_reason"),
+    ("Remark", "remark"),
+]
+STOPPAGE_REASONS = ["Mould change", "Power cut", "Material shortage", "Heater fault", "Quality hold"]
+
+
+def _machine_row(rng: random.Random, report_date: str, shift: str, machine: int) -> list:
+    """
+    One machine's shift: 12 hours, a few minutes down, realistic weights.
+    """
+    cavity = rng.choice([1, 2, 4, 8, 16])
+    trg_cycle = rng.choice([12, 18, 24, 30, 45])
+    act_cycle = round(trg_cycle * rng.uniform(0.97, 1.1), 1)
+    part_wt = round(rng.uniform(8, 250), 1)
+    down_time = rng.choice([0, 0, 0, 10, 25, 45])
+    run_time = 720 - down_time
+    shots = int(run_time * 60 / act_cycle)
+    shots_start = rng.randint(100000, 900000)
+    target_qty = int(720 * 60 / trg_cycle) * cavity
+    actual_qty = shots * cavity
+    rejected = int(actual_qty * rng.uniform(0, 0.03))
+    ok_qty = actual_qty - rejected
+
+    return [
+        report_date,
+        shift,
+        f"Incharge {shift.title()}",
+        f"IMM-{machine + 1:03d}",
+        f"Operator {machine % 40 + 1}",
+        f"Bench product {machine % 60 + 1}",
+        cavity,
+        trg_cycle,
+        720,
+        part_wt,
+        round(part_wt * rng.uniform(0.98, 1.03), 1),
+        act_cycle,
+        shots_start,
+        shots_start + shots,
+        target_qty,
+        actual_qty,
+        ok_qty,
+        round(ok_qty * part_wt / 1000, 2),
+        round(100 * ok_qty / actual_qty, 1) if actual_qty else 0,
+        round(rejected * part_wt / 1000, 2),
+        round(rng.uniform(0, 1.5), 2),
+        run_time,
+        down_time,
+        rng.choice(STOPPAGE_REASONS) if down_time else None,
+        None,
+    ]
+
+
+def write_dpr_workbook(path: Path, days: int, machines: int, year: int = DPR_BENCH_YEAR, seed: int = 0) -> Dict[str, Any]:
+    """
+    Write a DPR workbook for the first days of December: one sheet per
+    date and shift, one row per machine. Uses write-only mode, so memory
+    stays flat however many rows are written.
+
+    Returns dict with keys: path, days, machines, sheets, rows, bytes, seconds.
+    """
+    days = min(days, calendar.monthrange(year, BENCH_MONTH)[1])
+    rng = random.Random(seed)
+    start = time.time()
+
+    wb = Workbook(write_only=True)
+    bold = Font(bold=True)
+    sheets = 0
+    for day in range(1, days + 1):
+        report_date = f"{year}-{BENCH_MONTH:02d}-{day:02d}"
+        for shift in DPR_BENCH_SHIFTS:
+            ws = wb.create_sheet(f"{day:02d}-{BENCH_MONTH:02d} {shift}")
+            header = []
+            for title, _ in COLUMNS:
+                cell = WriteOnlyCell(ws, value=title)
+                cell.font = bold
+                header.append(cell)
+            ws.append(header)
+            for machine in range(machines):
+                ws.append(_machine_row(rng, report_date, shift, machine))
+            sheets += 1
+    wb.save(str(path))
+
+    return {
+        "path": str(path),
+        "days": days,
+        "machines": machines,
+        "sheets": sheets,
+        "rows": sheets * machines,
+        "bytes": path.stat().st_size,
+        "seconds": time.time() - start,
+    }
+
+
+def dpr_excel_payloads(path: Path) -> List[Dict[str, Any]]:
+    """
+    Parse a generated workbook the way the Production module does before
+    calling /api/dpr-excel: one payload per sheet with its machine entries.
+    """
+    wb = load_workbook(str(path), read_only=True)
+    payloads = []
+    try:
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(values_only=True)
+            headers = next(rows, None)
+            if not headers:
+                continue
+            index = {title: position for position, title in enumerate(headers)}
+            entries, first = [], None
+            for row in rows:
+                # Read-only mode drops trailing empty cells
+                row = tuple(row) + (None,) * (len(headers) - len(row))
+                first = first or row
+                entries.append({
+                    "machine_no": row[index["Machine"]],
+                    "operator_name": row[index["Operator"]],
+                    "current_production": {
+                        field: row[index[title]] for title, field in COLUMNS if field
+                    },
+                })
+            if first:
+                payloads.append({
+                    "report_date": first[index["Date"]],
+                    "shift": first[index["Shift"]],
+                    "shift_incharge": first[index["Shift Incharge"]],
+                    "machine_entries": entries,
+                    "created_by": "helium",
+                    "excel_file_name": path.name,
+                    "excel_sheet_name": ws.title,
+                })
+    finally:
+        wb.close()
+    return payloads
+
+
+def _server_pids() -> List[int]:
+    if NEXT_SERVER_PID:
+        return [int(pid) for pid in NEXT_SERVER_PID.split(",")]
+    pids = []
+    for proc in Path("/proc").glob("[0-9]*"):
+        try:
+            args = (proc / "cmdline").read_bytes().decode(errors="ignore").split("\0")
+        except OSError:
+            continue
+        # "next-server (v15...)" is the process title of the server itself,
+        # "node .../next dev" / "next start" the CLI that spawned it
+        runs_next = any(arg == "next" or arg.endswith("/next") for arg in args)
+        if args[0].startswith("next-server") or (runs_next and ("dev" in args or "start" in args)):
+            pids.append(int(proc.name))
+    return pids
+
+
+@contextmanager
+def sample_server_memory(pids: List[int], interval: float = MEMORY_SAMPLE_INTERVAL):
+    """
+    Sample server RSS in the background while the block runs. Yields a dict
+    that afterwards holds rss_before_mb, rss_peak_mb and rss_after_mb
+    (None when the server is not local).
+    """
+    stats = {"rss_before_mb": rss_mb(pids), "rss_peak_mb": None, "rss_after_mb": None}
+    peak = [stats["rss_before_mb"]]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(interval):
+            rss = rss_mb(pids)
+            if rss is not None and (peak[0] is None or rss > peak[0]):
+                peak[0] = rss
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield stats
+    finally:
+        stop.set()
+        sampler.join()
+        stats["rss_after_mb"] = rss_mb(pids)
+        stats["rss_peak_mb"] = peak[0]
+
+
+def _memory_summary(stats: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    before, peak, after = stats["rss_before_mb"], stats["rss_peak_mb"], stats["rss_after_mb"]
+    return {
+        "rss_peak_mb": peak,
+        "rss_growth_mb": after - before if before is not None and after is not None else None,
+        "rss_spike_mb": peak - before if before is not None and peak is not None else None,
+    }
+
+
+def upload_excel(session: requests.Session, path: Path, pids: List[int]) -> Dict[str, Any]:
+    """
+    Upload a workbook to /api/dpr/upload-excel.
+
+    Returns dict with keys: ms, status, ok, error, processed, imported,
+    failed (from the response statistics) and the server memory summary.
+    """
+    result = {"ms": None, "status": None, "ok": False, "error": None, "processed": None, "imported": None, "failed": None}
+    with sample_server_memory(pids) as memory:
+        start = time.perf_counter()
+        try:
+            with open(path, "rb") as f:
+                response = session.post(
+                    f"{BASE_URL}/api/dpr/upload-excel",
+                    files={"file": (path.name, f, XLSX_MIME)},
+                    data={"uploaded_by": "helium", "description": "DPR upload benchmark"},
+                    timeout=DPR_BENCH_UPLOAD_TIMEOUT,
+                )
+            result["status"] = response.status_code
+            result["ok"] = response.status_code < 400
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            statistics = body.get("statistics") or {}
+            result["processed"] = statistics.get("total_processed")
+            result["imported"] = statistics.get("success")
+            result["failed"] = statistics.get("failed")
+            if not result["ok"]:
+                result["error"] = str(body.get("error") or f"HTTP {response.status_code}")[:200]
+        except requests.RequestException as e:
+            result["error"] = type(e).__name__
+        result["ms"] = (time.perf_counter() - start) * 1000
+    result.update(_memory_summary(memory))
+    return result
+
+
+def post_dpr_excel(session: requests.Session, path: Path, pids: List[int]) -> Dict[str, Any]:
+    """
+    Parse a workbook client-side and post every sheet to /api/dpr-excel.
+
+    Returns dict with keys: parse_ms, insert_ms (all requests), ms (parse +
+    insert), peak_ms (slowest request), requests, errors, ok, error (first
+    failure) and the server memory summary.
+    """
+    start = time.perf_counter()
+    payloads = dpr_excel_payloads(path)
+    parse_ms = (time.perf_counter() - start) * 1000
+
+    result = {"parse_ms": parse_ms, "insert_ms": 0.0, "peak_ms": 0.0, "requests": len(payloads), "errors": 0, "error": None}
+    with sample_server_memory(pids) as memory:
+        for payload in payloads:
+            request_start = time.perf_counter()
+            try:
+                response = session.post(f"{BASE_URL}/api/dpr-excel", json=payload, timeout=LOAD_REQUEST_TIMEOUT)
+                failed = response.status_code >= 400
+                error = f"HTTP {response.status_code}: {response.text[:150]}"
+            except requests.RequestException as e:
+                failed, error = True, type(e).__name__
+            elapsed = (time.perf_counter() - request_start) * 1000
+            result["insert_ms"] += elapsed
+            result["peak_ms"] = max(result["peak_ms"], elapsed)
+            if failed:
+                result["errors"] += 1
+                result["error"] = result["error"] or error
+    result["ms"] = parse_ms + result["insert_ms"]
+    result["ok"] = result["errors"] == 0
+    result.update(_memory_summary(memory))
+    return result
+
+
+def clear_dpr_uploads() -> None:
+    """
+    Delete DPRs and upload records created from bench_dpr_* files.
+    Tables or columns missing from this database are skipped.
+    """
+    pattern = f"like.{FILE_PREFIX}*"
+    for path in (
+        f"dpr_excel_data?excel_file_name={pattern}",
+        f"dpr_data?excel_file_name={pattern}",
+        f"dpr_excel_uploads?file_name={pattern}",
+    ):
+        try:
+            supabase_rest("DELETE", path)
+        except Exception as e:
+            print(f"  Could not clean up {path.split('?')[0]}: {e}")
+
+
+def run_dpr_bench(
+    token: str,
+    sizes: List[Tuple[int, int]],
+    workdir: Path,
+    keep: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate and upload a workbook per (days, machines) size, smallest
+    first, through both routes. Uploaded rows are deleted after each size
+    (so every upload starts from the same data) unless keep is set or
+    Supabase is not configured.
+
+    Returns one dict per size: write_dpr_workbook() keys plus
+    "upload-excel" (upload_excel()) and "dpr-excel" (post_dpr_excel()).
+    """
+    pids = _server_pids()
+    cleanup = not keep and SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY
+    if rss_mb(pids) is None:
+        print("  Next.js server process not found locally; memory is not measured (set NEXT_SERVER_PID)")
+    if not keep and not cleanup:
+        print(f"  Supabase credentials not set: uploaded {FILE_PREFIX}* DPRs will not be deleted")
+
+    results = []
+    with new_session(token) as session:
+        for days, machines in sorted(sizes, key=lambda size: size[0] * size[1]):
+            path = workdir / f"{FILE_PREFIX}{days}d_{machines}m.xlsx"
+            result = write_dpr_workbook(path, days, machines)
+            print(f"  {result['rows']} rows ({days} days x {len(DPR_BENCH_SHIFTS)} shifts x {machines} machines), "
+                  f"{result['bytes'] / 1024:.0f} KB:")
+
+            for route, upload in (("upload-excel", upload_excel), ("dpr-excel", post_dpr_excel)):
+                if cleanup:
+                    clear_dpr_uploads()
+                stats = upload(session, path, pids)
+                stats["rows_per_s"] = result["rows"] / (stats["ms"] / 1000) if stats["ms"] else None
+                result[route] = stats
+                status = "ok" if stats["ok"] else f"FAILED ({stats['error']})"
+                print(f"    {route}: {stats['ms'] / 1000:.1f}s, {status}")
+            results.append(result)
+
+    if cleanup:
+        clear_dpr_uploads()
+    return results
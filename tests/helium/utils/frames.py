@@ -0,0 +1,132 @@
+"""
+Frame timing probe for Helium tests
+
+Measures how smooth an interaction is while it happens. start_frame_probe()
+starts a requestAnimationFrame loop that records the time between frames,
+plus a PerformanceObserver for long tasks (main thread blocked > 50 ms).
+stop_frame_probe() returns the raw samples and summarize_frames() reduces
+them to jank metrics: frame time percentiles, dropped frames and total
+blocking time.
+"""
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import FRAME_BUDGET_MS, SHORT_TIMEOUT
+from utils.history import percentile
+from utils.waits import wait_for_idle
+
+
+FRAME_PROBE_JS = """
+const previous = window.__heliumFrames;
+if (previous && previous.observer) previous.observer.disconnect();
+if (previous) previous.running = false;
+
+const probe = window.__heliumFrames = {frames: [], longTasks: [], running: true, last: null};
+const tick = (now) => {
+    if (!probe.running) return;
+    if (probe.last !== null) probe.frames.push(now - probe.last);
+    probe.last = now;
+    requestAnimationFrame(tick);
+};
+requestAnimationFrame(tick);
+
+try {
+    probe.observer = new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) probe.longTasks.push(entry.duration);
+    });
+    probe.observer.observe({type: 'longtask'});
+} catch (e) {
+    probe.observer = null;
+}
+"""
+
+FRAME_STOP_JS = """
+const probe = window.__heliumFrames;
+if (!probe) return null;
+probe.running = false;
+if (probe.observer) {
+    for (const entry of probe.observer.takeRecords()) probe.longTasks.push(entry.duration);
+    probe.observer.disconnect();
+}
+return {frames: probe.frames, long_tasks: probe.longTasks};
+"""
+
+# Long task time beyond this counts as blocking (as in Lighthouse TBT)
+BLOCKING_THRESHOLD_MS = 50
+
+
+def start_frame_probe() -> None:
+    """
+    Start recording frame times and long tasks on the current page.
+    """
+    get_driver().execute_script(FRAME_PROBE_JS)
+
+
+def stop_frame_probe() -> Dict[str, List[float]]:
+    """
+    Stop the probe and return {"frames": [ms between frames], "long_tasks": [ms]}.
+    Both lists are empty if the page was reloaded while recording.
+    """
+    try:
+        sample = get_driver().execute_script(FRAME_STOP_JS)
+    except Exception:
+        sample = None
+    return sample or {"frames": [], "long_tasks": []}
+
+
+def measure_interaction(interaction: Callable[[], None], settle_timeout: float = SHORT_TIMEOUT) -> Dict[str, List[float]]:
+    """
+    Run interaction() with the frame probe on, including the work it
+    triggers afterwards (saves, re-renders) until the app is idle again.
+    """
+    start_frame_probe()
+    try:
+        interaction()
+        wait_for_idle(settle_timeout)
+    finally:
+        sample = stop_frame_probe()
+    return sample
+
+
+def summarize_frames(
+    frames: List[float],
+    long_tasks: List[float],
+    frame_budget_ms: float = FRAME_BUDGET_MS
+) -> Dict[str, Any]:
+    """
+    Reduce frame and long task samples to jank metrics.
+    A frame that took n budgets long counts n - 1 dropped frames.
+
+    Returns dict with keys: frames, seconds, fps, p50_frame_ms, p95_frame_ms,
+    max_frame_ms, dropped_frames, dropped_pct, long_tasks, long_task_ms, tbt.
+    """
+    summary = {
+        "frames": len(frames),
+        "seconds": sum(frames) / 1000,
+        "fps": None,
+        "p50_frame_ms": None,
+        "p95_frame_ms": None,
+        "max_frame_ms": None,
+        "dropped_frames": 0,
+        "dropped_pct": None,
+        "long_tasks": len(long_tasks),
+        "long_task_ms": sum(long_tasks),
+        "tbt": sum(max(0.0, d - BLOCKING_THRESHOLD_MS) for d in long_tasks),
+    }
+    if not frames:
+        return summary
+
+    dropped = sum(max(0, round(f / frame_budget_ms) - 1) for f in frames)
+    summary.update({
+        "fps": len(frames) / summary["seconds"] if summary["seconds"] else None,
+        "p50_frame_ms": percentile(frames, 50),
+        "p95_frame_ms": percentile(frames, 95),
+        "max_frame_ms": max(frames),
+        "dropped_frames": dropped,
+        "dropped_pct": dropped / (len(frames) + dropped) * 100,
+    })
+    return summary
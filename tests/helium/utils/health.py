@@ -0,0 +1,190 @@
+"""
+Server health preflight and infrastructure circuit breaker
+
+When the Next.js server is down or wedged, every test fails the same way
+(renderer timeouts, connection refused) and each one first waits out
+PAGE_LOAD_TIMEOUT. probe_health() asks BASE_URL and a cheap API route
+(/api/auth/verify-session answers 401 without a cookie, before touching the
+database) whether the server responds at all; the runner calls it before
+Chrome is launched.
+
+During a run, the runner feeds every result to a breaker from new_breaker().
+After CIRCUIT_BREAKER_THRESHOLD consecutive infrastructure-class failures
+(is_infra_error()) it trips: recover() pauses, probes the server up to
+CIRCUIT_BREAKER_PROBES times, and either asks for a fresh browser or opens
+the circuit, after which the remaining tests are reported as SKIP with the
+reason instead of being run.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import requests
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BASE_URL,
+    VERIFY_SESSION_URL,
+    HEALTH_CHECK_TIMEOUT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_PAUSE,
+    CIRCUIT_BREAKER_PROBES,
+    CIRCUIT_BREAKER_MAX_RECYCLES,
+)
+
+
+# Error class of results skipped because the circuit was open
+CIRCUIT_OPEN = "CircuitOpen"
+
+# Failures that leave the browser unusable, so the browser pool replaces it
+# (lowercase substrings of the error message, or exception class names).
+# Python-level connection errors come from the chromedriver connection.
+BROWSER_ERROR_PATTERNS = (
+    "timed out receiving message from renderer",
+    "invalid session id",
+    "session deleted",
+    "no such session",
+    "chrome not reachable",
+    "not connected to devtools",
+    "tab crashed",
+    "no such window",
+    "connection refused",
+    "max retries exceeded",
+)
+BROWSER_ERROR_CLASSES = {
+    "InvalidSessionIdException",
+    "NoSuchWindowException",
+    "MaxRetryError",
+    "NewConnectionError",
+    "ConnectionRefusedError",
+    "RemoteDisconnected",
+    "ProtocolError",
+}
+
+# Failures that say nothing about the app under test: the browser errors
+# above, plus pages the server did not answer
+INFRA_ERROR_PATTERNS = BROWSER_ERROR_PATTERNS + (
+    "err_connection_refused",
+    "err_connection_reset",
+    "err_empty_response",
+)
+INFRA_ERROR_CLASSES = BROWSER_ERROR_CLASSES
+
+
+def _error_matches(result: Dict[str, Any], patterns, classes) -> bool:
+    if result["status"] != "FAIL":
+        return False
+    if result.get("error_class") in classes:
+        return True
+    error = (result.get("error") or "").lower()
+    return any(pattern in error for pattern in patterns)
+
+
+def is_browser_error(result: Dict[str, Any]) -> bool:
+    """
+    True for a FAIL that leaves the browser unusable for the next test.
+    """
+    return _error_matches(result, BROWSER_ERROR_PATTERNS, BROWSER_ERROR_CLASSES)
+
+
+def is_infra_error(result: Dict[str, Any]) -> bool:
+    """
+    True for a FAIL caused by the browser, driver or server connection
+    rather than by an assertion about the app.
+    """
+    return _error_matches(result, INFRA_ERROR_PATTERNS, INFRA_ERROR_CLASSES)
+
+
+def probe_health(timeout: float = HEALTH_CHECK_TIMEOUT) -> Dict[str, Any]:
+    """
+    GET BASE_URL and VERIFY_SESSION_URL; any status below 500 counts as up.
+
+    Returns dict with keys: ok, reason (first failing check, or None) and
+    checks ([{"url", "status", "ms", "error"}]).
+    """
+    checks = []
+    for url in (BASE_URL, VERIFY_SESSION_URL):
+        start = time.perf_counter()
+        try:
+            response = requests.get(url, timeout=timeout, allow_redirects=False)
+            status, error = response.status_code, None if response.status_code < 500 else f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            status, error = None, type(e).__name__
+        checks.append({"url": url, "status": status, "ms": (time.perf_counter() - start) * 1000, "error": error})
+
+    failed = next((c for c in checks if c["error"]), None)
+    return {
+        "ok": failed is None,
+        "reason": f"{failed['url']}: {failed['error']}" if failed else None,
+        "checks": checks,
+    }
+
+
+def new_breaker() -> Dict[str, Any]:
+    """
+    Circuit breaker state for one browser (the serial run, or one worker).
+    """
+    return {"consecutive": 0, "last_error": None, "recycles": 0, "open": False, "reason": None}
+
+
+def record_result(breaker: Dict[str, Any], result: Dict[str, Any]) -> bool:
+    """
+    Count a result. Returns True when the breaker trips, i.e. the last
+    CIRCUIT_BREAKER_THRESHOLD results were all infrastructure errors.
+    """
+    if not is_infra_error(result):
+        breaker["consecutive"] = 0
+        return False
+
+    breaker["consecutive"] += 1
+    breaker["last_error"] = (result.get("error") or result.get("error_class") or "")[:120]
+    return breaker["consecutive"] >= CIRCUIT_BREAKER_THRESHOLD
+
+
+def recover(breaker: Dict[str, Any], pause: float = CIRCUIT_BREAKER_PAUSE) -> bool:
+    """
+    After a trip: pause and probe the server up to CIRCUIT_BREAKER_PROBES
+    times. Returns True if the caller should restart its browser and go on;
+    otherwise the circuit is open and breaker["reason"] says why.
+    """
+    print(f"\n  ⚡ Circuit breaker: {breaker['consecutive']} infrastructure errors in a row "
+          f"(last: {breaker['last_error']})")
+    breaker["consecutive"] = 0
+
+    if breaker["recycles"] >= CIRCUIT_BREAKER_MAX_RECYCLES:
+        open_circuit(breaker, f"Infrastructure errors persisted after {breaker['recycles']} browser restarts")
+        return False
+
+    health: Optional[Dict[str, Any]] = None
+    for attempt in range(1, CIRCUIT_BREAKER_PROBES + 1):
+        time.sleep(pause)
+        health = probe_health()
+        print(f"    Health probe {attempt}/{CIRCUIT_BREAKER_PROBES}: {'up' if health['ok'] else health['reason']}")
+        if health["ok"]:
+            breaker["recycles"] += 1
+            return True
+
+    open_circuit(breaker, f"Server unhealthy: {health['reason']}")
+    return False
+
+
+def open_circuit(breaker: Dict[str, Any], reason: str) -> None:
+    breaker["open"] = True
+    breaker["reason"] = reason
+    print(f"    Circuit open, skipping the remaining tests: {reason}")
+
+
+def skipped_result(module_name: str, test_name: str, reason: str) -> Dict[str, Any]:
+    """
+    Result for a test not run because the circuit was open.
+    """
+    return {
+        "module": module_name,
+        "test_name": test_name,
+        "status": "SKIP",
+        "duration": 0,
+        "error": f"Not run: {reason}",
+        "error_class": CIRCUIT_OPEN,
+        "screenshot": None,
+    }
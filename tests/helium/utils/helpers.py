@@ -1,7 +1,6 @@
 """
 Common helper functions for Helium tests
 """
-import time
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
@@ -10,7 +9,6 @@ from helium import (
     click,
     write,
     press,
-    wait_until,
     Text,
     Button,
     Link,
@@ -22,7 +20,6 @@ from helium import (
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 import sys
@@ -34,19 +31,37 @@ from config import (
     TEST_PASSWORD,
     TIMEOUT,
     SHORT_TIMEOUT,
-    MODULES
+    MODULES,
+    REUSE_SESSION,
 )
-from utils.browser import wait_for_page_load, wait_for_element, is_element_present
+from utils.browser import wait_for_page_load, wait_for_element, is_element_present, probing
+from utils.waits import settle
+from utils.locators import find_cached, remember_locator, forget_locator
+from utils.probe import probe, any_present, wait_for_probe
+from utils.session import capture_session, restore_session, clear_session
+from utils.perf import measure_view
 
 
-def login(username: str = None, password: str = None) -> bool:
+# User the browser is signed in as, whose cached session logout() drops
+_logged_in_user = None
+
+
+def login(username: str = None, password: str = None, fresh: bool = False) -> bool:
     """
     Perform login flow.
+    Reuses a cached session for the user when one exists and the server
+    still accepts it; pass fresh=True to always go through the login form.
     Returns True if login successful, False otherwise.
     """
+    global _logged_in_user
     username = username or TEST_USER
     password = password or TEST_PASSWORD
     
+    if REUSE_SESSION and not fresh and restore_session(username):
+        wait_for_page_load()
+        _logged_in_user = username
+        return True
+    
     try:
         go_to(LOGIN_URL)
         wait_for_page_load()
@@ -73,20 +88,33 @@ def login(username: str = None, password: str = None) -> bool:
             write(password, into=TextField(below=TextField()))
         
         # Click login button
-        time.sleep(0.3)
+        settle(0.3)
         login_btn = wait_for_element("button[type='submit']")
         if login_btn:
             login_btn.click()
         else:
             click(Button("Sign in"))
         
-        # Wait for redirect
-        time.sleep(2)
+        # Wait for the client-side redirect itself: the page can go idle
+        # before router.push runs. A failed login never leaves, hence the bound.
+        try:
+            WebDriverWait(get_driver(), SHORT_TIMEOUT).until(
+                lambda driver: "/auth/login" not in driver.current_url
+            )
+        except TimeoutException:
+            pass
         wait_for_page_load()
         
         # Check if we're logged in (no longer on login page)
         current_url = get_driver().current_url
-        return "/auth/login" not in current_url
+        logged_in = "/auth/login" not in current_url
+        
+        if logged_in:
+            _logged_in_user = username
+            if REUSE_SESSION:
+                capture_session(username)
+        
+        return logged_in
         
     except Exception as e:
         print(f"Login failed: {e}")
@@ -98,44 +126,76 @@ def logout() -> bool:
     Perform logout.
     Returns True if logout successful.
     """
+    global _logged_in_user
+    
+    if not _sign_out():
+        return False
+    
+    # Server-side session is ended, so that user's cached cookies are no longer usable
+    if _logged_in_user is not None:
+        clear_session(_logged_in_user)
+        _logged_in_user = None
+    return True
+
+
+def _sign_out() -> bool:
     try:
-        # Try various logout button selectors
-        logout_selectors = [
-            "button:has-text('Sign out')",
-            "button:has-text('Logout')",
-            "button:has-text('Sign Out')",
-            "[data-testid='logout']",
-        ]
-        
-        for selector in logout_selectors:
-            try:
-                if Button("Sign out").exists():
-                    click(Button("Sign out"))
-                    time.sleep(1)
-                    wait_for_page_load()
-                    return True
-            except:
-                continue
-        
-        # Try clicking by text
-        if Text("Sign out").exists():
-            click(Text("Sign out"))
-            time.sleep(1)
-            wait_for_page_load()
-            return True
+        # Existence checks: don't block on the implicit wait
+        with probing():
+            # Try various logout button selectors
+            logout_selectors = [
+                "button:has-text('Sign out')",
+                "button:has-text('Logout')",
+                "button:has-text('Sign Out')",
+                "[data-testid='logout']",
+            ]
+            
+            for selector in logout_selectors:
+                try:
+                    if Button("Sign out").exists():
+                        click(Button("Sign out"))
+                        settle(1)
+                        wait_for_page_load()
+                        return True
+                except:
+                    continue
+            
+            # Try clicking by text
+            if Text("Sign out").exists():
+                click(Text("Sign out"))
+                settle(1)
+                wait_for_page_load()
+                return True
+            
+            return False
             
-        return False
-        
     except Exception as e:
         print(f"Logout failed: {e}")
         return False
 
 
+# Module last navigated to; scopes locator cache keys for tabs and fields
+_current_module = None
+
+
 def navigate_to_module(module_name: str) -> bool:
     """
     Click sidebar to navigate to a module.
+    Tries the locator cached from a previous run first, then the full search.
+    Checks the module view against its performance budget, if any.
     Returns True if navigation successful.
     """
+    global _current_module
+    _current_module = module_name
+    
+    if not _open_module(module_name):
+        return False
+    
+    measure_view(module_name)
+    return True
+
+
+def _open_module(module_name: str) -> bool:
     try:
         # First ensure we're at the main app
         current_url = get_driver().current_url
@@ -143,17 +203,30 @@ def navigate_to_module(module_name: str) -> bool:
             go_to(BASE_URL)
             wait_for_page_load()
         
-        time.sleep(0.5)
+        settle(0.5)
         
         # Look for the module in sidebar navigation
         # Try various selector patterns
         driver = get_driver()
+        cache_key = ("nav", module_name)
+        
+        # Try the locator that resolved last time, without implicit wait
+        cached = find_cached(driver, cache_key)
+        if cached:
+            try:
+                cached.click()
+                settle(0.5)
+                wait_for_page_load()
+                return True
+            except:
+                forget_locator(cache_key)
         
         # Try clicking by button text
         try:
             if Button(module_name).exists():
+                remember_locator(driver, cache_key, "button", Button(module_name).web_element)
                 click(Button(module_name))
-                time.sleep(0.5)
+                settle(0.5)
                 wait_for_page_load()
                 return True
         except:
@@ -162,8 +235,9 @@ def navigate_to_module(module_name: str) -> bool:
         # Try clicking by link text
         try:
             if Link(module_name).exists():
+                remember_locator(driver, cache_key, "link", Link(module_name).web_element)
                 click(Link(module_name))
-                time.sleep(0.5)
+                settle(0.5)
                 wait_for_page_load()
                 return True
         except:
@@ -172,8 +246,9 @@ def navigate_to_module(module_name: str) -> bool:
         # Try clicking by text content
         try:
             if Text(module_name).exists():
+                remember_locator(driver, cache_key, "text", Text(module_name).web_element)
                 click(Text(module_name))
-                time.sleep(0.5)
+                settle(0.5)
                 wait_for_page_load()
                 return True
         except:
@@ -184,8 +259,9 @@ def navigate_to_module(module_name: str) -> bool:
             elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{module_name}')]")
             for elem in elements:
                 if elem.is_displayed():
+                    remember_locator(driver, cache_key, "xpath_text", elem)
                     elem.click()
-                    time.sleep(0.5)
+                    settle(0.5)
                     wait_for_page_load()
                     return True
         except:
@@ -201,19 +277,41 @@ def navigate_to_module(module_name: str) -> bool:
 def click_tab(tab_name: str) -> bool:
     """
     Click a tab within a module.
+    Tries the locator cached from a previous run first, then the full search.
+    Checks the tab view against its performance budget, if any.
     Returns True if successful.
     """
+    if not _open_tab(tab_name):
+        return False
+    
+    measure_view(_current_module, tab_name)
+    return True
+
+
+def _open_tab(tab_name: str) -> bool:
     try:
-        time.sleep(0.3)
+        settle(0.3)
         
         # Try various approaches
         driver = get_driver()
+        cache_key = (_current_module, "tab", tab_name)
+        
+        # Try the locator that resolved last time, without implicit wait
+        cached = find_cached(driver, cache_key, require_enabled=True)
+        if cached:
+            try:
+                cached.click()
+                settle(0.5)
+                return True
+            except:
+                forget_locator(cache_key)
         
         # Try button
         try:
             if Button(tab_name).exists():
+                remember_locator(driver, cache_key, "button", Button(tab_name).web_element)
                 click(Button(tab_name))
-                time.sleep(0.5)
+                settle(0.5)
                 return True
         except:
             pass
@@ -221,8 +319,9 @@ def click_tab(tab_name: str) -> bool:
         # Try text
         try:
             if Text(tab_name).exists():
+                remember_locator(driver, cache_key, "text", Text(tab_name).web_element)
                 click(Text(tab_name))
-                time.sleep(0.5)
+                settle(0.5)
                 return True
         except:
             pass
@@ -231,8 +330,9 @@ def click_tab(tab_name: str) -> bool:
         try:
             tab = driver.find_element(By.XPATH, f"//button[@role='tab' and contains(text(), '{tab_name}')]")
             if tab.is_displayed():
+                remember_locator(driver, cache_key, "role_tab", tab)
                 tab.click()
-                time.sleep(0.5)
+                settle(0.5)
                 return True
         except:
             pass
@@ -242,8 +342,9 @@ def click_tab(tab_name: str) -> bool:
             elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{tab_name}')]")
             for elem in elements:
                 if elem.is_displayed() and elem.is_enabled():
+                    remember_locator(driver, cache_key, "xpath_text", elem)
                     elem.click()
-                    time.sleep(0.5)
+                    settle(0.5)
                     return True
         except:
             pass
@@ -259,6 +360,7 @@ def fill_form(field_data: Dict[str, Any]) -> bool:
     """
     Fill form fields from dict.
     Keys are field labels/names, values are what to enter.
+    Each field tries its locator cached from a previous run first.
     Returns True if all fields filled successfully.
     """
     try:
@@ -266,13 +368,26 @@ def fill_form(field_data: Dict[str, Any]) -> bool:
         success = True
         
         for field_name, value in field_data.items():
+            cache_key = (_current_module, "field", field_name)
+            
             try:
+                # Try the locator that resolved last time, without implicit wait
+                cached = find_cached(driver, cache_key)
+                if cached:
+                    try:
+                        cached.clear()
+                        cached.send_keys(str(value))
+                        continue
+                    except:
+                        forget_locator(cache_key)
+                
                 # Try by label
                 try:
                     label = driver.find_element(By.XPATH, f"//label[contains(text(), '{field_name}')]")
                     field_id = label.get_attribute("for")
                     if field_id:
                         field = driver.find_element(By.ID, field_id)
+                        remember_locator(driver, cache_key, "label", field)
                         field.clear()
                         field.send_keys(str(value))
                         continue
@@ -282,6 +397,7 @@ def fill_form(field_data: Dict[str, Any]) -> bool:
                 # Try by placeholder
                 try:
                     field = driver.find_element(By.XPATH, f"//input[@placeholder='{field_name}' or contains(@placeholder, '{field_name}')]")
+                    remember_locator(driver, cache_key, "placeholder", field)
                     field.clear()
                     field.send_keys(str(value))
                     continue
@@ -291,6 +407,7 @@ def fill_form(field_data: Dict[str, Any]) -> bool:
                 # Try by name attribute
                 try:
                     field = driver.find_element(By.NAME, field_name)
+                    remember_locator(driver, cache_key, "name", field)
                     field.clear()
                     field.send_keys(str(value))
                     continue
@@ -299,7 +416,9 @@ def fill_form(field_data: Dict[str, Any]) -> bool:
                 
                 # Try Helium TextField
                 try:
-                    write(str(value), into=TextField(field_name))
+                    text_field = TextField(field_name)
+                    write(str(value), into=text_field)
+                    remember_locator(driver, cache_key, "text_field", text_field.web_element)
                     continue
                 except:
                     pass
@@ -325,7 +444,7 @@ def click_button(text: str) -> bool:
     try:
         if Button(text).exists():
             click(Button(text))
-            time.sleep(0.3)
+            settle(0.3)
             return True
         
         # Try with contains
@@ -334,7 +453,7 @@ def click_button(text: str) -> bool:
         for btn in buttons:
             if btn.is_displayed() and btn.is_enabled():
                 btn.click()
-                time.sleep(0.3)
+                settle(0.3)
                 return True
         
         return False
@@ -369,55 +488,141 @@ def get_table_rows() -> List[Any]:
         return []
 
 
+# Serializes a <table> or ARIA grid into headers + column arrays in-page.
+# Rows are sliced by offset/limit so large tables can be read in chunks.
+TABLE_READ_JS = """
+const [rootSelector, offset, limit] = arguments;
+const text = el => (el.innerText || el.textContent || '').trim();
+
+let root = rootSelector ? document.querySelector(rootSelector) : null;
+if (!root) root = document.querySelector('table') || document.querySelector("[role='grid'], [role='table']");
+if (!root) return null;
+
+let headers, rows, cellsOf;
+if (root.tagName === 'TABLE') {
+    cellsOf = row => Array.from(row.children).filter(c => c.tagName === 'TD' || c.tagName === 'TH');
+    // Without a thead the first row is a header only if it is all <th>; otherwise it is data
+    let headerRow = root.querySelector('thead tr');
+    if (!headerRow) {
+        const first = root.querySelector('tr');
+        const firstCells = first ? cellsOf(first) : [];
+        if (firstCells.length && firstCells.every(c => c.tagName === 'TH')) headerRow = first;
+    }
+    headers = headerRow ? Array.from(headerRow.querySelectorAll('th')).map(text) : [];
+    rows = Array.from(root.querySelectorAll('tbody tr'));
+    if (!rows.length) rows = Array.from(root.querySelectorAll('tr'));
+    // The parser puts a thead-less table's rows in an implicit tbody, header included
+    rows = rows.filter(r => r !== headerRow);
+} else {
+    headers = Array.from(root.querySelectorAll("[role='columnheader']")).map(text);
+    rows = Array.from(root.querySelectorAll("[role='row']"))
+        .filter(r => r.querySelector("[role='cell'], [role='gridcell']"));
+    cellsOf = row => Array.from(row.querySelectorAll("[role='cell'], [role='gridcell']"));
+}
+
+const total = rows.length;
+const slice = rows.slice(offset, limit === null ? undefined : offset + limit);
+const cells = slice.map(row => cellsOf(row).map(text));
+const width = cells.reduce((w, c) => Math.max(w, c.length), headers.length);
+for (let i = headers.length; i < width; i++) headers.push('Column ' + (i + 1));
+
+const columns = headers.map((_, col) => cells.map(row => col < row.length ? row[col] : null));
+return {headers: headers, columns: columns, row_count: slice.length, total_rows: total, offset: offset};
+"""
+
+
+def read_table(
+    selector: str = None,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Read a table's cell text in a single browser round-trip.
+    Handles `table tbody tr` tables and `[role='row']` grids. Defaults to
+    the first table/grid on the page; pass selector to pick another.
+    
+    Returns columnar data, or None if no table was found:
+        {
+            "headers": ["Machine ID", "Make", ...],
+            "columns": [["M-01", "M-02", ...], ["JSW", "JSW", ...], ...],
+            "row_count": rows returned,
+            "total_rows": rows in the table,
+            "offset": index of the first row returned,
+        }
+    Missing cells are None.
+    """
+    try:
+        return get_driver().execute_script(TABLE_READ_JS, selector, offset, limit)
+    except Exception as e:
+        print(f"Read table failed: {e}")
+        return None
+
+
+def iter_table_chunks(selector: str = None, chunk_size: int = 500):
+    """
+    Stream a large table as a sequence of read_table() chunks of at most
+    chunk_size rows, so each payload stays small.
+    """
+    offset = 0
+    while True:
+        chunk = read_table(selector, offset=offset, limit=chunk_size)
+        if not chunk or chunk["row_count"] == 0:
+            return
+        yield chunk
+        offset += chunk["row_count"]
+        if offset >= chunk["total_rows"]:
+            return
+
+
+def table_records(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Convert read_table() columnar data into a list of row dicts.
+    """
+    if not table:
+        return []
+    return [dict(zip(table["headers"], row)) for row in zip(*table["columns"])]
+
+
 def get_table_row_count() -> int:
     """
     Get count of table rows.
+    Counted in the browser without fetching row elements.
     """
-    return len(get_table_rows())
+    table = read_table(limit=0)
+    return table["total_rows"] if table else 0
 
 
 def wait_for_toast(message: str = None, timeout: int = SHORT_TIMEOUT) -> bool:
     """
     Wait for success/error toast notification.
+    All toast selectors (and the message text) are checked in one probe
+    per poll rather than waiting on each selector in turn.
     Returns True if toast appeared.
     """
-    try:
-        driver = get_driver()
-        
-        # Common toast selectors
-        toast_selectors = [
-            "[role='alert']",
-            ".toast",
-            ".notification",
-            "[class*='toast']",
-            "[class*='alert']",
-        ]
-        
-        for selector in toast_selectors:
-            try:
-                WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                
-                if message:
-                    toast = driver.find_element(By.CSS_SELECTOR, selector)
-                    if message.lower() in toast.text.lower():
-                        return True
-                else:
-                    return True
-            except TimeoutException:
+    # Common toast selectors
+    toast_selectors = [
+        "[role='alert']",
+        ".toast",
+        ".notification",
+        "[class*='toast']",
+        "[class*='alert']",
+    ]
+    texts = [message] if message else []
+    
+    def toast_found(result):
+        for toast in result["selectors"].values():
+            if not toast["present"]:
                 continue
-        
-        # Try with text
-        if message:
-            try:
-                wait_until(Text(message).exists, timeout_secs=timeout)
+            if not message:
+                return True
+            if any(message.lower() in text.lower() for text in toast["texts"]):
                 return True
-            except:
-                pass
-        
-        return False
         
+        # Fall back to the message anywhere on the page
+        return bool(message) and result["texts"][message]["visible"]
+    
+    try:
+        return wait_for_probe(toast_selectors, texts, condition=toast_found, timeout=timeout) is not None
     except Exception as e:
         print(f"Wait for toast failed: {e}")
         return False
@@ -429,42 +634,42 @@ def close_modal() -> bool:
     Returns True if modal was closed.
     """
     try:
-        driver = get_driver()
-        
-        # Try clicking X button
-        close_selectors = [
-            "button[aria-label='Close']",
-            "button.close",
-            "[class*='modal'] button:has(svg)",
-            "[role='dialog'] button:first-child",
-        ]
-        
-        for selector in close_selectors:
+        # Existence checks: don't block on the implicit wait
+        with probing() as driver:
+            # Try clicking X button
+            close_selectors = [
+                "button[aria-label='Close']",
+                "button.close",
+                "[class*='modal'] button:has(svg)",
+                "[role='dialog'] button:first-child",
+            ]
+            
+            for selector in close_selectors:
+                try:
+                    close_btn = driver.find_element(By.CSS_SELECTOR, selector)
+                    if close_btn.is_displayed():
+                        close_btn.click()
+                        settle(0.3)
+                        return True
+                except:
+                    continue
+            
+            # Try clicking Cancel button
+            if Button("Cancel").exists():
+                click(Button("Cancel"))
+                settle(0.3)
+                return True
+            
+            # Try pressing Escape
             try:
-                close_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                if close_btn.is_displayed():
-                    close_btn.click()
-                    time.sleep(0.3)
-                    return True
+                press(Keys.ESCAPE)
+                settle(0.3)
+                return True
             except:
-                continue
-        
-        # Try clicking Cancel button
-        if Button("Cancel").exists():
-            click(Button("Cancel"))
-            time.sleep(0.3)
-            return True
-        
-        # Try pressing Escape
-        try:
-            press(Keys.ESCAPE)
-            time.sleep(0.3)
-            return True
-        except:
-            pass
-        
-        return False
-        
+                pass
+            
+            return False
+            
     except Exception as e:
         print(f"Close modal failed: {e}")
         return False
@@ -474,28 +679,14 @@ def is_modal_open() -> bool:
     """
     Check if a modal is currently open.
     """
-    try:
-        driver = get_driver()
-        
-        modal_selectors = [
-            "[role='dialog']",
-            ".modal.show",
-            "[class*='modal'][class*='open']",
-            "[class*='Modal']",
-        ]
-        
-        for selector in modal_selectors:
-            try:
-                modal = driver.find_element(By.CSS_SELECTOR, selector)
-                if modal.is_displayed():
-                    return True
-            except:
-                continue
-        
-        return False
-        
-    except:
-        return False
+    modal_selectors = [
+        "[role='dialog']",
+        ".modal.show",
+        "[class*='modal'][class*='open']",
+        "[class*='Modal']",
+    ]
+    
+    return any_present(selectors=modal_selectors, visible=True)
 
 
 def click_add_button() -> bool:
@@ -558,31 +749,31 @@ def get_input_value(field_name: str) -> str:
     Get current value of an input field.
     """
     try:
-        driver = get_driver()
-        
-        # Try by name
-        try:
-            field = driver.find_element(By.NAME, field_name)
-            return field.get_attribute("value") or ""
-        except:
-            pass
-        
-        # Try by id
-        try:
-            field = driver.find_element(By.ID, field_name)
-            return field.get_attribute("value") or ""
-        except:
-            pass
-        
-        # Try by placeholder
-        try:
-            field = driver.find_element(By.XPATH, f"//input[@placeholder='{field_name}']")
-            return field.get_attribute("value") or ""
-        except:
-            pass
-        
-        return ""
-        
+        # Existence checks: don't block on the implicit wait
+        with probing() as driver:
+            # Try by name
+            try:
+                field = driver.find_element(By.NAME, field_name)
+                return field.get_attribute("value") or ""
+            except:
+                pass
+            
+            # Try by id
+            try:
+                field = driver.find_element(By.ID, field_name)
+                return field.get_attribute("value") or ""
+            except:
+                pass
+            
+            # Try by placeholder
+            try:
+                field = driver.find_element(By.XPATH, f"//input[@placeholder='{field_name}']")
+                return field.get_attribute("value") or ""
+            except:
+                pass
+            
+            return ""
+            
     except:
         return ""
 
@@ -591,31 +782,18 @@ def has_validation_error() -> bool:
     """
     Check if there are validation errors on the page.
     """
-    try:
-        driver = get_driver()
-        
-        error_selectors = [
-            ".error",
-            "[class*='error']",
-            "[class*='invalid']",
-            ".text-red-500",
-            ".text-danger",
-            "[aria-invalid='true']",
-        ]
-        
-        for selector in error_selectors:
-            try:
-                errors = driver.find_elements(By.CSS_SELECTOR, selector)
-                for error in errors:
-                    if error.is_displayed() and error.text.strip():
-                        return True
-            except:
-                continue
-        
-        return False
-        
-    except:
-        return False
+    error_selectors = [
+        ".error",
+        "[class*='error']",
+        "[class*='invalid']",
+        ".text-red-500",
+        ".text-danger",
+        "[aria-invalid='true']",
+    ]
+    
+    # A visible match with non-empty text counts as an error message
+    result = probe(selectors=error_selectors)
+    return any(error["text"] for error in result["selectors"].values())
 
 
 def get_page_title() -> str:
@@ -623,19 +801,19 @@ def get_page_title() -> str:
     Get the page title or main heading.
     """
     try:
-        driver = get_driver()
-        
-        # Try h1
-        try:
-            h1 = driver.find_element(By.TAG_NAME, "h1")
-            if h1.text:
-                return h1.text
-        except:
-            pass
-        
-        # Try document title
-        return driver.title
-        
+        # Existence checks: don't block on the implicit wait
+        with probing() as driver:
+            # Try h1
+            try:
+                h1 = driver.find_element(By.TAG_NAME, "h1")
+                if h1.text:
+                    return h1.text
+            except:
+                pass
+            
+            # Try document title
+            return driver.title
+            
     except:
         return ""
 
@@ -0,0 +1,354 @@
+"""
+Historical run database for Helium tests
+
+Appends every run's per-test results to a local SQLite store and answers
+duration percentile queries (p50/p90/p99) per test and per module across
+the last N runs, so app-side slowdowns show up as soon as they land. Page
+level metrics (vitals, API timings, budgeted views) are stored per test as
+well, and runs can be named as baselines for regression detection.
+"""
+import sqlite3
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import BASE_DIR, HISTORY_DB, HISTORY_RUNS
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started_at  TEXT NOT NULL,
+    git_sha     TEXT,
+    workers     INTEGER,
+    total       INTEGER,
+    passed      INTEGER,
+    failed      INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    module      TEXT NOT NULL,
+    test_name   TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    duration    REAL NOT NULL,
+    error_class TEXT,
+    worker      INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    module      TEXT NOT NULL,
+    test_name   TEXT NOT NULL,
+    metric      TEXT NOT NULL,
+    value       REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS baselines (
+    name        TEXT PRIMARY KEY,
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    saved_at    TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_results_test ON results(module, test_name);
+CREATE INDEX IF NOT EXISTS idx_metrics_run ON metrics(run_id);
+"""
+
+# Vitals and network fields stored as metrics (all lower-is-better)
+VITALS_METRICS = ["ttfb", "dom_content_loaded", "load", "fcp", "lcp", "cls", "tbt"]
+NETWORK_METRICS = ["api_requests", "api_bytes", "slowest_ms"]
+
+
+@contextmanager
+def connect(db_path: Path = HISTORY_DB):
+    """
+    Open the history database, creating tables on first use.
+    Commits on success and always closes the connection.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.executescript(SCHEMA)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_git_sha() -> Optional[str]:
+    """
+    Return the short SHA of the checked-out commit, or None outside git.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=str(BASE_DIR),
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def result_metrics(result: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flatten one result's measurements into {metric: value}: duration,
+    vitals.<field>, network.<field> and "<view> <metric>" for budgeted
+    views. Failed and skipped tests have no meaningful timings and yield {}.
+    """
+    if result["status"] not in ("PASS", "PERF_FAIL"):
+        return {}
+
+    metrics = {"duration": float(result.get("duration") or 0)}
+
+    for prefix, fields in (("vitals", VITALS_METRICS), ("network", NETWORK_METRICS)):
+        source = result.get(prefix) or {}
+        for field in fields:
+            if source.get(field) is not None:
+                metrics[f"{prefix}.{field}"] = float(source[field])
+
+    for view in result.get("views") or []:
+        for metric, value in view["metrics"].items():
+            if value is not None:
+                metrics[f"{view['view']} {metric}"] = float(value)
+
+    return metrics
+
+
+def record_run(
+    run_id: str,
+    results: List[Dict[str, Any]],
+    started_at: Optional[datetime] = None,
+    workers: int = 1,
+    db_path: Path = HISTORY_DB
+) -> None:
+    """
+    Append a run and its per-test results to the history database.
+    Re-recording the same run_id replaces its earlier rows.
+    """
+    started_at = started_at or datetime.now()
+
+    with connect(db_path) as conn:
+        conn.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+        conn.execute("DELETE FROM metrics WHERE run_id = ?", (run_id,))
+        conn.execute(
+            "INSERT OR REPLACE INTO runs (run_id, started_at, git_sha, workers, total, passed, failed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                started_at.strftime("%Y-%m-%d %H:%M:%S"),
+                get_git_sha(),
+                workers,
+                len(results),
+                sum(1 for r in results if r["status"] == "PASS"),
+                sum(1 for r in results if r["status"] in ("FAIL", "PERF_FAIL")),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO results (run_id, module, test_name, status, duration, error_class, worker) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    run_id,
+                    r["module"],
+                    r["test_name"],
+                    r["status"],
+                    float(r.get("duration") or 0),
+                    r.get("error_class"),
+                    r.get("worker"),
+                )
+                for r in results
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO metrics (run_id, module, test_name, metric, value) VALUES (?, ?, ?, ?, ?)",
+            [
+                (run_id, r["module"], r["test_name"], metric, value)
+                for r in results
+                for metric, value in result_metrics(r).items()
+            ],
+        )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def recent_run_ids(last_n: int = HISTORY_RUNS, db_path: Path = HISTORY_DB) -> List[str]:
+    """
+    Return the ids of the last N runs, newest first.
+    """
+    with connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT run_id FROM runs ORDER BY started_at DESC, run_id DESC LIMIT ?",
+            (last_n,),
+        ).fetchall()
+    return [row["run_id"] for row in rows]
+
+
+def duration_percentiles(
+    by: str = "test",
+    last_n: int = HISTORY_RUNS,
+    db_path: Path = HISTORY_DB
+) -> List[Dict[str, Any]]:
+    """
+    Duration percentiles across the last N runs, grouped by test or module.
+    Skipped tests are excluded.
+
+    Returns list of dicts with keys: module, test_name (by="test" only),
+    runs, samples, p50, p90, p99, latest.
+    """
+    if by not in ("test", "module"):
+        raise ValueError(f"by must be 'test' or 'module', got {by!r}")
+
+    run_ids = recent_run_ids(last_n, db_path)
+    if not run_ids:
+        return []
+
+    placeholders = ",".join("?" for _ in run_ids)
+    with connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT r.run_id, r.module, r.test_name, r.duration FROM results r "
+            f"JOIN runs ON runs.run_id = r.run_id "
+            f"WHERE r.run_id IN ({placeholders}) AND r.status != 'SKIP' "
+            f"ORDER BY runs.started_at, r.id",
+            run_ids,
+        ).fetchall()
+
+    latest_run = run_ids[0]
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = (row["module"], row["test_name"]) if by == "test" else (row["module"],)
+        group = groups.setdefault(key, {"samples": [], "per_run": {}})
+        group["samples"].append(row["duration"])
+        if by == "test":
+            group["per_run"][row["run_id"]] = row["duration"]
+        else:
+            per_test = group["per_run"].setdefault(row["run_id"], {})
+            per_test.setdefault(row["test_name"], []).append(row["duration"])
+
+    stats = []
+    for key, group in groups.items():
+        if by == "module":
+            # Module total per run; repeated tests (--repeat) count once, at their mean
+            group["per_run"] = {
+                run_id: sum(sum(d) / len(d) for d in per_test.values())
+                for run_id, per_test in group["per_run"].items()
+            }
+
+        # Tests use individual samples; modules use per-run totals
+        durations = group["samples"] if by == "test" else list(group["per_run"].values())
+
+        entry = {"module": key[0]}
+        if by == "test":
+            entry["test_name"] = key[1]
+        entry.update({
+            "runs": len(group["per_run"]),
+            "samples": len(durations),
+            "p50": percentile(durations, 50),
+            "p90": percentile(durations, 90),
+            "p99": percentile(durations, 99),
+            "latest": group["per_run"].get(latest_run),
+        })
+        stats.append(entry)
+
+    return stats
+
+
+def get_test_durations(
+    module: str,
+    test_name: str,
+    last_n: int = HISTORY_RUNS,
+    db_path: Path = HISTORY_DB
+) -> List[float]:
+    """
+    Return one test's durations across the last N runs, oldest first.
+    """
+    run_ids = recent_run_ids(last_n, db_path)
+    if not run_ids:
+        return []
+
+    placeholders = ",".join("?" for _ in run_ids)
+    with connect(db_path) as conn:
+        rows = conn.execute(
+            f"SELECT r.duration FROM results r JOIN runs ON runs.run_id = r.run_id "
+            f"WHERE r.module = ? AND r.test_name = ? AND r.run_id IN ({placeholders}) "
+            f"AND r.status != 'SKIP' ORDER BY runs.started_at, r.id",
+            [module, test_name, *run_ids],
+        ).fetchall()
+    return [row["duration"] for row in rows]
+
+
+def get_run_metrics(run_id: str, db_path: Path = HISTORY_DB) -> Dict[tuple, List[float]]:
+    """
+    Return one run's metric samples as {(module, test_name, metric): [values]}.
+    Repeated tests contribute one sample per repetition.
+    """
+    with connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT module, test_name, metric, value FROM metrics WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        ).fetchall()
+
+    samples: Dict[tuple, List[float]] = {}
+    for row in rows:
+        samples.setdefault((row["module"], row["test_name"], row["metric"]), []).append(row["value"])
+    return samples
+
+
+def get_run_results(run_id: str, db_path: Path = HISTORY_DB) -> List[Dict[str, Any]]:
+    """
+    Return one recorded run's per-test results (module, test_name, status,
+    duration, error_class, worker) in recorded order.
+    """
+    with connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT module, test_name, status, duration, error_class, worker FROM results "
+            "WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def save_baseline(name: str, run_id: str, db_path: Path = HISTORY_DB) -> None:
+    """
+    Name a recorded run as a baseline, replacing any run saved under that name.
+    """
+    with connect(db_path) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO baselines (name, run_id, saved_at) VALUES (?, ?, ?)",
+            (name, run_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        )
+
+
+def resolve_baseline(name_or_run_id: str, db_path: Path = HISTORY_DB) -> Optional[str]:
+    """
+    Return the run_id for a baseline name, or the argument itself if it is
+    a recorded run_id. Returns None if neither exists.
+    """
+    with connect(db_path) as conn:
+        row = conn.execute("SELECT run_id FROM baselines WHERE name = ?", (name_or_run_id,)).fetchone()
+        if row:
+            return row["run_id"]
+        row = conn.execute("SELECT run_id FROM runs WHERE run_id = ?", (name_or_run_id,)).fetchone()
+    return row["run_id"] if row else None
@@ -0,0 +1,232 @@
+"""
+API load generator for the Next.js route handlers
+
+The UI suite drives one browser at a time, so it cannot show how the route
+handlers behave when a whole shift uses the app at once. This module logs
+in through /api/auth/login (the endpoint the login form posts to) and
+starts virtual users, each a thread with its own pooled requests.Session
+carrying the session cookie. Users start spread over a ramp-up period and
+replay a weighted scenario from load_scenarios.py with randomized think
+time until the run ends. Every request is recorded; summarize_load() gives
+throughput, p50/p95/p99 latency and error rate per route.
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BASE_URL,
+    LOGIN_API_URL,
+    LOAD_THINK_TIME,
+    LOAD_REQUEST_TIMEOUT,
+)
+from load_scenarios import SCENARIOS
+from utils.history import percentile
+
+
+SESSION_COOKIE = "session_token"
+TOTAL_ROUTE = "ALL"
+
+
+def api_login(username: str, password: str) -> Optional[str]:
+    """
+    Log in through the API and return the session token, or None.
+    """
+    try:
+        response = requests.post(
+            LOGIN_API_URL,
+            json={"username": username, "password": password},
+            timeout=LOAD_REQUEST_TIMEOUT,
+        )
+    except requests.RequestException as e:
+        print(f"API login failed: {e}")
+        return None
+
+    token = response.cookies.get(SESSION_COOKIE)
+    if response.status_code != 200 or not token:
+        print(f"API login failed: HTTP {response.status_code} {response.text[:200]}")
+        return None
+    return token
+
+
+def new_session(token: str) -> requests.Session:
+    """
+    Session for one virtual user: keep-alive connections and the auth cookie.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.cookies.set(SESSION_COOKIE, token)
+    return session
+
+
+def _resolve(value):
+    return value() if callable(value) else value
+
+
+def send_request(session: requests.Session, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send one scenario request and return its sample:
+    route, status, ms, bytes, ok, error, at (seconds since epoch at start).
+    """
+    route = request.get("name") or f"{request['method']} {request['path']}"
+    sample = {"route": route, "status": None, "ms": None, "bytes": 0, "ok": False, "error": None, "at": time.time()}
+
+    start = time.perf_counter()
+    try:
+        response = session.request(
+            request["method"],
+            f"{BASE_URL}{request['path']}",
+            params=_resolve(request.get("params")),
+            json=_resolve(request.get("json")),
+            timeout=LOAD_REQUEST_TIMEOUT,
+        )
+        sample["bytes"] = len(response.content)
+        sample["status"] = response.status_code
+        sample["ok"] = response.status_code < 400
+        if not sample["ok"]:
+            sample["error"] = f"HTTP {response.status_code}"
+    except requests.RequestException as e:
+        sample["error"] = type(e).__name__
+    sample["ms"] = (time.perf_counter() - start) * 1000
+
+    return sample
+
+
+def _virtual_user(
+    token: str,
+    scenario: List[Dict[str, Any]],
+    start_at: float,
+    stop_at: float,
+    think_time: float,
+    samples: List[Dict[str, Any]],
+    lock: threading.Lock,
+    seed: int
+) -> None:
+    """
+    Replay the scenario from start_at until stop_at.
+    """
+    rng = random.Random(seed)
+    weights = [request["weight"] for request in scenario]
+    time.sleep(max(0.0, start_at - time.time()))
+
+    with new_session(token) as session:
+        while time.time() < stop_at:
+            request = rng.choices(scenario, weights)[0]
+            sample = send_request(session, request)
+            with lock:
+                samples.append(sample)
+            # Think time uniformly spread around the mean
+            time.sleep(min(max(0.0, stop_at - time.time()), rng.uniform(0.5, 1.5) * think_time))
+
+
+def summarize_load(samples: List[Dict[str, Any]], seconds: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-route statistics, plus TOTAL_ROUTE for all requests.
+
+    Returns {route: dict with keys requests, errors, error_rate, throughput
+    (requests/s), p50_ms, p95_ms, p99_ms, max_ms, mean_ms, bytes, statuses}.
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for sample in samples:
+        groups.setdefault(sample["route"], []).append(sample)
+    groups[TOTAL_ROUTE] = samples
+
+    summary = {}
+    for route, group in groups.items():
+        times = [s["ms"] for s in group]
+        errors = sum(1 for s in group if not s["ok"])
+        statuses: Dict[str, int] = {}
+        for s in group:
+            key = str(s["status"]) if s["status"] is not None else s["error"]
+            statuses[key] = statuses.get(key, 0) + 1
+
+        summary[route] = {
+            "requests": len(group),
+            "errors": errors,
+            "error_rate": errors / len(group) if group else 0.0,
+            "throughput": len(group) / seconds if seconds else 0.0,
+            "p50_ms": percentile(times, 50),
+            "p95_ms": percentile(times, 95),
+            "p99_ms": percentile(times, 99),
+            "max_ms": max(times, default=0.0),
+            "mean_ms": sum(times) / len(times) if times else 0.0,
+            "bytes": sum(s["bytes"] for s in group),
+            "statuses": statuses,
+        }
+    return summary
+
+
+def run_load(
+    token: str,
+    scenario_name: str,
+    users: int,
+    duration: float,
+    ramp_up: float,
+    think_time: float = LOAD_THINK_TIME
+) -> Dict[str, Any]:
+    """
+    Run one scenario with users virtual users. Users start evenly over
+    ramp_up seconds and all stop duration seconds after the last one starts.
+
+    Returns dict with keys: scenario, users, duration, ramp_up, started,
+    seconds (wall time), samples, routes (summarize_load()).
+    """
+    scenario = SCENARIOS[scenario_name]
+    samples: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+
+    started = time.time()
+    stop_at = started + ramp_up + duration
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        futures = [
+            pool.submit(
+                _virtual_user, token, scenario,
+                started + ramp_up * index / users, stop_at,
+                think_time, samples, lock, index,
+            )
+            for index in range(users)
+        ]
+        for future in futures:
+            future.result()
+    seconds = time.time() - started
+
+    samples.sort(key=lambda s: s["at"])
+    return {
+        "scenario": scenario_name,
+        "users": users,
+        "duration": duration,
+        "ramp_up": ramp_up,
+        "started": started,
+        "seconds": seconds,
+        "samples": samples,
+        "routes": summarize_load(samples, seconds),
+    }
+
+
+def load_timeline(samples: List[Dict[str, Any]], started: float) -> List[Dict[str, Any]]:
+    """
+    Per-second buckets: second, requests, errors, p95_ms.
+    """
+    buckets: Dict[int, List[Dict[str, Any]]] = {}
+    for sample in samples:
+        buckets.setdefault(int(sample["at"] - started), []).append(sample)
+
+    return [
+        {
+            "second": second,
+            "requests": len(buckets.get(second, [])),
+            "errors": sum(1 for s in buckets.get(second, []) if not s["ok"]),
+            "p95_ms": percentile([s["ms"] for s in buckets.get(second, [])], 95),
+        }
+        for second in range(max(buckets, default=-1) + 1)
+    ]
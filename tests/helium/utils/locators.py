@@ -0,0 +1,197 @@
+"""
+Persistent locator strategy cache for Helium tests
+
+click_tab, navigate_to_module and fill_form search through several
+strategies (Button, Link, Text, XPath) and each miss can cost a full implicit
+wait. This cache remembers, per (module, kind, label), which strategy
+resolved last time and a concrete XPath for the element, so later lookups
+try that first with no implicit wait. A cached element is only used while it
+still carries its label, and entries are written to disk once, by
+save_cache() at the end of the run.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import LOCATOR_CACHE_FILE, LOCATOR_CACHE_MAX_MISSES
+from utils.browser import probing
+
+
+# Builds a stable XPath for an element: id, then identifying attributes,
+# then tag + exact text, each only if unique. Returns null rather than a
+# positional path, which would point at whatever moves into that slot.
+ELEMENT_XPATH_JS = """
+const el = arguments[0];
+const literal = s => s.indexOf("'") < 0 ? "'" + s + "'" : (s.indexOf('"') < 0 ? '"' + s + '"' : null);
+const isUnique = xp => document.evaluate(
+    'count(' + xp + ')', document, null, XPathResult.NUMBER_TYPE, null
+).numberValue === 1;
+const tag = el.tagName.toLowerCase();
+
+const candidates = [];
+if (el.id) candidates.push(['*', '@id', el.id]);
+for (const attr of ['data-testid', 'name', 'aria-label', 'placeholder']) {
+    if (el.getAttribute(attr)) candidates.push([tag, '@' + attr, el.getAttribute(attr)]);
+}
+const text = (el.textContent || '').replace(/\\s+/g, ' ').trim();
+if (text && text.length <= 80) candidates.push([tag, 'normalize-space(.)', text]);
+
+for (const [t, expr, value] of candidates) {
+    const lit = literal(value);
+    if (!lit) continue;
+    const xp = '//' + t + '[' + expr + '=' + lit + ']';
+    if (isUnique(xp)) return xp;
+}
+return null;
+"""
+
+# Whether an element still carries its label: in its text, aria-label,
+# placeholder, name or an associated <label> (case-insensitive, contains)
+LABEL_MATCHES_JS = """
+const el = arguments[0];
+const norm = s => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+const label = norm(arguments[1]);
+const texts = [el.textContent, el.getAttribute('aria-label'), el.getAttribute('placeholder'), el.getAttribute('name')];
+for (const l of el.labels || []) texts.push(l.textContent);
+return texts.some(t => norm(t).includes(label));
+"""
+
+_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_dirty = False
+
+
+def _cache_key(key: Tuple[str, ...]) -> str:
+    return "|".join(part or "" for part in key)
+
+
+def load_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    Load cache entries from disk (once per process).
+    """
+    global _cache
+
+    if _cache is None:
+        try:
+            with open(LOCATOR_CACHE_FILE) as f:
+                _cache = json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            _cache = {}
+
+    return _cache
+
+
+def _mark_dirty() -> None:
+    global _dirty
+    _dirty = True
+
+
+def _label_matches(driver, element, label: str) -> bool:
+    try:
+        return bool(driver.execute_script(LABEL_MATCHES_JS, element, label))
+    except Exception:
+        return False
+
+
+def save_cache() -> None:
+    """
+    Write cache entries to disk atomically if they changed since the last
+    save. Called once at the end of a run (or worker).
+    Parallel workers may overwrite each other; the cache is advisory.
+    """
+    global _dirty
+
+    if _cache is None or not _dirty:
+        return
+    _dirty = False
+
+    tmp_path = LOCATOR_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"entries": _cache}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, LOCATOR_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not save locator cache: {e}")
+
+
+def remember_locator(driver, key: Tuple[str, ...], strategy: str, element) -> None:
+    """
+    Record the strategy and a concrete XPath for an element found by the
+    full search. Skipped when the element has no stable XPath or does not
+    carry its label (key[-1]), since a later hit could not be verified.
+    """
+    label = key[-1]
+    try:
+        selector = driver.execute_script(ELEMENT_XPATH_JS, element)
+    except Exception:
+        return
+    if not selector or not _label_matches(driver, element, label):
+        return
+
+    cache = load_cache()
+    entry = cache.get(_cache_key(key))
+    if entry and entry["selector"] == selector and entry["misses"] == 0:
+        return
+
+    cache[_cache_key(key)] = {
+        "strategy": strategy,
+        "selector": selector,
+        "label": label,
+        "misses": 0,
+        "updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    _mark_dirty()
+
+
+def find_cached(driver, key: Tuple[str, ...], require_enabled: bool = False):
+    """
+    Look up an element via its cached XPath with no implicit wait.
+    Returns the first displayed match that still carries the entry's label,
+    or None on a miss. Entries that miss LOCATOR_CACHE_MAX_MISSES times in
+    a row are invalidated; entries without a label (older cache files) are
+    dropped.
+    """
+    cache = load_cache()
+    entry = cache.get(_cache_key(key))
+    if not entry:
+        return None
+    if not entry.get("label"):
+        forget_locator(key)
+        return None
+
+    found = None
+    try:
+        with probing():
+            for element in driver.find_elements(By.XPATH, entry["selector"]):
+                if (element.is_displayed() and (not require_enabled or element.is_enabled())
+                        and _label_matches(driver, element, entry["label"])):
+                    found = element
+                    break
+    except Exception:
+        pass
+
+    if found is not None:
+        if entry["misses"]:
+            entry["misses"] = 0
+            _mark_dirty()
+        return found
+
+    entry["misses"] += 1
+    if entry["misses"] >= LOCATOR_CACHE_MAX_MISSES:
+        del cache[_cache_key(key)]
+    _mark_dirty()
+    return None
+
+
+def forget_locator(key: Tuple[str, ...]) -> None:
+    """
+    Drop a cache entry whose element was found but could not be used.
+    """
+    cache = load_cache()
+    if cache.pop(_cache_key(key), None) is not None:
+        _mark_dirty()
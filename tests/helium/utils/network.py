@@ -0,0 +1,219 @@
+"""
+Per-test network accounting for Helium tests
+
+Chrome's performance log carries the DevTools Network events for every
+request the page makes. The runner drains it before each test and parses it
+after, producing a per-test summary: request count, bytes, slowest API call,
+identical calls repeated within the test, and routes hit with many distinct
+URLs (N+1 patterns). API calls are grouped by route, with numeric and UUID
+path segments collapsed to ":id".
+"""
+import json
+import re
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import BASE_URL, NETWORK_CAPTURE, N_PLUS_ONE_THRESHOLD
+
+
+# Resource types issued by application code (as opposed to documents, scripts, images)
+API_TYPES = {"XHR", "Fetch"}
+
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24,})$",
+    re.IGNORECASE,
+)
+
+_app_host = urlsplit(BASE_URL).netloc
+
+
+def enable_network_capture(chrome_options) -> None:
+    """
+    Turn on Chrome's performance log (DevTools Network events).
+    Must be called on the options before the browser starts.
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def route_of(url: str) -> str:
+    """
+    Group a URL by route: drop the query and collapse id-like path segments,
+    e.g. /api/dpr/42?date=... -> /api/dpr/:id. Hosts other than the app
+    (Supabase, CDNs) are kept as a prefix.
+    """
+    parts = urlsplit(url)
+    path = "/".join(":id" if ID_SEGMENT.match(seg) else seg for seg in parts.path.split("/")) or "/"
+    return path if parts.netloc == _app_host else f"{parts.netloc}{path}"
+
+
+def _drain(driver) -> List[Dict[str, Any]]:
+    """
+    Read and clear buffered performance log entries.
+    """
+    try:
+        return driver.get_log("performance")
+    except Exception:
+        return []
+
+
+def reset_network() -> None:
+    """
+    Discard requests made before the current test. Called by the runner.
+    """
+    if not NETWORK_CAPTURE:
+        return
+
+    try:
+        _drain(get_driver())
+    except Exception:
+        pass
+
+
+def parse_requests(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Rebuild one record per request from raw performance log entries:
+    url, route, method, type, status, bytes, ms (None while in flight), failed.
+    """
+    requests: Dict[str, Dict[str, Any]] = {}
+
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+
+        method = message.get("method", "")
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+        if not request_id or not method.startswith("Network."):
+            continue
+
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            if not request["url"].startswith("http"):
+                continue
+            # Redirects reuse the request id; keep the final hop, first start time
+            previous = requests.get(request_id, {})
+            requests[request_id] = {
+                "url": request["url"],
+                "route": route_of(request["url"]),
+                "method": request["method"],
+                "body": request.get("postData"),
+                "type": params.get("type"),
+                "status": None,
+                "bytes": 0,
+                "start": previous.get("start", params["timestamp"]),
+                "ms": None,
+                "failed": False,
+            }
+            continue
+
+        record = requests.get(request_id)
+        if record is None:
+            continue
+
+        if method == "Network.responseReceived":
+            record["status"] = params["response"].get("status")
+            record["type"] = params.get("type", record["type"])
+        elif method == "Network.loadingFinished":
+            record["bytes"] = params.get("encodedDataLength", 0)
+            record["ms"] = (params["timestamp"] - record["start"]) * 1000
+        elif method == "Network.loadingFailed":
+            record["failed"] = True
+            record["ms"] = (params["timestamp"] - record["start"]) * 1000
+
+    return list(requests.values())
+
+
+def summarize_requests(
+    requests: List[Dict[str, Any]],
+    n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD
+) -> Dict[str, Any]:
+    """
+    Reduce request records to a per-test summary.
+
+    Returns dict with keys: requests, api_requests, bytes, api_bytes, failed,
+    slowest, slowest_ms, duplicates, duplicate_calls, n_plus_one,
+    n_plus_one_count, routes.
+    """
+    api_calls = [r for r in requests if r["type"] in API_TYPES]
+
+    routes: Dict[str, Dict[str, Any]] = {}
+    identical: Dict[tuple, int] = {}
+    for call in api_calls:
+        group = routes.setdefault(f"{call['method']} {call['route']}", {
+            "method": call["method"],
+            "route": call["route"],
+            "count": 0,
+            "urls": set(),
+            "bytes": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "statuses": {},
+        })
+        group["count"] += 1
+        group["urls"].add(call["url"])
+        group["bytes"] += call["bytes"]
+        group["total_ms"] += call["ms"] or 0
+        group["max_ms"] = max(group["max_ms"], call["ms"] or 0)
+        status = "failed" if call["failed"] else str(call["status"])
+        group["statuses"][status] = group["statuses"].get(status, 0) + 1
+
+        key = (call["method"], call["url"], call["body"])
+        identical[key] = identical.get(key, 0) + 1
+
+    duplicate_calls = sorted(
+        ({"method": method, "url": url, "count": count}
+         for (method, url, _), count in identical.items() if count > 1),
+        key=lambda d: d["count"],
+        reverse=True,
+    )
+
+    n_plus_one = []
+    for key, group in routes.items():
+        group["distinct"] = len(group.pop("urls"))
+        if group["distinct"] >= n_plus_one_threshold:
+            n_plus_one.append({"route": key, "calls": group["count"], "distinct": group["distinct"]})
+
+    timed = [c for c in api_calls if c["ms"] is not None]
+    slowest = max(timed, key=lambda c: c["ms"], default=None)
+
+    return {
+        "requests": len(requests),
+        "api_requests": len(api_calls),
+        "bytes": sum(r["bytes"] for r in requests),
+        "api_bytes": sum(c["bytes"] for c in api_calls),
+        "failed": sum(1 for r in requests if r["failed"] or (r["status"] or 0) >= 400),
+        "slowest": {
+            "method": slowest["method"],
+            "url": slowest["url"],
+            "status": slowest["status"],
+            "ms": slowest["ms"],
+        } if slowest else None,
+        "slowest_ms": slowest["ms"] if slowest else None,
+        "duplicates": sum(d["count"] - 1 for d in duplicate_calls),
+        "duplicate_calls": duplicate_calls,
+        "n_plus_one": n_plus_one,
+        "n_plus_one_count": len(n_plus_one),
+        "routes": routes,
+    }
+
+
+def collect_network() -> Optional[Dict[str, Any]]:
+    """
+    Parse requests made since reset_network() into a per-test summary.
+    Returns None if capture is off or the browser could not be queried.
+    """
+    if not NETWORK_CAPTURE:
+        return None
+
+    try:
+        entries = _drain(get_driver())
+    except Exception:
+        return None
+    return summarize_requests(parse_requests(entries))
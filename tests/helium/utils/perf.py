@@ -0,0 +1,173 @@
+"""
+Per-view performance budget checks for Helium tests
+
+navigate_to_module() and click_tab() call measure_view() once the view is
+open. If budgets.py has a budget for that (module, tab), the view's metrics
+are measured from the click that opened it, using the markers kept by the
+idle tracker, and compared against the budget. Views without a budget cost
+nothing. The runner turns a functionally passing test with breaches into
+PERF_FAIL.
+"""
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import SHORT_TIMEOUT, IDLE_QUIET_MS, IDLE_POLL_INTERVAL
+from budgets import BUDGETS
+from utils.waits import is_app_idle
+
+
+TIME_METRICS = ("time_to_table", "first_render")
+
+TABLE_SELECTOR = "table, [role='grid'], [role='table']"
+
+# Times are relative to the last click, or to navigation start if the click
+# loaded a new document
+VIEW_STATE_JS = """
+const state = window.__heliumIdle;
+if (!state) return null;
+const start = state.lastClick === null ? 0 : state.lastClick;
+const now = performance.now();
+return {
+    ready: document.readyState === 'complete',
+    pending: state.pending,
+    busy: !!document.querySelector('.animate-spin, [aria-busy="true"]'),
+    quietFor: now - state.lastMutation,
+    elapsed: now - start,
+    rendered: Math.max(0, state.lastMutation - start),
+    table: !!document.querySelector(arguments[0]),
+    api_calls: state.started - (state.lastClick === null ? 0 : state.clickStarted),
+};
+"""
+
+# Views measured during the current test
+_views: List[Dict[str, Any]] = []
+
+
+def budget_tab(module: str, tab: Optional[str]) -> Optional[str]:
+    """
+    Map a clicked tab label to its budgets.py key. Tests click tabs by a
+    short label ("Mould") while budgets use the full tab names from config
+    ("Mould Loading"): an exact key wins, else the only key starting with
+    the label (case-insensitive). Returns the label unchanged otherwise.
+    """
+    tabs = BUDGETS.get(module, {})
+    if tab is None or tab in tabs:
+        return tab
+    matches = [key for key in tabs if key != "*" and key.lower().startswith(tab.lower())]
+    return matches[0] if len(matches) == 1 else tab
+
+
+def get_view_budget(module: str, tab: Optional[str] = None) -> Dict[str, float]:
+    """
+    Return the budget for a module view ("*") or one of its tabs, or {}.
+    """
+    return BUDGETS.get(module, {}).get(budget_tab(module, tab) or "*", {})
+
+
+def view_name(module: str, tab: Optional[str] = None) -> str:
+    return f"{module}/{tab}" if tab else module
+
+
+def measure_view(module: str, tab: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Measure a just-opened view against its budget.
+    Waits at most twice the largest time budget (SHORT_TIMEOUT if only
+    api_calls is budgeted). A metric not reached in time counts as a breach.
+    Returns the view record, or None if the view has no budget or the
+    page has no idle tracker to measure with.
+    """
+    tab = budget_tab(module, tab)
+    budget = get_view_budget(module, tab)
+    if not budget:
+        return None
+
+    time_budgets = [budget[m] for m in TIME_METRICS if m in budget]
+    timeout = max(time_budgets) * 2 if time_budgets else SHORT_TIMEOUT
+    need_table = "time_to_table" in budget
+    need_idle = "first_render" in budget or "api_calls" in budget
+
+    metrics: Dict[str, Any] = {m: None for m in budget}
+    driver = get_driver()
+    deadline = time.time() + timeout
+
+    while True:
+        try:
+            state = driver.execute_script(VIEW_STATE_JS, TABLE_SELECTOR)
+        except Exception:
+            state = None
+        if state is None:
+            # No idle tracker on this page: nothing can be measured
+            return None
+
+        if need_table and metrics["time_to_table"] is None and state["table"]:
+            metrics["time_to_table"] = state["elapsed"] / 1000
+        if need_idle and is_app_idle(state, IDLE_QUIET_MS):
+            if "first_render" in budget:
+                metrics["first_render"] = state["rendered"] / 1000
+            if "api_calls" in budget:
+                metrics["api_calls"] = state["api_calls"]
+            need_idle = False
+
+        if not need_idle and (not need_table or metrics["time_to_table"] is not None):
+            break
+        if time.time() >= deadline:
+            # Never went idle: report the calls made so far
+            if "api_calls" in budget and metrics["api_calls"] is None:
+                metrics["api_calls"] = state["api_calls"]
+            break
+        time.sleep(IDLE_POLL_INTERVAL)
+
+    breaches = [
+        {
+            "view": view_name(module, tab),
+            "metric": metric,
+            "budget": limit,
+            "actual": metrics[metric],
+        }
+        for metric, limit in budget.items()
+        if metrics[metric] is None or metrics[metric] > limit
+    ]
+
+    view = {"view": view_name(module, tab), "metrics": metrics, "breaches": breaches}
+    _views.append(view)
+    return view
+
+
+def reset_views() -> None:
+    """
+    Forget measured views. Called by the runner before each test.
+    """
+    _views.clear()
+
+
+def get_views() -> List[Dict[str, Any]]:
+    """
+    Return the views measured during the current test.
+    """
+    return list(_views)
+
+
+def get_breaches() -> List[Dict[str, Any]]:
+    """
+    Return all budget breaches recorded during the current test.
+    """
+    return [breach for view in _views for breach in view["breaches"]]
+
+
+def format_breach(breach: Dict[str, Any]) -> str:
+    """
+    One-line description, e.g. "Production/DPR time_to_table 3.10s > 2.5s".
+    """
+    unit = "s" if breach["metric"] in TIME_METRICS else ""
+    if breach["actual"] is None:
+        actual = "not reached" if unit else "not measured"
+    elif unit:
+        actual = f"{breach['actual']:.2f}{unit}"
+    else:
+        actual = str(breach["actual"])
+    return f"{breach['view']} {breach['metric']} {actual} > {breach['budget']}{unit}"
@@ -0,0 +1,227 @@
+"""
+Prod Planner drag / resize benchmark for Helium tests
+
+Planners drag and resize production blocks all day, and the grid re-renders
+every block on each mouse move. This benchmark opens months seeded with a
+known number of blocks (PLANNER_BENCH_GRIDS, 10 / 50 / 200 per month),
+drags blocks across the calendar and resizes them in small steps, and
+records frame times and long tasks while each gesture runs (utils.frames).
+Every gesture ends where it started, so the seeded plans do not change.
+
+The months are seeded with SQL from planner_seed_sql(), run once against
+the test database (python run.py planner-bench --seed-sql FILE).
+"""
+import calendar
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+from helium import get_driver
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    MODULES,
+    TIMEOUT,
+    SHORT_TIMEOUT,
+    PLANNER_BENCH_GRIDS,
+    PLANNER_BENCH_GESTURES,
+    PLANNER_BENCH_STEPS,
+    PLANNER_BENCH_STEP_PX,
+    PLANNER_BENCH_STEP_MS,
+)
+from utils.helpers import navigate_to_module
+from utils.frames import measure_interaction, summarize_frames
+from utils.waits import wait_for_idle
+
+
+BLOCK_SELECTOR = "div.absolute.rounded-lg.cursor-move"
+RESIZE_HANDLE_SELECTOR = ".resize-handle-right"
+MONTH_LABEL_XPATH = (
+    "//h1[normalize-space()='Prod Planner']/following-sibling::div"
+    "//span[contains(@class, 'font-semibold')]"
+)
+
+# Seeded block ids start with this, so they can be removed in one statement
+SEED_ID_PREFIX = "bench-"
+SEED_COLORS = ["#E0F2FE", "#DCFCE7", "#FEF9C3", "#FCE7F3", "#EDE9FE"]
+
+GESTURES = ("drag", "resize")
+
+
+def planner_seed_sql(grids: Dict[int, Tuple[int, int]] = PLANNER_BENCH_GRIDS) -> str:
+    """
+    SQL that (re)creates the benchmark months: for each block count, that
+    many single-day blocks spread round-robin over all lines, then day by day.
+    """
+    statements = [
+        "-- Prod Planner drag/resize benchmark data (tests/helium run.py planner-bench)",
+        f"-- Remove with: DELETE FROM production_blocks WHERE id LIKE '{SEED_ID_PREFIX}%';",
+        f"DELETE FROM production_blocks WHERE id LIKE '{SEED_ID_PREFIX}%';",
+    ]
+    colors = ", ".join(f"'{c}'" for c in SEED_COLORS)
+
+    for count, (year, month) in sorted(grids.items()):
+        days = calendar.monthrange(year, month)[1]
+        statements.append(f"""
+-- {count} blocks in {calendar.month_name[month]} {year}
+WITH numbered AS (
+    SELECT line_id, ROW_NUMBER() OVER (ORDER BY line_id) - 1 AS idx, COUNT(*) OVER () AS total
+    FROM lines
+)
+INSERT INTO production_blocks (id, line_id, start_day, end_day, duration, label, color, planning_month, planning_year)
+SELECT
+    '{SEED_ID_PREFIX}{year}-{month:02d}-' || g,
+    l.line_id,
+    LPAD(((g / l.total) % {days} + 1)::TEXT, 2, '0') || '-{month:02d}-{year}',
+    LPAD(((g / l.total) % {days} + 1)::TEXT, 2, '0') || '-{month:02d}-{year}',
+    1,
+    'Bench ' || (g + 1),
+    (ARRAY[{colors}])[g % {len(SEED_COLORS)} + 1],
+    {month},
+    {year}
+FROM generate_series(0, {count - 1}) AS g
+JOIN numbered l ON l.idx = g % l.total;""")
+
+    return "\n".join(statements) + "\n"
+
+
+def open_planner_month(year: int, month: int, max_clicks: int = 120) -> bool:
+    """
+    Step the planner's month navigation until year/month is shown.
+    Returns False if the month label cannot be found or read.
+    """
+    driver = get_driver()
+
+    for _ in range(max_clicks):
+        try:
+            label = driver.find_element(By.XPATH, MONTH_LABEL_XPATH)
+            # "March 2028", or "Week 2 - March 2028" in week zoom
+            shown = datetime.strptime(" ".join(label.text.split()[-2:]), "%B %Y")
+        except Exception:
+            return False
+
+        offset = (year - shown.year) * 12 + (month - shown.month)
+        if offset == 0:
+            wait_for_idle(TIMEOUT)
+            return True
+
+        sibling = "following-sibling::button[1]" if offset > 0 else "preceding-sibling::button[1]"
+        label.find_element(By.XPATH, sibling).click()
+
+    return False
+
+
+def pick_blocks(count: int, reach_px: int) -> List[Any]:
+    """
+    Up to count blocks spread over the grid, each with room to move
+    reach_px right and down without leaving the viewport.
+    """
+    driver = get_driver()
+    width, height = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+
+    candidates = []
+    for block in driver.find_elements(By.CSS_SELECTOR, BLOCK_SELECTOR):
+        rect = block.rect
+        center_x = rect["x"] + rect["width"] / 2
+        center_y = rect["y"] + rect["height"] / 2
+        if 0 < center_x and center_x + reach_px < width and 0 < center_y and center_y + reach_px < height:
+            candidates.append(block)
+
+    if len(candidates) <= count:
+        return candidates
+    stride = len(candidates) / count
+    return [candidates[int(i * stride)] for i in range(count)]
+
+
+def stepped_move(element, dx: int, dy: int, steps: int = PLANNER_BENCH_STEPS, step_ms: int = PLANNER_BENCH_STEP_MS) -> None:
+    """
+    Press on element, move (dx, dy) steps times, move back the same way
+    and release where the gesture started.
+    """
+    actions = ActionChains(get_driver(), duration=step_ms)
+    actions.move_to_element(element).click_and_hold()
+    for _ in range(steps):
+        actions.move_by_offset(dx, dy)
+    for _ in range(steps):
+        actions.move_by_offset(-dx, -dy)
+    actions.release().perform()
+
+
+def drag_block(block, steps: int = PLANNER_BENCH_STEPS, step_px: int = PLANNER_BENCH_STEP_PX) -> None:
+    """
+    Drag a block diagonally across lines and days, then back.
+    """
+    stepped_move(block, step_px, step_px, steps)
+
+
+def resize_block(block, steps: int = PLANNER_BENCH_STEPS, step_px: int = PLANNER_BENCH_STEP_PX) -> None:
+    """
+    Pull a block's bottom resize handle down over the following days, then back.
+    """
+    handle = block.find_element(By.CSS_SELECTOR, RESIZE_HANDLE_SELECTOR)
+    stepped_move(handle, 0, step_px, steps)
+
+
+def benchmark_grid(
+    blocks_per_month: int,
+    year: int,
+    month: int,
+    gestures: int = PLANNER_BENCH_GESTURES
+) -> Dict[str, Any]:
+    """
+    Drag and resize up to gestures blocks in one seeded month.
+
+    Returns dict with keys: grid (seeded block count), month ("YYYY-MM"),
+    blocks (rendered), and per gesture type ("drag", "resize") a
+    summarize_frames() dict with "gestures" and "errors" added.
+    """
+    result = {"grid": blocks_per_month, "month": f"{year}-{month:02d}", "blocks": 0}
+
+    if not open_planner_month(year, month):
+        raise RuntimeError(f"Could not open {year}-{month:02d} in the planner")
+
+    result["blocks"] = len(get_driver().find_elements(By.CSS_SELECTOR, BLOCK_SELECTOR))
+    reach = PLANNER_BENCH_STEPS * PLANNER_BENCH_STEP_PX
+
+    for gesture, perform in (("drag", drag_block), ("resize", resize_block)):
+        frames, long_tasks, done, errors = [], [], 0, 0
+
+        # Rendered blocks go stale after a gesture re-renders the grid
+        for index in range(len(pick_blocks(gestures, reach))):
+            try:
+                block = pick_blocks(gestures, reach)[index]
+                sample = measure_interaction(lambda: perform(block), SHORT_TIMEOUT)
+                frames.extend(sample["frames"])
+                long_tasks.extend(sample["long_tasks"])
+                done += 1
+            except Exception:
+                errors += 1
+
+        result[gesture] = {**summarize_frames(frames, long_tasks), "gestures": done, "errors": errors}
+
+    return result
+
+
+def run_planner_bench(grids: Dict[int, Tuple[int, int]] = PLANNER_BENCH_GRIDS, gestures: int = PLANNER_BENCH_GESTURES) -> List[Dict[str, Any]]:
+    """
+    Benchmark every seeded grid size in the current browser session.
+    Expects to be logged in.
+    """
+    navigate_to_module(MODULES["prod_planner"])
+    wait_for_idle(TIMEOUT)
+
+    results = []
+    for blocks_per_month, (year, month) in sorted(grids.items()):
+        result = benchmark_grid(blocks_per_month, year, month, gestures)
+        results.append(result)
+        for gesture in GESTURES:
+            stats = result[gesture]
+            p95 = f"{stats['p95_frame_ms']:.1f} ms" if stats["p95_frame_ms"] is not None else "n/a"
+            print(
+                f"  {blocks_per_month} blocks ({result['blocks']} rendered) {gesture}: "
+                f"p95 frame {p95}, dropped {stats['dropped_frames']}, TBT {stats['tbt']:.0f} ms"
+            )
+    return results
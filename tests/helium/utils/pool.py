@@ -0,0 +1,278 @@
+"""
+Warm Chrome pool with automatic browser recycling
+
+setup_browser() starts one Chrome and keeps it for the whole run, through
+renderer timeouts and however much memory it grows to, while starting a
+fresh Chrome for every test would cost seconds each. The pool keeps
+BROWSER_POOL_SIZE - 1 spare Chromes launched in the background, so
+replacing the browser between tests only swaps Helium's driver.
+
+Helium drives a single global browser, so there is one pool per process:
+the serial runner's, or one per parallel worker. After each test,
+after_test() retires the current browser and hands the next test a warm
+one when:
+
+    tests    it has served BROWSER_RECYCLE_TESTS tests
+    memory   its process tree (chromedriver, Chrome, renderers) uses more
+             than BROWSER_RECYCLE_RSS_MB
+    error    the test died of a browser or driver error (the session is
+             gone or the renderer stopped answering; health.is_browser_error())
+
+The circuit breaker's browser restart goes through recycle_browser() too.
+Each browser keeps its metrics (startup time, tests served, peak memory,
+lifetime and why it was retired); stop_pool() returns them for the run log
+and the report. Memory is read from /proc, so the limit applies on Linux.
+"""
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BROWSER_POOL_SIZE,
+    BROWSER_RECYCLE_TESTS,
+    BROWSER_RECYCLE_RSS_MB,
+    BROWSER_START_TIMEOUT,
+)
+from utils.browser import launch_browser, use_browser
+from utils.health import is_browser_error
+from utils.procmem import rss_mb, process_tree
+
+
+# Metric keys kept per browser (the rest of an instance dict is runtime state)
+METRIC_KEYS = ("browser", "worker", "started_at", "startup_s", "tests", "peak_rss_mb", "lifetime_s", "retired")
+
+# One pool per process; see start_pool()
+_pool: Dict[str, Any] = {}
+
+
+def browser_rss_mb(driver) -> Optional[float]:
+    """
+    Resident memory of the browser's process tree in MB: chromedriver,
+    Chrome and every renderer / GPU / utility process under it. None when
+    /proc cannot be read.
+    """
+    try:
+        root = driver.service.process.pid
+    except AttributeError:
+        return None
+    return rss_mb(process_tree(root))
+
+
+def _launch(worker: Optional[int]) -> Dict[str, Any]:
+    """
+    Start one Chrome with its own profile directory. Returns the instance
+    dict; on failure it carries the exception and its "error" text instead
+    of a driver.
+    """
+    with _pool["lock"]:
+        number = _pool["launched"] = _pool["launched"] + 1
+    name = f"w{worker}-b{number}" if worker is not None else f"b{number}"
+    user_data_dir = tempfile.mkdtemp(prefix=f"helium_{name}_")
+
+    instance = {
+        "browser": name,
+        "worker": worker,
+        "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "startup_s": None,
+        "tests": 0,
+        "peak_rss_mb": None,
+        "lifetime_s": None,
+        "retired": None,
+        "driver": None,
+        "user_data_dir": user_data_dir,
+        "error": None,
+        "exception": None,
+    }
+    start = time.perf_counter()
+    try:
+        instance["driver"] = launch_browser(user_data_dir=user_data_dir)
+    except Exception as e:
+        instance["exception"] = e
+        instance["error"] = f"{type(e).__name__}: {e}"
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+    instance["startup_s"] = time.perf_counter() - start
+    instance["_ready"] = time.perf_counter()
+    return instance
+
+
+def _warm_spare() -> None:
+    """
+    Launch a spare in the background; it lands in the spares queue.
+    """
+    thread = threading.Thread(target=lambda: _pool["spares"].put(_launch(_pool["worker"])), daemon=True)
+    thread.start()
+    _pool["threads"].append(thread)
+
+
+def _retire(instance: Dict[str, Any], reason: str) -> None:
+    """
+    Record why and when a browser left the pool, then quit it in the
+    background so the next test does not wait for Chrome to exit.
+    """
+    instance["retired"] = reason
+    instance["lifetime_s"] = time.perf_counter() - instance["_ready"]
+    _pool["retired"].append(instance)
+
+    def quit_browser():
+        try:
+            instance["driver"].quit()
+        except Exception:
+            pass
+        shutil.rmtree(instance["user_data_dir"], ignore_errors=True)
+
+    thread = threading.Thread(target=quit_browser, daemon=True)
+    thread.start()
+    _pool["threads"].append(thread)
+
+
+def _failed(instance: Dict[str, Any]) -> None:
+    """
+    Keep a browser that never started in the metrics.
+    """
+    instance["retired"] = f"failed to start: {instance['error'][:80]}"
+    instance["lifetime_s"] = 0
+    _pool["retired"].append(instance)
+
+
+def _activate(instance: Dict[str, Any]) -> None:
+    _pool["current"] = instance
+    use_browser(instance["driver"])
+    if _pool["size"] > 1:
+        _warm_spare()
+
+
+def start_pool(size: int = BROWSER_POOL_SIZE, worker: Optional[int] = None):
+    """
+    Start this process's pool: launch the first browser, make it Helium's
+    current one and start warming size - 1 spares.
+    Raises the launch error if the first browser cannot start.
+    Returns the current WebDriver.
+    """
+    _pool.clear()
+    _pool.update({
+        "size": max(size, 1),
+        "worker": worker,
+        "current": None,
+        "spares": queue.Queue(),
+        "retired": [],
+        "threads": [],
+        "launched": 0,
+        "lock": threading.Lock(),
+    })
+
+    instance = _launch(worker)
+    if instance["error"]:
+        _pool.clear()
+        raise instance["exception"]
+    _activate(instance)
+    # Top the pool up: _activate() started one spare, a larger pool wants more
+    for _ in range(_pool["size"] - 2):
+        _warm_spare()
+    return instance["driver"]
+
+
+def recycle_browser(reason: str):
+    """
+    Retire the current browser and switch to a warm spare, waiting up to
+    BROWSER_START_TIMEOUT for one still starting. Launches a replacement
+    in place when no spare is ready or the spare failed to start.
+    Raises the launch error if no browser can be started.
+    Returns the new current WebDriver.
+    """
+    _retire(_pool["current"], reason)
+    _pool["current"] = None
+
+    instance = None
+    if _pool["size"] > 1:
+        try:
+            instance = _pool["spares"].get(timeout=BROWSER_START_TIMEOUT)
+        except queue.Empty:
+            pass
+    if instance is not None and instance["error"]:
+        _failed(instance)
+        instance = None
+    if instance is None:
+        instance = _launch(_pool["worker"])
+    if instance["error"]:
+        _failed(instance)
+        raise instance["exception"]
+
+    _activate(instance)
+    print(f"    ↻ Browser {_pool['retired'][-1]['browser']} retired ({reason}), "
+          f"now on {instance['browser']} (started in {instance['startup_s']:.1f}s)")
+    return instance["driver"]
+
+
+def after_test(result: Dict[str, Any]) -> Optional[str]:
+    """
+    Account a finished test to the current browser (tests served, peak
+    memory; the result gets a "browser" key) and recycle the browser when
+    a limit is reached or the test hit a browser error.
+    Raises the launch error if the replacement cannot start.
+    Returns the recycle reason, or None if the browser stays.
+    """
+    instance = _pool["current"]
+    instance["tests"] += 1
+    result["browser"] = instance["browser"]
+
+    rss = browser_rss_mb(instance["driver"])
+    if rss is not None and (instance["peak_rss_mb"] is None or rss > instance["peak_rss_mb"]):
+        instance["peak_rss_mb"] = rss
+
+    if is_browser_error(result):
+        reason = "browser error"
+    elif BROWSER_RECYCLE_RSS_MB and rss is not None and rss > BROWSER_RECYCLE_RSS_MB:
+        reason = f"memory {rss:.0f} MB"
+    elif BROWSER_RECYCLE_TESTS and instance["tests"] >= BROWSER_RECYCLE_TESTS:
+        reason = f"{instance['tests']} tests"
+    else:
+        return None
+
+    recycle_browser(reason)
+    return reason
+
+
+def stop_pool() -> List[Dict[str, Any]]:
+    """
+    Quit every browser in the pool, in use or spare, and wait for them.
+    Returns per-browser metrics (METRIC_KEYS) in launch order.
+    """
+    if not _pool:
+        return []
+
+    if _pool["current"] is not None:
+        _retire(_pool["current"], "end of run")
+        _pool["current"] = None
+
+    # Spares still starting finish first, then are retired unused
+    for thread in list(_pool["threads"]):
+        thread.join()
+    while not _pool["spares"].empty():
+        instance = _pool["spares"].get()
+        if instance["error"]:
+            _failed(instance)
+        else:
+            _retire(instance, "unused")
+    for thread in _pool["threads"]:
+        thread.join()
+
+    metrics = [{key: instance[key] for key in METRIC_KEYS} for instance in _pool["retired"]]
+    metrics.sort(key=lambda m: int(m["browser"].rsplit("b", 1)[1]))
+    _pool.clear()
+    return metrics
+
+
+def format_browser(metrics: Dict[str, Any]) -> str:
+    """
+    "b2: 50 tests, started in 1.4s, peak 812 MB, 312s, retired: 50 tests"
+    """
+    peak = f"{metrics['peak_rss_mb']:.0f} MB" if metrics["peak_rss_mb"] is not None else "n/a"
+    return (f"{metrics['browser']}: {metrics['tests']} tests, started in {metrics['startup_s']:.1f}s, "
+            f"peak {peak}, {metrics['lifetime_s']:.0f}s, retired: {metrics['retired']}")
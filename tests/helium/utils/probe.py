@@ -0,0 +1,152 @@
+"""
+Batched DOM probes for Helium tests
+
+Answers a whole list of CSS selector and text queries with a single
+execute_script round-trip, instead of one WebDriver call per selector plus
+more for is_displayed() and .text.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import SHORT_TIMEOUT, IDLE_POLL_INTERVAL
+
+
+# Texts of at most this many visible matches are returned per selector
+MAX_TEXTS_PER_SELECTOR = 20
+
+PROBE_JS = """
+const selectors = arguments[0];
+const texts = arguments[1];
+const maxTexts = arguments[2];
+
+const isVisible = el => {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+};
+
+const result = {selectors: {}, texts: {}};
+
+for (const selector of selectors) {
+    let matches;
+    try {
+        matches = document.querySelectorAll(selector);
+    } catch (e) {
+        // Invalid selector (e.g. Playwright-only :has-text) counts as absent
+        result.selectors[selector] = {present: false, count: 0, visible: false, text: '', texts: [], valid: false};
+        continue;
+    }
+    const visibleTexts = [];
+    let visibleCount = 0;
+    for (const el of matches) {
+        if (!isVisible(el)) continue;
+        visibleCount++;
+        if (visibleTexts.length < maxTexts) {
+            const text = (el.innerText || '').trim();
+            if (text) visibleTexts.push(text);
+        }
+    }
+    result.selectors[selector] = {
+        present: matches.length > 0,
+        count: matches.length,
+        visible: visibleCount > 0,
+        text: visibleTexts.length ? visibleTexts[0] : '',
+        texts: visibleTexts,
+        valid: true,
+    };
+}
+
+const bodyText = document.body ? document.body.innerText : '';
+const bodyTextLower = bodyText.toLowerCase();
+for (const text of texts) {
+    result.texts[text] = {
+        visible: bodyText.includes(text),
+        visible_ci: bodyTextLower.includes(text.toLowerCase()),
+    };
+}
+
+return result;
+"""
+
+
+def probe(selectors: Iterable[str] = (), texts: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Query many selectors and texts in one browser round-trip.
+
+    Returns:
+        {
+            "selectors": {selector: {"present", "count", "visible", "text", "texts", "valid"}},
+            "texts": {text: {"visible", "visible_ci"}},
+        }
+        "text" is the first non-empty innerText among visible matches and
+        "texts" lists up to MAX_TEXTS_PER_SELECTOR of them. Text queries
+        match against the page's rendered (visible) text.
+    """
+    selectors = list(selectors)
+    texts = list(texts)
+
+    try:
+        return get_driver().execute_script(PROBE_JS, selectors, texts, MAX_TEXTS_PER_SELECTOR)
+    except Exception as e:
+        print(f"Probe failed: {e}")
+        return {
+            "selectors": {
+                s: {"present": False, "count": 0, "visible": False, "text": "", "texts": [], "valid": False}
+                for s in selectors
+            },
+            "texts": {t: {"visible": False, "visible_ci": False} for t in texts},
+        }
+
+
+def any_present(
+    selectors: Iterable[str] = (),
+    texts: Iterable[str] = (),
+    visible: bool = False
+) -> bool:
+    """
+    True if any selector matches (or, with visible=True, has a visible match)
+    or any text is visible on the page. One round-trip replacement for
+    is_element_present(...) or is_text_present(...) chains.
+    """
+    result = probe(selectors, texts)
+    key = "visible" if visible else "present"
+    return (
+        any(r[key] for r in result["selectors"].values()) or
+        any(r["visible"] for r in result["texts"].values())
+    )
+
+
+def wait_for_probe(
+    selectors: Iterable[str] = (),
+    texts: Iterable[str] = (),
+    condition=None,
+    timeout: float = SHORT_TIMEOUT
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Re-run a probe until condition(result) is true or timeout expires.
+    Defaults to "any selector visible or any text visible".
+    Returns the matching probe result, or None on timeout.
+    """
+    selectors = list(selectors)
+    texts = list(texts)
+
+    if condition is None:
+        def condition(result):
+            return (
+                any(r["visible"] for r in result["selectors"].values()) or
+                any(r["visible"] for r in result["texts"].values())
+            )
+
+    deadline = time.time() + timeout
+    while True:
+        result = probe(selectors, texts)
+        if condition(result):
+            return result
+        if time.time() >= deadline:
+            return None
+        time.sleep(IDLE_POLL_INTERVAL)
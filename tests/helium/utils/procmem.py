@@ -0,0 +1,46 @@
+"""
+Resident memory of local processes, read from /proc
+
+Shared by the DPR upload benchmark (Next.js server memory) and the browser
+pool (Chrome memory). On systems without /proc every reading is None.
+"""
+from pathlib import Path
+from typing import List, Dict, Optional
+
+
+def rss_mb(pids: List[int]) -> Optional[float]:
+    """
+    Combined resident memory of the processes in MB, or None when none can
+    be read (e.g. they run on another machine or have exited).
+    """
+    total, found = 0, False
+    for pid in pids:
+        try:
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1])
+                    found = True
+        except (OSError, ValueError):
+            continue
+    return total / 1024 if found else None
+
+
+def process_tree(root: int) -> List[int]:
+    """
+    root and all its descendants' pids.
+    """
+    children: Dict[int, List[int]] = {}
+    for proc in Path("/proc").glob("[0-9]*"):
+        try:
+            # "pid (comm) state ppid ..."; comm may contain spaces and parens
+            ppid = int((proc / "stat").read_text().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(proc.name))
+
+    pids, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
@@ -0,0 +1,212 @@
+"""
+Statistical regression detection for Helium tests
+
+Single-run timings are noisy, so instead of a fixed threshold each metric's
+K repeated samples are compared against the same metric in a saved baseline
+run with a one-sided Mann-Whitney U test (is the current run slower?). The
+p-values are adjusted for the number of metrics compared (Benjamini-Hochberg)
+and a slowdown is only reported if it is also large enough, measured by
+Cliff's delta. Works on every stored metric: test duration, vitals, API
+timings and budgeted view metrics.
+"""
+import math
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import REGRESSION_ALPHA, REGRESSION_MIN_EFFECT, REGRESSION_MIN_SAMPLES
+from utils.history import get_run_metrics, percentile
+
+
+# Exact U distribution is used up to this many (m * n) pairs when there are no ties
+EXACT_MAX_PAIRS = 400
+
+
+def _u_distribution(m: int, n: int) -> List[int]:
+    """
+    Number of orderings of m + n distinct values giving each U = 0..m*n,
+    built with the recurrence f(u; m, n) = f(u - n; m - 1, n) + f(u; m, n - 1).
+    """
+    # table[j] holds the distribution for (i, j) while i is built up
+    table = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        row = [[1]]  # j = 0: only U = 0
+        for j in range(1, n + 1):
+            size = i * j + 1
+            counts = [0] * size
+            for u, c in enumerate(table[j]):  # (i - 1, j), shifted by j
+                counts[u + j] += c
+            for u, c in enumerate(row[j - 1]):  # (i, j - 1)
+                counts[u] += c
+            row.append(counts)
+        table = row
+    return table[n]
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that current tends to be larger than baseline.
+    Exact for small tie-free samples, otherwise the normal approximation with
+    tie and continuity correction.
+    Returns (U, p_value).
+    """
+    m, n = len(current), len(baseline)
+    u = sum(
+        1.0 if c > b else 0.5 if c == b else 0.0
+        for c in current
+        for b in baseline
+    )
+
+    pooled = current + baseline
+    has_ties = len(set(pooled)) < len(pooled)
+
+    if not has_ties and m * n <= EXACT_MAX_PAIRS:
+        counts = _u_distribution(m, n)
+        return u, sum(counts[int(u):]) / sum(counts)
+
+    total = m + n
+    tie_term = 0.0
+    for value in set(pooled):
+        t = pooled.count(value)
+        tie_term += t ** 3 - t
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return u, 1.0
+
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def cliffs_delta(current: List[float], baseline: List[float]) -> float:
+    """
+    Effect size in [-1, 1]: P(current > baseline) - P(current < baseline).
+    """
+    greater = sum(1 for c in current for b in baseline if c > b)
+    less = sum(1 for c in current for b in baseline if c < b)
+    return (greater - less) / (len(current) * len(baseline))
+
+
+def effect_magnitude(delta: float) -> str:
+    """
+    Conventional labels for |Cliff's delta| (Romano et al.).
+    """
+    size = abs(delta)
+    if size < 0.147:
+        return "negligible"
+    if size < 0.33:
+        return "small"
+    if size < 0.474:
+        return "medium"
+    return "large"
+
+
+def benjamini_hochberg(p_values: List[float]) -> List[float]:
+    """
+    Benjamini-Hochberg adjusted p-values (q-values), in input order.
+    """
+    count = len(p_values)
+    order = sorted(range(count), key=lambda i: p_values[i])
+    adjusted = [0.0] * count
+    running_min = 1.0
+    for rank in range(count, 0, -1):
+        index = order[rank - 1]
+        running_min = min(running_min, p_values[index] * count / rank)
+        adjusted[index] = running_min
+    return adjusted
+
+
+def min_q_value(repeats: int, comparisons: int) -> float:
+    """
+    Smallest q-value one slowdown among this many compared metrics can reach
+    when both runs have `repeats` samples: the exact one-sided p-value of a
+    complete separation, 1 / C(2K, K), times the number of comparisons.
+    """
+    return min(1.0, comparisons / math.comb(2 * repeats, repeats))
+
+
+def compare_samples(
+    current: Dict[tuple, List[float]],
+    baseline: Dict[tuple, List[float]],
+    min_samples: int = REGRESSION_MIN_SAMPLES
+) -> List[Dict[str, Any]]:
+    """
+    Compare every (module, test_name, metric) present in both sample sets.
+
+    Returns list of dicts with keys: module, test_name, metric, baseline_n,
+    current_n, baseline_median, current_median, change_pct, u, p_value,
+    q_value (Benjamini-Hochberg), confidence (1 - q_value), delta, magnitude.
+    """
+    comparisons = []
+    for key in sorted(set(current) & set(baseline)):
+        cur, base = current[key], baseline[key]
+        if len(cur) < min_samples or len(base) < min_samples:
+            continue
+
+        u, p_value = mann_whitney_greater(cur, base)
+        base_median = percentile(base, 50)
+        cur_median = percentile(cur, 50)
+        delta = cliffs_delta(cur, base)
+
+        comparisons.append({
+            "module": key[0],
+            "test_name": key[1],
+            "metric": key[2],
+            "baseline_n": len(base),
+            "current_n": len(cur),
+            "baseline_median": base_median,
+            "current_median": cur_median,
+            "change_pct": (cur_median - base_median) / base_median * 100 if base_median else None,
+            "u": u,
+            "p_value": p_value,
+            "delta": delta,
+            "magnitude": effect_magnitude(delta),
+        })
+
+    q_values = benjamini_hochberg([c["p_value"] for c in comparisons])
+    for comparison, q_value in zip(comparisons, q_values):
+        comparison["q_value"] = q_value
+        comparison["confidence"] = 1 - q_value
+
+    return comparisons
+
+
+def detect_regressions(
+    current: Dict[tuple, List[float]],
+    baseline: Dict[tuple, List[float]],
+    alpha: float = REGRESSION_ALPHA,
+    min_effect: float = REGRESSION_MIN_EFFECT
+) -> List[Dict[str, Any]]:
+    """
+    Significant slowdowns of the current samples against the baseline:
+    q-value below alpha and Cliff's delta of at least min_effect.
+    Sorted by effect size, largest first.
+    """
+    comparisons = compare_samples(current, baseline)
+    regressions = [c for c in comparisons if c["q_value"] < alpha and c["delta"] >= min_effect]
+    return sorted(regressions, key=lambda c: (-c["delta"], c["q_value"]))
+
+
+def find_regressions(
+    current_run_id: str,
+    baseline_run_id: str,
+    alpha: float = REGRESSION_ALPHA,
+    min_effect: float = REGRESSION_MIN_EFFECT
+) -> List[Dict[str, Any]]:
+    """
+    detect_regressions() between two recorded runs.
+    """
+    return detect_regressions(get_run_metrics(current_run_id), get_run_metrics(baseline_run_id), alpha, min_effect)
+
+
+def format_regression(regression: Dict[str, Any]) -> str:
+    """
+    One-line description for the console.
+    """
+    change = f"{regression['change_pct']:+.0f}%" if regression["change_pct"] is not None else "n/a"
+    return (
+        f"{regression['module']}: {regression['test_name']} [{regression['metric']}] "
+        f"median {regression['baseline_median']:.4g} -> {regression['current_median']:.4g} ({change}), "
+        f"confidence {regression['confidence'] * 100:.1f}%, "
+        f"delta {regression['delta']:.2f} ({regression['magnitude']})"
+    )
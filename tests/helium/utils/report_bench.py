@@ -0,0 +1,260 @@
+"""
+Report engine benchmark across the dimension and metric matrix
+
+The report builder lets users combine any metric with up to two dimensions
+over any date range, and saved reports replay those combinations on every
+visit. This benchmark asks the backend what exists instead of hard-coding
+it: for each category in REPORT_BENCH_CATEGORIES it reads
+/api/reports/dimensions/[category] and /api/reports/metrics/[category],
+then builds a sample of combinations that uses every metric and every
+dimension at least once, topped up with random multi-metric, two-dimension
+combinations (seeded, so runs compare).
+
+Each combination runs over every range in REPORT_BENCH_RANGES through:
+
+    /api/reports/generate   the builder's own config (dataSource = category)
+    /api/reports/query      the flexible query API; the request is derived
+                            from each metric's SQL calculation (single
+                            aggregates only) and each dimension's column,
+                            against the data source in QUERY_SOURCES
+
+Every request runs REPORT_BENCH_REPEATS times; results carry the median and
+worst time, response size and row count, ranked slowest first.
+"""
+import random
+import re
+import statistics
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import requests
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BASE_URL,
+    LOAD_REQUEST_TIMEOUT,
+    REPORT_BENCH_RANGES,
+    REPORT_BENCH_SAMPLE,
+    REPORT_BENCH_REPEATS,
+)
+from utils.load import new_session
+
+
+ROUTES = ("generate", "query")
+
+# Category -> (/api/reports/query data source, its date field)
+QUERY_SOURCES = {
+    "production": ("production", "date"),
+    "dispatch": ("dispatch", "date"),
+    "stock": ("stock", "transaction_date"),
+    "store": ("grn", "date"),
+}
+
+# "SUM(ok_prod_qty)", "COUNT(DISTINCT store_grn.id)"; CASE expressions do not match
+SINGLE_AGGREGATE = re.compile(r"^(SUM|AVG|MIN|MAX|COUNT)\((DISTINCT )?([\w.]+)\)$")
+
+
+def discover(session: requests.Session, category: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Dimensions and metrics the backend offers for a category.
+    Returns {"dimensions": [...], "metrics": [...]}, empty lists on errors.
+    """
+    found = {}
+    for kind in ("dimensions", "metrics"):
+        try:
+            response = session.get(f"{BASE_URL}/api/reports/{kind}/{category}", timeout=LOAD_REQUEST_TIMEOUT)
+            found[kind] = (response.json().get("data") or []) if response.ok else []
+        except (requests.RequestException, ValueError):
+            found[kind] = []
+    return found
+
+
+def sample_combinations(
+    metrics: List[Dict[str, Any]],
+    dimensions: List[Dict[str, Any]],
+    size: int = REPORT_BENCH_SAMPLE,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Up to size distinct combinations of metrics (1-3), primary and secondary
+    dimension. Every metric appears alone first, then every dimension as
+    primary, then random combinations fill the sample.
+
+    Returns [{"metrics": [metric dicts], "primary": dim or None, "secondary": dim or None}].
+    """
+    if not metrics:
+        return []
+    rng = random.Random(seed)
+    combinations, seen = [], set()
+
+    def add(chosen, primary=None, secondary=None):
+        key = (tuple(sorted(m["id"] for m in chosen)), primary and primary["id"], secondary and secondary["id"])
+        if key not in seen and len(combinations) < size:
+            seen.add(key)
+            combinations.append({"metrics": list(chosen), "primary": primary, "secondary": secondary})
+
+    for metric in metrics:
+        add([metric])
+    for index, dimension in enumerate(dimensions):
+        add([metrics[index % len(metrics)]], dimension)
+
+    attempts = 0
+    while len(combinations) < size and attempts < size * 20:
+        attempts += 1
+        chosen = rng.sample(metrics, rng.randint(1, min(3, len(metrics))))
+        pair = rng.sample(dimensions, min(2, len(dimensions))) if dimensions else []
+        primary = pair[0] if pair and rng.random() < 0.8 else None
+        secondary = pair[1] if primary and len(pair) > 1 and rng.random() < 0.5 else None
+        add(chosen, primary, secondary)
+
+    return combinations
+
+
+def date_range(days: int) -> Dict[str, str]:
+    today = date.today()
+    return {"from": (today - timedelta(days=days - 1)).isoformat(), "to": today.isoformat()}
+
+
+def generate_request(category: str, combination: Dict[str, Any], span: Dict[str, str]) -> Dict[str, Any]:
+    """
+    /api/reports/generate body, as the report builder sends it.
+    """
+    return {
+        "dataSource": category,
+        "metrics": [m["id"] for m in combination["metrics"]],
+        "primaryDimension": combination["primary"]["id"] if combination["primary"] else None,
+        "secondaryDimension": combination["secondary"]["id"] if combination["secondary"] else None,
+        "filters": {"dateRange": span},
+        "chartType": "table",
+    }
+
+
+def _field(column: str, date_field: str, dimension: Optional[Dict[str, Any]] = None) -> str:
+    if dimension is not None and dimension.get("type") == "date":
+        return date_field
+    return column.split(".")[-1]
+
+
+def query_request(category: str, combination: Dict[str, Any], span: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    /api/reports/query body for the same combination, or None when the
+    category has no query data source or no metric is a single aggregate.
+    """
+    if category not in QUERY_SOURCES:
+        return None
+    source, date_field = QUERY_SOURCES[category]
+
+    select = []
+    for metric in combination["metrics"]:
+        match = SINGLE_AGGREGATE.match(metric.get("calculation", "").strip())
+        if not match or match.group(3) == "*":
+            continue
+        aggregation = "COUNT_DISTINCT" if match.group(2) else match.group(1)
+        select.append({"field": _field(match.group(3), date_field), "aggregation": aggregation, "alias": metric["id"]})
+    if not select:
+        return None
+
+    group_by = []
+    for dimension in (combination["primary"], combination["secondary"]):
+        if dimension:
+            field = _field(dimension.get("column", dimension["id"]), date_field, dimension)
+            if field not in group_by:
+                group_by.append(field)
+
+    return {
+        "dataSource": source,
+        "select": select,
+        "groupBy": group_by,
+        "dateFrom": span["from"],
+        "dateTo": span["to"],
+    }
+
+
+def time_request(session: requests.Session, path: str, body: Dict[str, Any], repeats: int = REPORT_BENCH_REPEATS) -> Dict[str, Any]:
+    """
+    POST body repeats times. Returns dict with keys: ms (median), max_ms,
+    bytes, rows, status, ok, error (from the last failing run).
+    """
+    times, result = [], {"bytes": 0, "rows": None, "status": None, "ok": True, "error": None}
+    for _ in range(repeats):
+        start = time.perf_counter()
+        try:
+            response = session.post(f"{BASE_URL}{path}", json=body, timeout=LOAD_REQUEST_TIMEOUT)
+            times.append((time.perf_counter() - start) * 1000)
+            result["status"] = response.status_code
+            result["bytes"] = len(response.content)
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {}
+            if response.ok and payload.get("success", True):
+                data = payload.get("data")
+                result["rows"] = len(data) if isinstance(data, list) else None
+            else:
+                result["ok"] = False
+                result["error"] = str(payload.get("error") or f"HTTP {response.status_code}")[:200]
+        except requests.RequestException as e:
+            times.append((time.perf_counter() - start) * 1000)
+            result["ok"] = False
+            result["error"] = type(e).__name__
+
+    result["ms"] = statistics.median(times)
+    result["max_ms"] = max(times)
+    return result
+
+
+def describe(combination: Dict[str, Any]) -> str:
+    """
+    "prod_qty + rej_kg by machine x date_month"
+    """
+    text = " + ".join(m["id"] for m in combination["metrics"])
+    dimensions = [d["id"] for d in (combination["primary"], combination["secondary"]) if d]
+    return f"{text} by {' x '.join(dimensions)}" if dimensions else text
+
+
+def run_report_bench(token: str, categories: List[str], sample: int = REPORT_BENCH_SAMPLE) -> Dict[str, Any]:
+    """
+    Discover, sample and time every combination over every date range.
+
+    Returns dict with keys: catalog ({category: {"dimensions": n, "metrics": n,
+    "combinations": n}}) and results (one dict per request: category, route,
+    combination, range, days, plus time_request() keys), slowest first.
+    """
+    catalog, results = {}, []
+    with new_session(token) as session:
+        for category in categories:
+            found = discover(session, category)
+            combinations = sample_combinations(found["metrics"], found["dimensions"], sample)
+            catalog[category] = {
+                "dimensions": len(found["dimensions"]),
+                "metrics": len(found["metrics"]),
+                "combinations": len(combinations),
+            }
+            print(f"  {category}: {len(found['dimensions'])} dimensions, {len(found['metrics'])} metrics, "
+                  f"{len(combinations)} combinations x {len(REPORT_BENCH_RANGES)} ranges")
+
+            for combination in combinations:
+                for label, days in REPORT_BENCH_RANGES.items():
+                    span = date_range(days)
+                    bodies = {
+                        "generate": generate_request(category, combination, span),
+                        "query": query_request(category, combination, span),
+                    }
+                    for route in ROUTES:
+                        if bodies[route] is None:
+                            continue
+                        stats = time_request(session, f"/api/reports/{route}", bodies[route])
+                        results.append({
+                            "category": category,
+                            "route": route,
+                            "combination": describe(combination),
+                            "range": label,
+                            "days": days,
+                            **stats,
+                        })
+
+    results.sort(key=lambda r: -r["ms"])
+    return {"catalog": catalog, "results": results}
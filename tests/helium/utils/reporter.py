@@ -6,12 +6,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config import REPORT_DIR
+from config import REPORT_DIR, FRAME_BUDGET_MS, SCALING_SUPERLINEAR, LOAD_MAX_ERROR_RATE, REPORT_BENCH_TOP
 
 
 # Style definitions
@@ -20,6 +21,7 @@ HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="s
 PASS_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
 FAIL_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
 SKIP_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+PERF_FAIL_FILL = PatternFill(start_color="F4B084", end_color="F4B084", fill_type="solid")
 BORDER = Border(
     left=Side(style='thin'),
     right=Side(style='thin'),
@@ -29,72 +31,117 @@ BORDER = Border(
 CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
 LEFT_ALIGN = Alignment(horizontal='left', vertical='center', wrap_text=True)
 
+# Named styles for the test report: write-only cells are styled one by one, so every
+# cell that looks alike shares one registered style instead of its own font/fill/border
+NAMED_STYLES = {
+    "header": {"font": HEADER_FONT, "fill": HEADER_FILL, "alignment": CENTER_ALIGN, "border": BORDER},
+    "heading": {"font": Font(bold=True, size=12)},
+    "plain": {"border": BORDER},
+    "text": {"alignment": LEFT_ALIGN, "border": BORDER},
+    "number": {"alignment": CENTER_ALIGN, "border": BORDER},
+    "pass": {"fill": PASS_FILL, "alignment": CENTER_ALIGN, "border": BORDER},
+    "fail": {"fill": FAIL_FILL, "alignment": CENTER_ALIGN, "border": BORDER},
+    "perf_fail": {"fill": PERF_FAIL_FILL, "alignment": CENTER_ALIGN, "border": BORDER},
+    "skip": {"fill": SKIP_FILL, "alignment": CENTER_ALIGN, "border": BORDER},
+    "breach": {"fill": PERF_FAIL_FILL, "alignment": LEFT_ALIGN, "border": BORDER},
+}
+STATUS_STYLES = {"PASS": "pass", "FAIL": "fail", "PERF_FAIL": "perf_fail"}  # anything else: skip
+STATUS_KEYS = {"PASS": "passed", "FAIL": "failed", "PERF_FAIL": "perf_failed", "SKIP": "skipped"}
 
-def create_report_workbook() -> Workbook:
-    """
-    Initialize Excel workbook with headers.
-    Returns a new Workbook instance.
+# Web Vitals columns appended after the core columns: (header, vitals key, width)
+VITALS_COLUMNS = [
+    ("Page Loads", "page_loads", 11),
+    ("TTFB (ms)", "ttfb", 11),
+    ("DCL (ms)", "dom_content_loaded", 11),
+    ("Load (ms)", "load", 11),
+    ("FCP (ms)", "fcp", 11),
+    ("LCP (ms)", "lcp", 11),
+    ("CLS", "cls", 8),
+    ("Long Tasks", "long_tasks", 11),
+    ("TBT (ms)", "tbt", 11),
+]
+
+# Network columns appended after the vitals: (header, network key, width)
+NETWORK_COLUMNS = [
+    ("Requests", "requests", 10),
+    ("API Calls", "api_requests", 10),
+    ("API Bytes", "api_bytes", 12),
+    ("Slowest API (ms)", "slowest_ms", 16),
+    ("Duplicate Calls", "duplicates", 15),
+    ("N+1 Routes", "n_plus_one_count", 11),
+]
+
+# Column holding "; "-joined budget breaches (after the network columns)
+BREACHES_COLUMN = 10 + len(VITALS_COLUMNS) + len(NETWORK_COLUMNS)
+
+# Test Results sheet: (header, width)
+RESULT_COLUMNS = [
+    ("Module", 15),
+    ("Test Name", 40),
+    ("Status", 10),
+    ("Duration (s)", 12),
+    ("Error Message", 50),
+    ("Screenshot", 40),
+    ("Timestamp", 20),
+    ("Wait Saved (s)", 14),
+    ("Implicit Wait (s)", 16),
+] + [(header, width) for header, _, width in VITALS_COLUMNS + NETWORK_COLUMNS] + [("Budget Breaches", 60)]
+
+
+def create_result_store() -> Dict[str, Any]:
     """
-    wb = Workbook()
+    Empty in-memory result store for a test report.
     
-    # Main results sheet
-    ws = wb.active
-    ws.title = "Test Results"
-    
-    # Define headers
-    headers = [
-        "Module",
-        "Test Name", 
-        "Status",
-        "Duration (s)",
-        "Error Message",
-        "Screenshot",
-        "Timestamp"
-    ]
-    
-    # Set column widths
-    column_widths = [15, 40, 10, 12, 50, 40, 20]
-    
-    for col_num, (header, width) in enumerate(zip(headers, column_widths), 1):
-        cell = ws.cell(row=1, column=col_num, value=header)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER_ALIGN
-        cell.border = BORDER
-        ws.column_dimensions[get_column_letter(col_num)].width = width
-    
-    # Freeze header row
-    ws.freeze_panes = "A2"
-    
-    return wb
+    Results are kept column by column (one list per Test Results column) and
+    the summary counts are updated as each result is added, so nothing is
+    read back from a worksheet and the workbook is written in one pass.
+    """
+    return {
+        "columns": [[] for _ in RESULT_COLUMNS],
+        "total": 0,
+        "passed": 0,
+        "failed": 0,
+        "perf_failed": 0,
+        "skipped": 0,
+        "total_duration": 0.0,
+        "total_wait_saved": 0.0,
+        "total_implicit_wait": 0.0,
+        "module_stats": {},
+        "budget_breaches": [],
+    }
 
 
 def add_test_result(
-    wb: Workbook,
+    store: Dict[str, Any],
     module: str,
     test_name: str,
     status: str,
     duration: float,
     error: Optional[str] = None,
-    screenshot: Optional[str] = None
+    screenshot: Optional[str] = None,
+    wait_saved: Optional[float] = None,
+    implicit_wait: Optional[float] = None,
+    vitals: Optional[Dict[str, Any]] = None,
+    network: Optional[Dict[str, Any]] = None,
+    budget_breaches: Optional[List[str]] = None
 ) -> None:
     """
-    Add a test result row to the workbook.
+    Add a test result to the result store.
     
     Args:
-        wb: The workbook to add to
+        store: The store from create_result_store()
         module: Test module name
         test_name: Name of the test function
-        status: PASS, FAIL, or SKIP
+        status: PASS, FAIL, PERF_FAIL, or SKIP
         duration: Test duration in seconds
         error: Error message if failed
         screenshot: Path to screenshot if failed
+        wait_saved: Seconds saved by event-driven waits vs. fixed sleeps
+        implicit_wait: Seconds lost to implicit-wait timeouts
+        vitals: Web Vitals summary from utils.vitals.collect_vitals()
+        network: Request summary from utils.network.collect_network()
+        budget_breaches: Formatted breaches from utils.perf.format_breach()
     """
-    ws = wb["Test Results"]
-    
-    # Find next empty row
-    next_row = ws.max_row + 1
-    
     # Timestamp
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
@@ -106,153 +153,1137 @@ def add_test_result(
         round(duration, 3),
         error or "",
         screenshot or "",
-        timestamp
+        timestamp,
+        round(wait_saved or 0, 3),
+        round(implicit_wait or 0, 3),
     ]
     
-    # Status color
-    if status == "PASS":
-        status_fill = PASS_FILL
-    elif status == "FAIL":
-        status_fill = FAIL_FILL
-    else:
-        status_fill = SKIP_FILL
+    # Web Vitals (blank when not captured)
+    vitals = vitals or {}
+    for _, key, _ in VITALS_COLUMNS:
+        value = vitals.get(key)
+        if isinstance(value, float):
+            value = round(value, 3 if key == "cls" else 1)
+        data.append(value if value is not None else "")
     
-    for col_num, value in enumerate(data, 1):
-        cell = ws.cell(row=next_row, column=col_num, value=value)
-        cell.border = BORDER
-        
-        if col_num == 3:  # Status column
-            cell.fill = status_fill
-            cell.alignment = CENTER_ALIGN
-        elif col_num == 4:  # Duration column
-            cell.alignment = CENTER_ALIGN
-        else:
-            cell.alignment = LEFT_ALIGN
+    # Network accounting (blank when not captured)
+    network = network or {}
+    for _, key, _ in NETWORK_COLUMNS:
+        value = network.get(key)
+        if isinstance(value, float):
+            value = round(value, 1)
+        data.append(value if value is not None else "")
+    
+    data.append("; ".join(budget_breaches or []))
+    
+    for column, value in zip(store["columns"], data):
+        column.append(value)
+    
+    # Running totals for the summary
+    key = STATUS_KEYS.get(status, "skipped")
+    store["total"] += 1
+    store[key] += 1
+    store["total_duration"] += data[3]
+    store["total_wait_saved"] += data[7]
+    store["total_implicit_wait"] += data[8]
+    
+    if module not in store["module_stats"]:
+        store["module_stats"][module] = {"passed": 0, "failed": 0, "perf_failed": 0, "skipped": 0}
+    store["module_stats"][module][key] += 1
+    
+    for breach in budget_breaches or []:
+        store["budget_breaches"].append((module, test_name, breach))
 
 
-def generate_summary(wb: Workbook) -> Dict[str, Any]:
+def generate_summary(store: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Add summary sheet with pass/fail counts.
+    Summary statistics of a result store (pass/fail counts, totals,
+    per-module counts and budget breaches).
     Returns summary statistics.
     """
-    ws_results = wb["Test Results"]
-    
-    # Count results
-    total = 0
-    passed = 0
-    failed = 0
-    skipped = 0
-    total_duration = 0.0
-    module_stats = {}
+    total = store["total"]
+    return {
+        "total": total,
+        "passed": store["passed"],
+        "failed": store["failed"],
+        "perf_failed": store["perf_failed"],
+        "skipped": store["skipped"],
+        "pass_rate": (store["passed"]/total*100) if total > 0 else 0,
+        "total_duration": store["total_duration"],
+        "total_wait_saved": store["total_wait_saved"],
+        "total_implicit_wait": store["total_implicit_wait"],
+        "module_stats": store["module_stats"],
+        "budget_breaches": store["budget_breaches"]
+    }
+
+
+def _add_named_styles(wb: Workbook) -> None:
+    """
+    Register the shared cell styles (see NAMED_STYLES) with a workbook.
+    """
+    for name, style in NAMED_STYLES.items():
+        wb.add_named_style(NamedStyle(name=name, **style))
+
+
+def _styled(ws, value: Any, style: str) -> WriteOnlyCell:
+    """
+    A write-only cell with one of the NAMED_STYLES.
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def _append_header(ws, headers: List[str]) -> None:
+    ws.append([_styled(ws, header, "header") for header in headers])
+
+
+def write_summary_sheet(wb: Workbook, summary: Dict[str, Any]) -> None:
+    """
+    Add summary sheet with pass/fail counts, module breakdown and budget
+    breaches from generate_summary().
+    """
+    ws_summary = wb.create_sheet("Summary")
     
-    for row in range(2, ws_results.max_row + 1):
-        module = ws_results.cell(row=row, column=1).value
-        status = ws_results.cell(row=row, column=3).value
-        duration = ws_results.cell(row=row, column=4).value or 0
-        
-        if module:
-            total += 1
-            total_duration += float(duration)
-            
-            if module not in module_stats:
-                module_stats[module] = {"passed": 0, "failed": 0, "skipped": 0}
-            
-            if status == "PASS":
-                passed += 1
-                module_stats[module]["passed"] += 1
-            elif status == "FAIL":
-                failed += 1
-                module_stats[module]["failed"] += 1
-            else:
-                skipped += 1
-                module_stats[module]["skipped"] += 1
+    # Set column widths
+    for col_num, width in enumerate([20, 15, 10, 12, 10, 10, 12], 1):
+        ws_summary.column_dimensions[get_column_letter(col_num)].width = width
     
-    # Create summary sheet
-    ws_summary = wb.create_sheet("Summary", 0)
+    total = summary["total"]
+    passed = summary["passed"]
     
     # Overall summary
-    summary_headers = ["Metric", "Value"]
-    for col_num, header in enumerate(summary_headers, 1):
-        cell = ws_summary.cell(row=1, column=col_num, value=header)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER_ALIGN
-        cell.border = BORDER
+    _append_header(ws_summary, ["Metric", "Value"])
     
     summary_data = [
         ("Total Tests", total),
         ("Passed", passed),
-        ("Failed", failed),
-        ("Skipped", skipped),
+        ("Failed", summary["failed"]),
+        ("Over Budget", summary["perf_failed"]),
+        ("Skipped", summary["skipped"]),
         ("Pass Rate %", f"{(passed/total*100):.1f}%" if total > 0 else "N/A"),
-        ("Total Duration (s)", f"{total_duration:.2f}"),
+        ("Total Duration (s)", f"{summary['total_duration']:.2f}"),
+        ("Wait Time Saved (s)", f"{summary['total_wait_saved']:.2f}"),
+        ("Implicit Wait Dead Time (s)", f"{summary['total_implicit_wait']:.2f}"),
         ("Run Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
     ]
     
-    for row_num, (metric, value) in enumerate(summary_data, 2):
-        ws_summary.cell(row=row_num, column=1, value=metric).border = BORDER
-        cell = ws_summary.cell(row=row_num, column=2, value=value)
-        cell.border = BORDER
-        cell.alignment = CENTER_ALIGN
+    for metric, value in summary_data:
+        style = "number"
         
         # Color pass rate
-        if metric == "Pass Rate %":
-            if total > 0:
-                rate = passed / total * 100
-                if rate >= 90:
-                    cell.fill = PASS_FILL
-                elif rate >= 70:
-                    cell.fill = SKIP_FILL
-                else:
-                    cell.fill = FAIL_FILL
+        if metric == "Pass Rate %" and total > 0:
+            rate = passed / total * 100
+            if rate >= 90:
+                style = "pass"
+            elif rate >= 70:
+                style = "skip"
+            else:
+                style = "fail"
+        
+        ws_summary.append([_styled(ws_summary, metric, "plain"), _styled(ws_summary, value, style)])
     
     # Module breakdown
-    start_row = len(summary_data) + 4
-    ws_summary.cell(row=start_row, column=1, value="Module Breakdown").font = Font(bold=True, size=12)
+    ws_summary.append([])
+    ws_summary.append([])
+    ws_summary.append([_styled(ws_summary, "Module Breakdown", "heading")])
     
-    module_headers = ["Module", "Passed", "Failed", "Skipped", "Total", "Pass Rate"]
-    for col_num, header in enumerate(module_headers, 1):
-        cell = ws_summary.cell(row=start_row + 1, column=col_num, value=header)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER_ALIGN
-        cell.border = BORDER
+    _append_header(ws_summary, ["Module", "Passed", "Failed", "Over Budget", "Skipped", "Total", "Pass Rate"])
     
-    for row_num, (module, stats) in enumerate(module_stats.items(), start_row + 2):
-        module_total = stats["passed"] + stats["failed"] + stats["skipped"]
+    for module, stats in summary["module_stats"].items():
+        module_total = stats["passed"] + stats["failed"] + stats["perf_failed"] + stats["skipped"]
         pass_rate = f"{(stats['passed']/module_total*100):.1f}%" if module_total > 0 else "N/A"
         
         module_data = [
             module,
             stats["passed"],
             stats["failed"],
+            stats["perf_failed"],
             stats["skipped"],
             module_total,
             pass_rate
         ]
         
-        for col_num, value in enumerate(module_data, 1):
-            cell = ws_summary.cell(row=row_num, column=col_num, value=value)
+        ws_summary.append([
+            _styled(ws_summary, value, "number" if col_num > 1 else "text")
+            for col_num, value in enumerate(module_data, 1)
+        ])
+    
+    # Budget breaches (every one blocks the release like a failure)
+    if summary["budget_breaches"]:
+        ws_summary.append([])
+        ws_summary.append([])
+        ws_summary.append([_styled(ws_summary, "Budget Breaches", "heading")])
+        
+        _append_header(ws_summary, ["Module", "Test Name", "Breach"])
+        
+        for module, test_name, breach in summary["budget_breaches"]:
+            ws_summary.append([
+                _styled(ws_summary, module, "text"),
+                _styled(ws_summary, test_name, "text"),
+                _styled(ws_summary, breach, "breach"),
+            ])
+
+
+def create_report_workbook(store: Dict[str, Any]) -> Workbook:
+    """
+    Write a result store into a new write-only workbook: the Summary sheet
+    and the Test Results sheet, streamed row by row. Further sheets
+    (Network, Regressions, Trends) are appended by the add_*_sheet functions.
+    Returns the Workbook, ready for save_report().
+    """
+    wb = Workbook(write_only=True)
+    _add_named_styles(wb)
+    
+    write_summary_sheet(wb, generate_summary(store))
+    
+    # Main results sheet
+    ws = wb.create_sheet("Test Results")
+    
+    # Set column widths (write-only sheets need them before the first row)
+    for col_num, (_, width) in enumerate(RESULT_COLUMNS, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    # Freeze header row
+    ws.freeze_panes = "A2"
+    
+    _append_header(ws, [header for header, _ in RESULT_COLUMNS])
+    
+    # Duration, timing, vitals and network columns are centered, the rest left aligned
+    column_styles = [
+        "number" if col_num == 4 or 8 <= col_num < BREACHES_COLUMN else "text"
+        for col_num in range(1, len(RESULT_COLUMNS) + 1)
+    ]
+    
+    for data in zip(*store["columns"]):
+        row = [_styled(ws, value, style) for value, style in zip(data, column_styles)]
+        
+        # Status color
+        row[2].style = STATUS_STYLES.get(data[2], "skip")
+        
+        if data[BREACHES_COLUMN - 1]:
+            row[BREACHES_COLUMN - 1].style = "breach"
+        if data[BREACHES_COLUMN - 2]:  # N+1 Routes
+            row[BREACHES_COLUMN - 2].style = "skip"
+        
+        ws.append(row)
+    
+    return wb
+
+
+def add_trends_sheet(
+    wb: Workbook,
+    test_stats: List[Dict[str, Any]],
+    module_stats: List[Dict[str, Any]],
+    last_n: int
+) -> None:
+    """
+    Add a Trends sheet with duration percentiles across recent runs.
+    
+    Args:
+        wb: The workbook to add to
+        test_stats: Per-test rows from history.duration_percentiles(by="test")
+        module_stats: Per-module rows from history.duration_percentiles(by="module")
+        last_n: Number of runs the percentiles cover
+    """
+    ws = wb.create_sheet("Trends")
+    
+    for col_num, width in enumerate([20, 40, 10, 10, 10, 10, 12], 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    ws.freeze_panes = "A2"
+    
+    ws.append([_styled(ws, f"Duration percentiles across the last {last_n} runs", "heading")])
+    ws.append([])
+    
+    def write_table(headers, rows):
+        _append_header(ws, headers)
+        
+        for values in rows:
+            values = [round(value, 3) if isinstance(value, float) else value for value in values]
+            ws.append([_styled(ws, value, "text" if isinstance(value, str) else "number") for value in values])
+        
+        ws.append([])
+        ws.append([])
+    
+    write_table(
+        ["Module", "Runs", "p50 (s)", "p90 (s)", "p99 (s)", "Latest (s)"],
+        [
+            [m["module"], m["runs"], m["p50"], m["p90"], m["p99"], m["latest"]]
+            for m in sorted(module_stats, key=lambda m: m["module"])
+        ],
+    )
+    
+    # Slowest tests first
+    write_table(
+        ["Module", "Test Name", "Runs", "p50 (s)", "p90 (s)", "p99 (s)", "Latest (s)"],
+        [
+            [t["module"], t["test_name"], t["runs"], t["p50"], t["p90"], t["p99"], t["latest"]]
+            for t in sorted(test_stats, key=lambda t: t["p90"], reverse=True)
+        ],
+    )
+
+
+def add_network_sheet(wb: Workbook, results: List[Dict[str, Any]]) -> None:
+    """
+    Add a Network sheet with one row per (test, API route): call count,
+    distinct URLs, bytes and timing. Routes flagged as N+1, or called
+    repeatedly with identical requests, are highlighted.
+    
+    Args:
+        wb: The workbook to add to
+        results: Result dicts from run.py carrying a "network" summary
+    """
+    rows = [
+        (result, route)
+        for result in results
+        if result.get("network") and result["network"].get("routes")
+        for route in result["network"]["routes"].values()
+    ]
+    if not rows:
+        return
+    
+    ws = wb.create_sheet("Network")
+    headers = [
+        "Module", "Test Name", "Method", "Route", "Calls", "Distinct URLs",
+        "Bytes", "Avg (ms)", "Max (ms)", "Statuses", "Flag",
+    ]
+    for col_num, width in enumerate([15, 40, 8, 50, 8, 13, 12, 10, 10, 20, 14], 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    ws.freeze_panes = "A2"
+    
+    _append_header(ws, headers)
+    
+    for result, route in rows:
+        n_plus_one = any(
+            flagged["route"] == f"{route['method']} {route['route']}"
+            for flagged in result["network"].get("n_plus_one", [])
+        )
+        if n_plus_one:
+            flag = "N+1"
+        elif route["distinct"] < route["count"]:
+            flag = "Duplicate"
+        else:
+            flag = ""
+        
+        values = [
+            result["module"],
+            result["test_name"],
+            route["method"],
+            route["route"],
+            route["count"],
+            route["distinct"],
+            route["bytes"],
+            round(route["total_ms"] / route["count"], 1),
+            round(route["max_ms"], 1),
+            ", ".join(f"{status}x{count}" for status, count in sorted(route["statuses"].items())),
+            flag,
+        ]
+        row = [
+            _styled(ws, value, "text" if col_num in (1, 2, 4, 10) else "number")
+            for col_num, value in enumerate(values, 1)
+        ]
+        if flag:
+            row[10].style = "fail" if n_plus_one else "skip"
+        ws.append(row)
+
+
+def add_browsers_sheet(wb: Workbook, browsers: List[Dict[str, Any]]) -> None:
+    """
+    Add a Browsers sheet with one row per pooled Chrome: startup time, tests
+    served, peak memory, lifetime and why it was retired. Browsers replaced
+    after an error or over the memory limit are highlighted.
+    
+    Args:
+        wb: The workbook to add to
+        browsers: Metric dicts from pool.stop_pool() (or the run log)
+    """
+    if not browsers:
+        return
+    
+    ws = wb.create_sheet("Browsers")
+    headers = [
+        "Run", "Browser", "Worker", "Started", "Startup (s)", "Tests",
+        "Peak RSS (MB)", "Lifetime (s)", "Retired",
+    ]
+    for col_num, width in enumerate([22, 10, 8, 20, 12, 8, 14, 12, 40], 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    ws.freeze_panes = "A2"
+    
+    _append_header(ws, headers)
+    
+    for browser in browsers:
+        values = [
+            browser.get("run_id", ""),
+            browser["browser"],
+            browser.get("worker") or "",
+            browser["started_at"],
+            round(browser["startup_s"], 2) if browser["startup_s"] is not None else "",
+            browser["tests"],
+            round(browser["peak_rss_mb"]) if browser["peak_rss_mb"] is not None else "",
+            round(browser["lifetime_s"], 1) if browser["lifetime_s"] is not None else "",
+            browser["retired"] or "",
+        ]
+        row = [
+            _styled(ws, value, "text" if col_num in (1, 2, 4, 9) else "number")
+            for col_num, value in enumerate(values, 1)
+        ]
+        retired = browser["retired"] or ""
+        if retired == "browser error" or retired.startswith(("memory", "failed")):
+            row[8].style = "fail"
+        elif retired == "circuit breaker":
+            row[8].style = "skip"
+        ws.append(row)
+
+
+def add_regressions_sheet(
+    wb: Workbook,
+    regressions: List[Dict[str, Any]],
+    baseline: Optional[str] = None
+) -> None:
+    """
+    Add a Regressions sheet listing significant slowdowns against a baseline.
+    
+    Args:
+        wb: The workbook to add to
+        regressions: Rows from regression.find_regressions()
+        baseline: Baseline name or run id, for the title
+    """
+    ws = wb.create_sheet("Regressions")
+    
+    title = f"Significant slowdowns vs baseline {baseline}" if baseline else "Significant slowdowns"
+    
+    if not regressions:
+        ws.column_dimensions["A"].width = 30
+        ws.append([_styled(ws, title, "heading")])
+        ws.append([])
+        ws.append(["No significant slowdowns"])
+        return
+    
+    headers = [
+        "Module", "Test Name", "Metric", "Baseline n", "Current n", "Baseline Median",
+        "Current Median", "Change %", "p-value", "q-value", "Confidence %", "Cliff's Delta", "Effect",
+    ]
+    widths = [15, 40, 35, 11, 10, 15, 15, 10, 10, 10, 13, 13, 11]
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    ws.freeze_panes = "A4"
+    
+    ws.append([_styled(ws, title, "heading")])
+    ws.append([])
+    _append_header(ws, headers)
+    
+    for r in regressions:
+        values = [
+            r["module"],
+            r["test_name"],
+            r["metric"],
+            r["baseline_n"],
+            r["current_n"],
+            round(r["baseline_median"], 3),
+            round(r["current_median"], 3),
+            round(r["change_pct"], 1) if r["change_pct"] is not None else "",
+            round(r["p_value"], 4),
+            round(r["q_value"], 4),
+            round(r["confidence"] * 100, 1),
+            round(r["delta"], 2),
+            r["magnitude"],
+        ]
+        row = [
+            _styled(ws, value, "text" if col_num <= 3 else "number")
+            for col_num, value in enumerate(values, 1)
+        ]
+        if r["magnitude"] == "large":
+            row[12].style = "fail"
+        ws.append(row)
+
+
+def create_soak_report(soak_results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    """
+    Write a leak soak report: a summary of growth per module and metric,
+    then one sheet per module with every cycle's samples and a chart.
+    
+    Args:
+        soak_results: Results from utils.soak.soak_module()
+        filename: Report file name (default soak_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from openpyxl.chart import LineChart, Reference
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Soak Summary"
+    
+    headers = ["Module", "Metric", "Samples", "Start", "End", "Growth %", "Per Cycle", "Spearman rho", "Leak"]
+    for col_num, (header, width) in enumerate(zip(headers, [18, 16, 10, 14, 14, 10, 12, 13, 8]), 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    row_num = 2
+    for result in soak_results:
+        for metric, trend in result["trends"].items():
+            values = [
+                result["module"],
+                metric,
+                trend["samples"],
+                round(trend["start"], 1) if trend["start"] is not None else "",
+                round(trend["end"], 1) if trend["end"] is not None else "",
+                round(trend["growth"] * 100, 1) if trend["growth"] is not None else "",
+                round(trend["per_cycle"], 2) if trend["per_cycle"] is not None else "",
+                round(trend["rho"], 3) if trend["rho"] is not None else "",
+                "YES" if trend["leaking"] else "",
+            ]
+            for col_num, value in enumerate(values, 1):
+                cell = ws.cell(row=row_num, column=col_num, value=value)
+                cell.border = BORDER
+                cell.alignment = LEFT_ALIGN if col_num <= 2 else CENTER_ALIGN
+                if col_num == 9:
+                    cell.fill = FAIL_FILL if trend["leaking"] else PASS_FILL
+            row_num += 1
+    ws.freeze_panes = "A2"
+    
+    for result in soak_results:
+        ws_module = wb.create_sheet(result["module"][:31])
+        columns = ["cycle", "seconds"] + list(result["trends"])
+        for col_num, header in enumerate(columns, 1):
+            cell = ws_module.cell(row=1, column=col_num, value=header)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = CENTER_ALIGN
+            ws_module.column_dimensions[get_column_letter(col_num)].width = 15
+        for sample_row, sample in enumerate(result["samples"], 2):
+            for col_num, key in enumerate(columns, 1):
+                value = sample.get(key)
+                ws_module.cell(row=sample_row, column=col_num, value=round(value, 3) if isinstance(value, float) else value)
+        ws_module.freeze_panes = "A2"
+        
+        # One chart per metric family: heap bytes, DOM/listener counts
+        last_row = len(result["samples"]) + 1
+        cycles = Reference(ws_module, min_col=1, min_row=2, max_row=last_row)
+        for anchor_row, title, metrics in (
+            (2, "Heap (bytes)", ["js_heap_used", "cdp_heap_used"]),
+            (20, "DOM nodes / listeners", ["dom_nodes", "live_nodes", "listeners"]),
+        ):
+            chart = LineChart()
+            chart.title = title
+            chart.x_axis.title = "Cycle"
+            for metric in metrics:
+                col_num = columns.index(metric) + 1
+                chart.add_data(Reference(ws_module, min_col=col_num, min_row=1, max_row=last_row), titles_from_data=True)
+            chart.set_categories(cycles)
+            chart.width = 24
+            ws_module.add_chart(chart, f"{get_column_letter(len(columns) + 2)}{anchor_row}")
+    
+    if filename is None:
+        filename = f"soak_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_planner_bench_report(bench_results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    """
+    Write a Prod Planner drag / resize benchmark report: one row per grid
+    size and gesture. p95 frame times within one frame budget are green,
+    within two amber, slower red.
+    
+    Args:
+        bench_results: Results from utils.planner_bench.benchmark_grid()
+        filename: Report file name (default planner_bench_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Planner Bench"
+    
+    columns = [
+        ("Blocks/Month", None, 13),
+        ("Month", None, 10),
+        ("Rendered", None, 10),
+        ("Gesture", None, 10),
+        ("Gestures", "gestures", 10),
+        ("Frames", "frames", 10),
+        ("FPS", "fps", 8),
+        ("p50 Frame (ms)", "p50_frame_ms", 14),
+        ("p95 Frame (ms)", "p95_frame_ms", 14),
+        ("Max Frame (ms)", "max_frame_ms", 14),
+        ("Dropped Frames", "dropped_frames", 14),
+        ("Dropped %", "dropped_pct", 11),
+        ("Long Tasks", "long_tasks", 11),
+        ("TBT (ms)", "tbt", 10),
+        ("Errors", "errors", 8),
+    ]
+    for col_num, (header, _, width) in enumerate(columns, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    p95_column = [key for _, key, _ in columns].index("p95_frame_ms") + 1
+    row_num = 2
+    for result in bench_results:
+        for gesture in ("drag", "resize"):
+            stats = result.get(gesture)
+            if stats is None:
+                continue
+            values = [result["grid"], result["month"], result["blocks"], gesture] + [
+                round(stats[key], 1) if isinstance(stats[key], float) else stats[key]
+                for _, key, _ in columns[4:]
+            ]
+            for col_num, value in enumerate(values, 1):
+                cell = ws.cell(row=row_num, column=col_num, value="" if value is None else value)
+                cell.border = BORDER
+                cell.alignment = CENTER_ALIGN
+            
+            # 10% slack for vsync jitter around the frame interval
+            p95 = stats["p95_frame_ms"]
+            if p95 is not None:
+                ws.cell(row=row_num, column=p95_column).fill = (
+                    PASS_FILL if p95 <= FRAME_BUDGET_MS * 1.1 else
+                    SKIP_FILL if p95 <= FRAME_BUDGET_MS * 2.1 else FAIL_FILL
+                )
+            row_num += 1
+    ws.freeze_panes = "A2"
+    
+    if filename is None:
+        filename = f"planner_bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_scaling_report(scaling_results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    """
+    Write a master data scaling report: one row per Master tab and size with
+    the growth exponent from the previous size (flagged when superlinear),
+    then a "Scaling Curves" sheet charting each metric against seeded rows.
+    
+    Args:
+        scaling_results: Results from utils.scaling.benchmark_size()
+        filename: Report file name (default master_scaling_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from openpyxl.chart import LineChart, Reference
+    from utils.scaling import scaling_exponents
+    
+    # (header, getter on a tab result, growth exponent column)
+    metrics = [
+        ("First Row (ms)", lambda t: t["first_row_ms"], True),
+        ("Full Render (ms)", lambda t: t["full_render_ms"], True),
+        ("Sort (ms)", lambda t: t["sort_ms"], True),
+        ("Scroll p95 Frame (ms)", lambda t: t["scroll"] and t["scroll"]["p95_frame_ms"], False),
+        ("Scroll Dropped Frames", lambda t: t["scroll"] and t["scroll"]["dropped_frames"], False),
+        ("Scroll TBT (ms)", lambda t: t["scroll"] and t["scroll"]["tbt"], False),
+    ]
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Master Scaling"
+    
+    headers = ["Tab", "Seeded Rows", "Rendered Rows", "Masters Load (s)"]
+    for header, _, has_exponent in metrics:
+        headers.append(header)
+        if has_exponent:
+            headers.append(f"{header.split(' (')[0]} Exponent")
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = 20 if col_num == 1 else 14
+    
+    tabs = list(dict.fromkeys(tab for result in scaling_results for tab in result["tabs"]))
+    row_num = 2
+    for tab in tabs:
+        runs = [r for r in scaling_results if tab in r["tabs"]]
+        exponents = {
+            header: scaling_exponents([(r["seeded"], getter(r["tabs"][tab])) for r in runs])
+            for header, getter, has_exponent in metrics if has_exponent
+        }
+        for index, run in enumerate(runs):
+            stats = run["tabs"][tab]
+            values = [tab, run["seeded"], stats["rows"], round(run["load_s"], 2)]
+            flagged = []
+            for header, getter, has_exponent in metrics:
+                value = getter(stats)
+                values.append(round(value, 1) if isinstance(value, float) else value)
+                if has_exponent:
+                    exponent = exponents[header][index]
+                    values.append(round(exponent, 2) if exponent is not None else None)
+                    if exponent is not None and exponent >= SCALING_SUPERLINEAR:
+                        flagged.append(len(values))
+            for col_num, value in enumerate(values, 1):
+                cell = ws.cell(row=row_num, column=col_num, value="" if value is None else value)
+                cell.border = BORDER
+                cell.alignment = LEFT_ALIGN if col_num == 1 else CENTER_ALIGN
+                if col_num in flagged:
+                    cell.fill = FAIL_FILL
+            row_num += 1
+    ws.freeze_panes = "B2"
+    
+    # One pivot (seeded rows x tabs) and line chart per metric
+    ws_curves = wb.create_sheet("Scaling Curves")
+    sizes = [r["seeded"] for r in scaling_results]
+    pivot_row = 1
+    for header, getter, _ in metrics:
+        ws_curves.cell(row=pivot_row, column=1, value=header).font = Font(bold=True)
+        ws_curves.cell(row=pivot_row + 1, column=1, value="Seeded Rows").font = Font(bold=True)
+        for col_num, tab in enumerate(tabs, 2):
+            ws_curves.cell(row=pivot_row + 1, column=col_num, value=tab).font = Font(bold=True)
+        for offset, result in enumerate(scaling_results, 2):
+            ws_curves.cell(row=pivot_row + offset, column=1, value=str(result["seeded"]))
+            for col_num, tab in enumerate(tabs, 2):
+                value = getter(result["tabs"][tab]) if tab in result["tabs"] else None
+                ws_curves.cell(row=pivot_row + offset, column=col_num, value=value)
+        
+        last_row = pivot_row + 1 + len(sizes)
+        chart = LineChart()
+        chart.title = header
+        chart.x_axis.title = "Seeded rows per table"
+        chart.add_data(
+            Reference(ws_curves, min_col=2, max_col=len(tabs) + 1, min_row=pivot_row + 1, max_row=last_row),
+            titles_from_data=True,
+        )
+        chart.set_categories(Reference(ws_curves, min_col=1, min_row=pivot_row + 2, max_row=last_row))
+        chart.width = 20
+        ws_curves.add_chart(chart, f"{get_column_letter(len(tabs) + 3)}{pivot_row}")
+        pivot_row = max(last_row + 2, pivot_row + 16)
+    ws_curves.column_dimensions["A"].width = 22
+    
+    if filename is None:
+        filename = f"master_scaling_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_load_report(load_result: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """
+    Write an API load report: per-route throughput, latency percentiles and
+    error rate (error rates above LOAD_MAX_ERROR_RATE in red), and a
+    per-second timeline of requests, errors and p95 latency with a chart.
+    
+    Args:
+        load_result: Result from utils.load.run_load()
+        filename: Report file name (default load_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from openpyxl.chart import LineChart, Reference
+    from utils.load import TOTAL_ROUTE, load_timeline
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Load Summary"
+    
+    ws.cell(row=1, column=1, value=(
+        f"Scenario {load_result['scenario']}: {load_result['users']} users, "
+        f"{load_result['ramp_up']:.0f}s ramp-up + {load_result['duration']:.0f}s, "
+        f"{datetime.fromtimestamp(load_result['started']).strftime('%Y-%m-%d %H:%M:%S')}"
+    )).font = Font(bold=True, size=12)
+    
+    columns = [
+        ("Route", None, 44),
+        ("Requests", "requests", 10),
+        ("Throughput (req/s)", "throughput", 17),
+        ("p50 (ms)", "p50_ms", 10),
+        ("p95 (ms)", "p95_ms", 10),
+        ("p99 (ms)", "p99_ms", 10),
+        ("Max (ms)", "max_ms", 10),
+        ("Mean (ms)", "mean_ms", 10),
+        ("Errors", "errors", 8),
+        ("Error Rate %", "error_rate", 12),
+        ("KB", "bytes", 10),
+        ("Statuses", "statuses", 30),
+    ]
+    for col_num, (header, _, width) in enumerate(columns, 1):
+        cell = ws.cell(row=3, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    error_column = [key for _, key, _ in columns].index("error_rate") + 1
+    routes = load_result["routes"]
+    ordered = sorted((r for r in routes if r != TOTAL_ROUTE), key=lambda r: -routes[r]["p95_ms"]) + [TOTAL_ROUTE]
+    for row_num, route in enumerate(ordered, 4):
+        stats = routes[route]
+        values = [route]
+        for _, key, _ in columns[1:]:
+            value = stats[key]
+            if key == "error_rate":
+                value = round(value * 100, 2)
+            elif key == "bytes":
+                value = round(value / 1024, 1)
+            elif key == "statuses":
+                value = ", ".join(f"{status}: {count}" for status, count in sorted(value.items()))
+            elif isinstance(value, float):
+                value = round(value, 1)
+            values.append(value)
+        for col_num, value in enumerate(values, 1):
+            cell = ws.cell(row=row_num, column=col_num, value=value)
             cell.border = BORDER
-            cell.alignment = CENTER_ALIGN if col_num > 1 else LEFT_ALIGN
+            cell.alignment = LEFT_ALIGN if col_num in (1, len(columns)) else CENTER_ALIGN
+            if route == TOTAL_ROUTE:
+                cell.font = Font(bold=True)
+        ws.cell(row=row_num, column=error_column).fill = (
+            FAIL_FILL if stats["error_rate"] > LOAD_MAX_ERROR_RATE else PASS_FILL
+        )
+    ws.freeze_panes = "B4"
     
-    # Set column widths
-    ws_summary.column_dimensions['A'].width = 20
-    ws_summary.column_dimensions['B'].width = 15
-    ws_summary.column_dimensions['C'].width = 10
-    ws_summary.column_dimensions['D'].width = 10
-    ws_summary.column_dimensions['E'].width = 10
-    ws_summary.column_dimensions['F'].width = 12
+    ws_timeline = wb.create_sheet("Load Timeline")
+    headers = ["Second", "Requests", "Errors", "p95 (ms)"]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws_timeline.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        ws_timeline.column_dimensions[get_column_letter(col_num)].width = 12
+    timeline = load_timeline(load_result["samples"], load_result["started"])
+    for row_num, bucket in enumerate(timeline, 2):
+        for col_num, key in enumerate(["second", "requests", "errors", "p95_ms"], 1):
+            value = bucket[key]
+            ws_timeline.cell(row=row_num, column=col_num, value=round(value, 1) if isinstance(value, float) else value)
+    ws_timeline.freeze_panes = "A2"
     
-    return {
-        "total": total,
-        "passed": passed,
-        "failed": failed,
-        "skipped": skipped,
-        "pass_rate": (passed/total*100) if total > 0 else 0,
-        "total_duration": total_duration,
-        "module_stats": module_stats
-    }
+    if timeline:
+        last_row = len(timeline) + 1
+        seconds = Reference(ws_timeline, min_col=1, min_row=2, max_row=last_row)
+        for anchor_row, title, min_col, max_col in ((2, "Requests / errors per second", 2, 3), (20, "p95 latency (ms)", 4, 4)):
+            chart = LineChart()
+            chart.title = title
+            chart.x_axis.title = "Second"
+            chart.add_data(
+                Reference(ws_timeline, min_col=min_col, max_col=max_col, min_row=1, max_row=last_row),
+                titles_from_data=True,
+            )
+            chart.set_categories(seconds)
+            chart.width = 24
+            ws_timeline.add_chart(chart, f"F{anchor_row}")
+    
+    if filename is None:
+        filename = f"load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_stock_bench_report(bench_result: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """
+    Write a stock posting benchmark report: postings per second and latency
+    per parallelism level with charts, and the ledger vs balance check per
+    item and location (inconsistent rows in red).
+    
+    Args:
+        bench_result: Result from utils.stock_bench.run_stock_bench()
+        filename: Report file name (default stock_bench_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from openpyxl.chart import LineChart, Reference
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Stock Posting"
+    
+    columns = [
+        ("Parallelism", "parallelism", 12),
+        ("Documents", "documents", 11),
+        ("Seconds", "seconds", 10),
+        ("Postings/s", "postings_per_s", 11),
+        ("p50 (ms)", "p50_ms", 10),
+        ("p95 (ms)", "p95_ms", 10),
+        ("p99 (ms)", "p99_ms", 10),
+        ("Max (ms)", "max_ms", 10),
+        ("Errors", "errors", 8),
+        ("Statuses", "statuses", 30),
+    ]
+    for col_num, (header, _, width) in enumerate(columns, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    levels = bench_result["levels"]
+    for row_num, level in enumerate(levels, 2):
+        for col_num, (_, key, _) in enumerate(columns, 1):
+            value = level[key]
+            if key == "statuses":
+                value = ", ".join(f"{status}: {count}" for status, count in sorted(value.items()))
+            elif isinstance(value, float):
+                value = round(value, 1)
+            cell = ws.cell(row=row_num, column=col_num, value=value)
+            cell.border = BORDER
+            cell.alignment = LEFT_ALIGN if key == "statuses" else CENTER_ALIGN
+        ws.cell(row=row_num, column=9).fill = FAIL_FILL if level["errors"] else PASS_FILL
+    ws.freeze_panes = "A2"
+    
+    if levels:
+        last_row = len(levels) + 1
+        parallelism = Reference(ws, min_col=1, min_row=2, max_row=last_row)
+        for anchor_row, title, min_col, max_col in ((len(levels) + 4, "Postings per second", 4, 4), (len(levels) + 22, "Latency (ms)", 5, 7)):
+            chart = LineChart()
+            chart.title = title
+            chart.x_axis.title = "Concurrent posters"
+            chart.add_data(Reference(ws, min_col=min_col, max_col=max_col, min_row=1, max_row=last_row), titles_from_data=True)
+            chart.set_categories(parallelism)
+            chart.width = 20
+            ws.add_chart(chart, f"A{anchor_row}")
+    
+    ws_check = wb.create_sheet("Stock Consistency")
+    headers = [
+        ("Item Code", "item_code", 18),
+        ("Location", "location", 12),
+        ("Expected", "expected", 12),
+        ("Ledger Sum", "ledger_sum", 12),
+        ("Balance", "balance", 12),
+        ("Ledger Entries", "entries", 14),
+        ("Chain Breaks", "chain_breaks", 13),
+        ("Consistent", "consistent", 12),
+    ]
+    for col_num, (header, _, width) in enumerate(headers, 1):
+        cell = ws_check.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws_check.column_dimensions[get_column_letter(col_num)].width = width
+    
+    for row_num, row in enumerate(bench_result["consistency"], 2):
+        fill = PASS_FILL if row["consistent"] else FAIL_FILL
+        for col_num, (_, key, _) in enumerate(headers, 1):
+            value = row[key]
+            if key == "consistent":
+                value = "YES" if value else "NO"
+            elif isinstance(value, float):
+                value = round(value, 4)
+            cell = ws_check.cell(row=row_num, column=col_num, value=value)
+            cell.border = BORDER
+            cell.alignment = LEFT_ALIGN if col_num == 1 else CENTER_ALIGN
+            cell.fill = fill
+    ws_check.freeze_panes = "A2"
+    
+    if filename is None:
+        filename = f"stock_bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_dpr_upload_report(upload_results: List[Dict[str, Any]], filename: Optional[str] = None) -> str:
+    """
+    Write a DPR upload benchmark report: one row per workbook size with the
+    upload-excel and dpr-excel timings, server memory and failures (in red),
+    and a chart of upload time against rows.
+    
+    Args:
+        upload_results: Results from utils.dpr_bench.run_dpr_bench()
+        filename: Report file name (default dpr_upload_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from openpyxl.chart import LineChart, Reference
+    
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "DPR Upload"
+    
+    # (header, route or None for workbook keys, key, width)
+    columns = [
+        ("Days", None, "days", 7),
+        ("Machines", None, "machines", 10),
+        ("Rows", None, "rows", 8),
+        ("Sheets", None, "sheets", 8),
+        ("File KB", None, "bytes", 9),
+        ("upload-excel (s)", "upload-excel", "ms", 15),
+        ("upload-excel rows/s", "upload-excel", "rows_per_s", 18),
+        ("Imported", "upload-excel", "imported", 10),
+        ("Server Peak +MB", "upload-excel", "rss_spike_mb", 15),
+        ("Server Retained +MB", "upload-excel", "rss_growth_mb", 18),
+        ("dpr-excel (s)", "dpr-excel", "ms", 13),
+        ("Parse (ms)", "dpr-excel", "parse_ms", 11),
+        ("Insert (s)", "dpr-excel", "insert_ms", 10),
+        ("Peak Request (ms)", "dpr-excel", "peak_ms", 17),
+        ("dpr-excel rows/s", "dpr-excel", "rows_per_s", 15),
+        ("Server Peak +MB", "dpr-excel", "rss_spike_mb", 15),
+        ("Server Retained +MB", "dpr-excel", "rss_growth_mb", 18),
+        ("Errors", None, None, 60),
+    ]
+    for col_num, (header, _, _, width) in enumerate(columns, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+    
+    routes = ("upload-excel", "dpr-excel")
+    for row_num, result in enumerate(upload_results, 2):
+        errors = [f"{route}: {result[route]['error']}" for route in routes if result[route]["error"]]
+        for col_num, (_, route, key, _) in enumerate(columns, 1):
+            if key is None:
+                value = "; ".join(errors)
+            else:
+                value = (result[route] if route else result).get(key)
+                if key in ("ms", "insert_ms"):
+                    value = value / 1000 if value is not None else None
+                elif key == "bytes":
+                    value = value / 1024
+            cell = ws.cell(row=row_num, column=col_num, value=round(value, 1) if isinstance(value, float) else value)
+            cell.border = BORDER
+            cell.alignment = LEFT_ALIGN if key is None else CENTER_ALIGN
+            if route and key == "ms":
+                cell.fill = PASS_FILL if result[route]["ok"] else FAIL_FILL
+    ws.freeze_panes = "A2"
+    
+    if upload_results:
+        last_row = len(upload_results) + 1
+        chart = LineChart()
+        chart.title = "Upload time vs rows"
+        chart.x_axis.title = "Rows"
+        chart.y_axis.title = "Seconds"
+        for col_num in (6, 11):
+            chart.add_data(Reference(ws, min_col=col_num, min_row=1, max_row=last_row), titles_from_data=True)
+        chart.set_categories(Reference(ws, min_col=3, min_row=2, max_row=last_row))
+        chart.width = 20
+        ws.add_chart(chart, f"A{last_row + 3}")
+    
+    if filename is None:
+        filename = f"dpr_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
+
+
+def create_report_bench_report(bench_result: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """
+    Write a report engine benchmark report: the REPORT_BENCH_TOP slowest
+    successful combinations, every request with its status (failures in
+    red), and per category the discovered dimensions and metrics with
+    request counts and timings.
+    
+    Args:
+        bench_result: Result from utils.report_bench.run_report_bench()
+        filename: Report file name (default report_bench_YYYYMMDD_HHMMSS.xlsx)
+    
+    Returns:
+        Path to saved report file.
+    """
+    from utils.history import percentile
+    
+    wb = Workbook()
+    results = bench_result["results"]
+    
+    columns = [
+        ("Category", "category", 13),
+        ("Route", "route", 10),
+        ("Combination", "combination", 50),
+        ("Range", "range", 9),
+        ("Median (ms)", "ms", 12),
+        ("Max (ms)", "max_ms", 10),
+        ("KB", "bytes", 9),
+        ("Rows", "rows", 8),
+        ("Status", "status", 8),
+        ("Error", "error", 50),
+    ]
+    
+    def write_rows(ws, rows, ranked):
+        offset = 1 if ranked else 0
+        headers = ([("Rank", None, 6)] if ranked else []) + columns
+        for col_num, (header, _, width) in enumerate(headers, 1):
+            cell = ws.cell(row=1, column=col_num, value=header)
+            cell.font = HEADER_FONT
+            cell.fill = HEADER_FILL
+            cell.alignment = CENTER_ALIGN
+            cell.border = BORDER
+            ws.column_dimensions[get_column_letter(col_num)].width = width
+        for row_num, result in enumerate(rows, 2):
+            if ranked:
+                ws.cell(row=row_num, column=1, value=row_num - 1).border = BORDER
+            for col_num, (_, key, _) in enumerate(columns, 1 + offset):
+                value = result[key]
+                if key == "bytes":
+                    value = value / 1024
+                cell = ws.cell(row=row_num, column=col_num, value=round(value, 1) if isinstance(value, float) else value)
+                cell.border = BORDER
+                cell.alignment = LEFT_ALIGN if key in ("combination", "error") else CENTER_ALIGN
+                if key == "status":
+                    cell.fill = PASS_FILL if result["ok"] else FAIL_FILL
+        ws.freeze_panes = "A2"
+    
+    ws_slowest = wb.active
+    ws_slowest.title = "Slowest Reports"
+    write_rows(ws_slowest, [r for r in results if r["ok"]][:REPORT_BENCH_TOP], ranked=True)
+    
+    write_rows(wb.create_sheet("Report Matrix"), results, ranked=False)
+    
+    ws_catalog = wb.create_sheet("Catalog")
+    headers = ["Category", "Dimensions", "Metrics", "Combinations", "Requests", "Errors", "p50 (ms)", "Slowest (ms)", "Largest (KB)"]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws_catalog.cell(row=1, column=col_num, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cell.alignment = CENTER_ALIGN
+        cell.border = BORDER
+        ws_catalog.column_dimensions[get_column_letter(col_num)].width = 14
+    for row_num, (category, found) in enumerate(bench_result["catalog"].items(), 2):
+        requests_made = [r for r in results if r["category"] == category]
+        times = [r["ms"] for r in requests_made if r["ok"]]
+        errors = sum(1 for r in requests_made if not r["ok"])
+        values = [
+            category,
+            found["dimensions"],
+            found["metrics"],
+            found["combinations"],
+            len(requests_made),
+            errors,
+            round(percentile(times, 50), 1) if times else None,
+            round(max(times), 1) if times else None,
+            round(max((r["bytes"] for r in requests_made), default=0) / 1024, 1),
+        ]
+        for col_num, value in enumerate(values, 1):
+            cell = ws_catalog.cell(row=row_num, column=col_num, value=value)
+            cell.border = BORDER
+            cell.alignment = LEFT_ALIGN if col_num == 1 else CENTER_ALIGN
+        ws_catalog.cell(row=row_num, column=6).fill = FAIL_FILL if errors else PASS_FILL
+    
+    if filename is None:
+        filename = f"report_bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    filepath = REPORT_DIR / filename
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(filepath))
+    
+    return str(filepath)
 
 
 def save_report(wb: Workbook, filename: Optional[str] = None) -> str:
@@ -269,15 +1300,65 @@ def save_report(wb: Workbook, filename: Optional[str] = None) -> str:
     # Ensure directory exists
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    # Generate summary before saving
-    generate_summary(wb)
-    
     # Save workbook
     wb.save(str(filepath))
     
     return str(filepath)
 
 
+def load_report_results(path: str) -> List[Dict[str, Any]]:
+    """
+    Read test results back from a saved report's Test Results sheet.
+    Columns are matched by header, so older reports with fewer columns load.
+    
+    Returns:
+        List of result dicts in the same shape as run.py produces.
+    """
+    from openpyxl import load_workbook
+    
+    columns = {
+        "Module": "module",
+        "Test Name": "test_name",
+        "Status": "status",
+        "Duration (s)": "duration",
+        "Error Message": "error",
+        "Screenshot": "screenshot",
+        "Wait Saved (s)": "wait_saved",
+        "Implicit Wait (s)": "implicit_wait",
+    }
+    vitals_columns = {header: key for header, key, _ in VITALS_COLUMNS}
+    network_columns = {header: key for header, key, _ in NETWORK_COLUMNS}
+    
+    wb = load_workbook(path, read_only=True)
+    ws = wb["Test Results"]
+    rows = ws.iter_rows(values_only=True)
+    headers = next(rows, ())
+    
+    results = []
+    for row in rows:
+        if not row or not row[0]:
+            continue
+        result = {}
+        vitals = {}
+        network = {}
+        for header, value in zip(headers, row):
+            if header in columns:
+                result[columns[header]] = value if value != "" else None
+            elif header in vitals_columns:
+                vitals[vitals_columns[header]] = value if value != "" else None
+            elif header in network_columns:
+                network[network_columns[header]] = value if value != "" else None
+        result["vitals"] = vitals if any(v is not None for v in vitals.values()) else None
+        result["network"] = network if any(v is not None for v in network.values()) else None
+        breaches = dict(zip(headers, row)).get("Budget Breaches")
+        result["budget_breaches"] = breaches.split("; ") if breaches else []
+        result["duration"] = float(result.get("duration") or 0)
+        results.append(result)
+    
+    wb.close()
+    return results
+
+
 def create_quick_report(results: List[Dict[str, Any]]) -> str:
     """
     Convenience function to create a complete report from results list.
@@ -288,20 +1369,25 @@ def create_quick_report(results: List[Dict[str, Any]]) -> str:
     Returns:
         Path to saved report file.
     """
-    wb = create_report_workbook()
+    store = create_result_store()
     
     for result in results:
         add_test_result(
-            wb,
+            store,
             module=result.get("module", "Unknown"),
             test_name=result.get("test_name", "Unknown"),
             status=result.get("status", "SKIP"),
             duration=result.get("duration", 0),
             error=result.get("error"),
-            screenshot=result.get("screenshot")
+            screenshot=result.get("screenshot"),
+            wait_saved=result.get("wait_saved"),
+            implicit_wait=result.get("implicit_wait"),
+            vitals=result.get("vitals"),
+            network=result.get("network"),
+            budget_breaches=result.get("budget_breaches")
         )
     
-    return save_report(wb)
+    return save_report(create_report_workbook(store))
 
 
 
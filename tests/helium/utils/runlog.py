@@ -0,0 +1,132 @@
+"""
+Crash-safe run log for Helium tests
+
+Every run writes an append-only JSON Lines file, RUN_LOG_DIR/<run_id>.jsonl,
+and every test outcome is flushed to disk as soon as it is known, so a run
+that dies halfway (Chrome crash, killed process, lost machine) still has
+everything it finished. The Excel report, summary and trends can be rebuilt
+from one or more logs with `run.py report --from-log`.
+
+One JSON object per line, told apart by "event":
+
+    run     run_id, started_at, workers, tests (planned), argv
+    result  run_id plus the result dict from run_single_test()
+    browser run_id plus one browser's metrics from pool.stop_pool()
+    end     run_id, ended_at (missing when the run did not finish)
+
+Shard logs can be passed together or concatenated into one file; a torn
+last line from a crash mid-write is skipped.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import RUN_LOG_DIR
+
+
+def run_log_path(run_id: str) -> Path:
+    return RUN_LOG_DIR / f"{run_id}.jsonl"
+
+
+def append_event(path: Path, event: Dict[str, Any]) -> None:
+    """
+    Append one event as a JSON line and force it to disk.
+    """
+    line = json.dumps(event, default=str)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def start_run_log(run_id: str, started_at: datetime, workers: int, tests: int) -> Path:
+    """
+    Create the run's log with its header line. Returns the log path.
+    """
+    path = run_log_path(run_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    append_event(path, {
+        "event": "run",
+        "run_id": run_id,
+        "started_at": started_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "workers": workers,
+        "tests": tests,
+        "argv": sys.argv[1:],
+    })
+    return path
+
+
+def log_result(path: Path, result: Dict[str, Any]) -> None:
+    """
+    Append one test result to a run log (run_id is taken from the file name).
+    """
+    append_event(path, {"event": "result", "run_id": path.stem, **result})
+
+
+def log_browser(path: Path, metrics: Dict[str, Any]) -> None:
+    """
+    Append one pooled browser's metrics (startup, tests served, peak memory).
+    """
+    append_event(path, {"event": "browser", "run_id": path.stem, **metrics})
+
+
+def finish_run_log(path: Path) -> None:
+    """
+    Mark the run as finished: every planned test has a result line.
+    """
+    append_event(path, {
+        "event": "end",
+        "run_id": path.stem,
+        "ended_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    })
+
+
+def read_run_logs(paths: List[Path]) -> Dict[str, Any]:
+    """
+    Read one or more run logs.
+
+    Returns dict with keys: runs ({run_id: {"started_at", "workers",
+    "tests", "finished", "results"}}), results (every result dict in log
+    order, each with its run_id) and browsers (browser metrics, likewise).
+    Lines that do not parse are skipped.
+    """
+    runs: Dict[str, Dict[str, Any]] = {}
+    results = []
+    browsers = []
+
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A torn line from a crashed shard runs into the next file's
+                    # first line when logs are concatenated; keep that one
+                    try:
+                        event = json.loads(line[line.rfind('{"event": '):])
+                    except ValueError:
+                        continue
+                if not isinstance(event, dict) or "run_id" not in event:
+                    continue
+
+                run = runs.setdefault(event["run_id"], {
+                    "started_at": None, "workers": 1, "tests": None, "finished": False, "results": 0,
+                })
+                kind = event.pop("event", None)
+                if kind == "run":
+                    run["started_at"] = event.get("started_at")
+                    run["workers"] = event.get("workers") or 1
+                    run["tests"] = event.get("tests")
+                elif kind == "end":
+                    run["finished"] = True
+                elif kind == "result":
+                    run["results"] += 1
+                    results.append(event)
+                elif kind == "browser":
+                    browsers.append(event)
+
+    return {"runs": runs, "results": results, "browsers": browsers}
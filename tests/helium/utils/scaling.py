@@ -0,0 +1,261 @@
+"""
+Master data scaling benchmark for Helium tests
+
+Plants keep adding machines, molds and materials, and the Master tabs load
+and render every row. This benchmark seeds 100 / 1k / 10k / 50k rows
+(MASTER_BENCH_SIZES) into the machines, molds, raw_materials and
+packing_materials tables through Supabase's REST API, reloads the app and,
+for each Master tab, measures:
+
+    first_row_ms     click on the tab until the first table row is rendered
+    full_render_ms   click until the table's last DOM update before idle
+    sort_ms          click on the first sortable header until re-rendered
+    scroll           frame times while scrolling the table top to bottom
+
+Times come from the page clock via the idle tracker (utils.waits) and the
+frame probe (utils.frames). scaling_exponents() turns each metric into the
+local growth exponent between sizes: 1 is linear, 2 quadratic. Seeded rows
+carry a BENCH- marker and are deleted afterwards. Rendered row counts are
+reported next to seeded ones, since Supabase caps an unpaged select at its
+max_rows setting (1000 by default).
+"""
+import math
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from helium import get_driver
+from selenium.webdriver.common.by import By
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    MODULES,
+    TIMEOUT,
+    MASTER_BENCH_SEED_BATCH,
+    MASTER_BENCH_SCROLL_FRAMES,
+)
+from utils.browser import wait_for_page_load
+from utils.helpers import navigate_to_module, click_tab
+from utils.frames import measure_interaction, summarize_frames
+from utils.supabase import supabase_rest
+from utils.waits import wait_for_idle
+
+
+SEED_MARKER = "BENCH-"
+
+# Master tab -> (table, column carrying the marker, row factory)
+SEED_TABLES = {
+    "Machine Master": ("machines", "machine_id", lambda i: {
+        "machine_id": f"{SEED_MARKER}M{i:05d}",
+        "make": "Bench",
+        "model": f"BM-{i % 50}",
+        "capacity_tons": 100 + i % 400,
+        "size": 100 + i % 400,
+        "type": "Injection Molding Machine",
+        "category": "IM",
+        "install_date": "2024-01-01",
+        "purchase_date": "2024-01-01",
+    }),
+    "Mold Master": ("molds", "mold_id", lambda i: {
+        "mold_id": f"{SEED_MARKER}D{i:05d}",
+        "mold_name": f"Bench mold {i}",
+        "item_code": f"{SEED_MARKER}D{i:05d}",
+        "item_name": f"Bench item {i}",
+        "maker": "Bench",
+        "cavities": 1 + i % 16,
+        "purchase_date": "2024-01-01",
+        "compatible_machines": [],
+    }),
+    "Raw Materials": ("raw_materials", "grade", lambda i: {
+        "sl_no": 100000 + i,
+        "category": "PP",
+        "type": "HP",
+        "grade": f"{SEED_MARKER}{i:05d}",
+        "supplier": "Bench",
+    }),
+    "Packing Materials": ("packing_materials", "item_code", lambda i: {
+        "category": "Boxes",
+        "type": "Export",
+        "item_code": f"{SEED_MARKER}{i:05d}",
+    }),
+}
+
+# Marks the tables already on the page, then records when a row of a new
+# table appears. Run right before clicking a tab.
+TABLE_PROBE_JS = """
+const previous = window.__heliumTableProbe;
+if (previous && previous.observer) previous.observer.disconnect();
+document.querySelectorAll('tbody').forEach((body) => { body.dataset.heliumStale = '1'; });
+
+const probe = window.__heliumTableProbe = {firstRow: null};
+probe.observer = new MutationObserver(() => {
+    if (document.querySelector('tbody:not([data-helium-stale]) tr')) {
+        probe.firstRow = performance.now();
+        probe.observer.disconnect();
+    }
+});
+probe.observer.observe(document.body, {childList: true, subtree: true});
+"""
+
+TABLE_RESULT_JS = """
+const probe = window.__heliumTableProbe || {};
+const state = window.__heliumIdle;
+if (!state || state.lastClick === null) return null;
+if (probe.observer) probe.observer.disconnect();
+return {
+    first_row_ms: probe.firstRow === null ? null : probe.firstRow - state.lastClick,
+    full_render_ms: Math.max(0, state.lastMutation - state.lastClick),
+    rows: document.querySelectorAll('tbody:not([data-helium-stale]) tr').length,
+};
+"""
+
+# Scroll the new table's scroll container from top to bottom, one step per frame
+SCROLL_TABLE_JS = """
+const frames = arguments[0];
+const done = arguments[arguments.length - 1];
+let el = document.querySelector('tbody:not([data-helium-stale])');
+while (el && el !== document.body) {
+    const overflow = getComputedStyle(el).overflowY;
+    if ((overflow === 'auto' || overflow === 'scroll') && el.scrollHeight > el.clientHeight) break;
+    el = el.parentElement;
+}
+if (!el || el === document.body) el = document.scrollingElement;
+
+const distance = el.scrollHeight - el.clientHeight;
+el.scrollTop = 0;
+let frame = 0;
+const step = () => {
+    frame++;
+    el.scrollTop = distance * frame / frames;
+    if (frame < frames) requestAnimationFrame(step); else done(distance);
+};
+requestAnimationFrame(step);
+"""
+
+FRESH_TBODY_SELECTOR = "tbody:not([data-helium-stale])"
+SORT_HEADER_XPATH = "ancestor::table[1]//th[contains(@class, 'cursor-pointer')]"
+
+
+def clear_seed(tabs: List[str] = None) -> None:
+    """
+    Delete all seeded rows (marker prefix) from the master tables.
+    """
+    for tab in tabs or SEED_TABLES:
+        table, column, _ = SEED_TABLES[tab]
+        supabase_rest("DELETE", f"{table}?{column}=like.{SEED_MARKER}*")
+
+
+def seed_masters(rows: int, tabs: List[str] = None, batch: int = MASTER_BENCH_SEED_BATCH) -> float:
+    """
+    Replace the seeded rows so each table has exactly rows seeded rows.
+    Returns the seconds spent seeding.
+    """
+    start = time.time()
+    clear_seed(tabs)
+    for tab in tabs or SEED_TABLES:
+        table, _, make_row = SEED_TABLES[tab]
+        for offset in range(0, rows, batch):
+            supabase_rest("POST", table, [make_row(i) for i in range(offset, min(rows, offset + batch))])
+    return time.time() - start
+
+
+def measure_master_tab(tab: str, scroll_frames: int = MASTER_BENCH_SCROLL_FRAMES) -> Dict[str, Any]:
+    """
+    Open a Master tab and measure first row, full render, header sort and
+    scrolling. Assumes the Masters module is open on another tab.
+
+    Returns dict with keys: tab, rows (rendered), first_row_ms,
+    full_render_ms, sort_ms, scroll (summarize_frames() dict).
+    """
+    driver = get_driver()
+    result = {"tab": tab, "rows": 0, "first_row_ms": None, "full_render_ms": None, "sort_ms": None, "scroll": None}
+
+    driver.execute_script(TABLE_PROBE_JS)
+    click_tab(tab)
+    wait_for_idle(TIMEOUT)
+    rendered = driver.execute_script(TABLE_RESULT_JS)
+    if rendered:
+        result.update(rendered)
+
+    # Sort by the first sortable column, then back
+    try:
+        tbody = driver.find_element(By.CSS_SELECTOR, FRESH_TBODY_SELECTOR)
+        header = tbody.find_element(By.XPATH, SORT_HEADER_XPATH)
+        timings = []
+        for _ in range(2):
+            header.click()
+            wait_for_idle(TIMEOUT)
+            sorted_state = driver.execute_script(TABLE_RESULT_JS)
+            if sorted_state:
+                timings.append(sorted_state["full_render_ms"])
+        result["sort_ms"] = sum(timings) / len(timings) if timings else None
+    except Exception:
+        pass
+
+    sample = measure_interaction(lambda: driver.execute_async_script(SCROLL_TABLE_JS, scroll_frames))
+    result["scroll"] = summarize_frames(sample["frames"], sample["long_tasks"])
+    return result
+
+
+def benchmark_size(rows: int, tabs: List[str]) -> Dict[str, Any]:
+    """
+    Seed rows per table, reload the app and measure every tab.
+
+    Returns dict with keys: seeded, seed_s, load_s (reload until the Masters
+    module is idle), tabs ({tab: measure_master_tab()}).
+    """
+    driver = get_driver()
+    result = {"seeded": rows, "seed_s": seed_masters(rows, tabs), "tabs": {}}
+
+    # Master data is fetched once per page load
+    start = time.time()
+    driver.refresh()
+    wait_for_page_load()
+    navigate_to_module(MODULES["masters"])
+    wait_for_idle(TIMEOUT)
+    result["load_s"] = time.time() - start
+
+    for index, tab in enumerate(tabs):
+        # Start every measurement from a different tab so the table remounts
+        click_tab(tabs[index - 1] if len(tabs) > 1 else "Others")
+        wait_for_idle(TIMEOUT)
+        result["tabs"][tab] = measure_master_tab(tab)
+
+    return result
+
+
+def scaling_exponents(points: List[tuple]) -> List[Optional[float]]:
+    """
+    Local growth exponent between consecutive (size, value) points:
+    log(value ratio) / log(size ratio). 1 is linear, 2 quadratic.
+    The first point, and points where either value is missing, get None.
+    """
+    exponents = [None]
+    for (size_a, value_a), (size_b, value_b) in zip(points, points[1:]):
+        if not value_a or not value_b or size_a <= 0 or size_b <= size_a:
+            exponents.append(None)
+        else:
+            exponents.append(math.log(value_b / value_a) / math.log(size_b / size_a))
+    return exponents
+
+
+def run_master_bench(sizes: List[int], tabs: List[str], keep: bool = False) -> List[Dict[str, Any]]:
+    """
+    Benchmark every size in turn in the current browser session (logged in).
+    Seeded rows are deleted at the end unless keep is set.
+    """
+    results = []
+    try:
+        for rows in sorted(sizes):
+            print(f"  Seeding {rows} rows into {len(tabs)} master tables...")
+            result = benchmark_size(rows, tabs)
+            results.append(result)
+            print(f"  {rows} rows: seeded in {result['seed_s']:.0f}s, Masters loaded in {result['load_s']:.1f}s")
+            for tab, stats in result["tabs"].items():
+                render = f"{stats['full_render_ms']:.0f} ms" if stats["full_render_ms"] is not None else "n/a"
+                print(f"    {tab}: {stats['rows']} rows rendered in {render}")
+    finally:
+        if not keep:
+            clear_seed(tabs)
+    return results
@@ -0,0 +1,125 @@
+"""
+Authenticated session cache for Helium tests
+
+Logs in once per browser (i.e. once per worker process), captures cookies
+and localStorage, and restores them for later tests instead of repeating
+the full login form flow.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from helium import go_to, get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import BASE_URL, VERIFY_SESSION_URL
+
+
+# Cookie keys accepted by WebDriver add_cookie. Domain is dropped so the
+# cookie binds to the current host (add_cookie rejects "localhost" domains).
+COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "expiry", "sameSite")
+
+# username -> {"cookies": [...], "local_storage": {...}}
+_sessions: Dict[str, Dict[str, Any]] = {}
+
+
+def capture_session(username: str) -> bool:
+    """
+    Store the current browser's cookies and localStorage for a user.
+    Call right after a successful login.
+    """
+    try:
+        driver = get_driver()
+        cookies = [
+            {key: cookie[key] for key in COOKIE_KEYS if key in cookie}
+            for cookie in driver.get_cookies()
+        ]
+        local_storage = driver.execute_script(
+            "return JSON.stringify(Object.assign({}, window.localStorage));"
+        )
+        _sessions[username] = {
+            "cookies": cookies,
+            "local_storage": json.loads(local_storage or "{}"),
+        }
+        return True
+    except Exception as e:
+        print(f"Capture session failed: {e}")
+        return False
+
+
+def is_session_valid(timeout: int = 10) -> bool:
+    """
+    Ask the app whether the browser's current session is accepted.
+    Runs fetch() inside the page so the httpOnly session cookie is sent.
+    The fetch is aborted after timeout seconds in the page itself, so the
+    driver's script timeout is left alone.
+    """
+    try:
+        driver = get_driver()
+        status = driver.execute_async_script(
+            """
+            const [url, ms] = arguments;
+            const done = arguments[arguments.length - 1];
+            const controller = new AbortController();
+            const timer = setTimeout(() => controller.abort(), ms);
+            fetch(url, {credentials: 'include', cache: 'no-store', signal: controller.signal})
+                .then(r => done(r.status))
+                .catch(() => done(0))
+                .finally(() => clearTimeout(timer));
+            """,
+            VERIFY_SESSION_URL,
+            timeout * 1000,
+        )
+        return status == 200
+    except Exception:
+        return False
+
+
+def restore_session(username: str) -> bool:
+    """
+    Inject a cached session into the browser and land on the app.
+    Returns False (and drops the cache entry) if there is nothing cached
+    or /api/auth/verify-session rejects it; the caller should log in.
+    """
+    session = _sessions.get(username)
+    if not session:
+        return False
+
+    try:
+        driver = get_driver()
+
+        # Cookies and storage can only be set for the page's own origin
+        if not driver.current_url.startswith(BASE_URL):
+            go_to(VERIFY_SESSION_URL)
+
+        for cookie in session["cookies"]:
+            driver.add_cookie(cookie)
+
+        driver.execute_script(
+            "const items = arguments[0];"
+            "for (const key in items) { window.localStorage.setItem(key, items[key]); }",
+            session["local_storage"],
+        )
+
+        if not is_session_valid():
+            clear_session(username)
+            return False
+
+        go_to(BASE_URL)
+        return True
+
+    except Exception as e:
+        print(f"Restore session failed: {e}")
+        clear_session(username)
+        return False
+
+
+def clear_session(username: Optional[str] = None) -> None:
+    """
+    Forget a cached session, or all sessions if no username is given.
+    """
+    if username is None:
+        _sessions.clear()
+    else:
+        _sessions.pop(username, None)
@@ -0,0 +1,159 @@
+"""
+Duration-aware shard planner for Helium tests
+
+Splits the suite across CI nodes so each shard gets roughly the same total
+runtime. Per-test durations come from the run history (p50); tests without
+history fall back to their module's median, then to a fixed default. The
+assignment is deterministic for a given history, so every node computes the
+same plan independently. CI nodes that do not share a history database
+should plan from a durations file exported with export_durations().
+"""
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import DEFAULT_TEST_DURATION, HISTORY_RUNS
+from utils.history import duration_percentiles, percentile
+
+
+Task = Tuple[str, Callable]
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse an "i/n" shard spec (1-based). Raises ValueError if invalid.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/n, got {value!r}")
+
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got {index}")
+
+    return index, count
+
+
+def flatten_modules(test_modules: List[Tuple[str, List[Callable]]]) -> List[Task]:
+    """
+    Flatten [(module, [tests])] into [(module, test)] in run order.
+    """
+    return [
+        (module_name, test_func)
+        for module_name, test_functions in test_modules
+        for test_func in test_functions
+    ]
+
+
+def group_by_module(tasks: List[Task]) -> List[Tuple[str, List[Callable]]]:
+    """
+    Regroup ordered tasks into [(module, [tests])], merging consecutive
+    tests of the same module.
+    """
+    test_modules = []
+    for module_name, test_func in tasks:
+        if test_modules and test_modules[-1][0] == module_name:
+            test_modules[-1][1].append(test_func)
+        else:
+            test_modules.append((module_name, [test_func]))
+    return test_modules
+
+
+def _task_key(module_name: str, test_name: str) -> str:
+    return f"{module_name}::{test_name}"
+
+
+def load_duration_history(last_n: int = HISTORY_RUNS) -> Dict[str, float]:
+    """
+    Return p50 duration per "module::test" from the run history.
+    """
+    try:
+        history = duration_percentiles(by="test", last_n=last_n)
+    except Exception as e:
+        print(f"Warning: Could not read run history, using default estimates: {e}")
+        return {}
+
+    return {_task_key(h["module"], h["test_name"]): h["p50"] for h in history}
+
+
+def export_durations(path: Path, last_n: int = HISTORY_RUNS) -> int:
+    """
+    Write p50 durations from the run history to a JSON file that every
+    CI node can plan from. Returns the number of tests written.
+    """
+    durations = load_duration_history(last_n)
+    with open(path, "w") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    return len(durations)
+
+
+def estimate_durations(tasks: List[Task], known: Dict[str, float]) -> List[float]:
+    """
+    Estimate each task's duration in seconds from known "module::test"
+    durations, falling back to the module median, then the default.
+    """
+    by_module: Dict[str, List[float]] = {}
+    for key, duration in known.items():
+        by_module.setdefault(key.split("::", 1)[0], []).append(duration)
+    module_medians = {module: percentile(values, 50) for module, values in by_module.items()}
+
+    return [
+        known.get(
+            _task_key(module_name, test_func.__name__),
+            module_medians.get(module_name, DEFAULT_TEST_DURATION),
+        )
+        for module_name, test_func in tasks
+    ]
+
+
+def plan_shards(durations: List[float], shard_count: int) -> List[List[int]]:
+    """
+    Assign task indices to shards by longest-processing-time bin packing:
+    longest tasks first, each to the currently lightest shard. Ties are
+    broken by task index and shard index, so the plan is deterministic.
+    Each shard's indices are returned in original run order.
+    """
+    shards: List[List[int]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+
+    for index in sorted(range(len(durations)), key=lambda i: (-durations[i], i)):
+        target = min(range(shard_count), key=lambda s: (loads[s], s))
+        shards[target].append(index)
+        loads[target] += durations[index]
+
+    return [sorted(shard) for shard in shards]
+
+
+def select_shard(
+    test_modules: List[Tuple[str, List[Callable]]],
+    shard_index: int,
+    shard_count: int,
+    durations_file: Optional[Path] = None
+) -> Tuple[List[Tuple[str, List[Callable]]], Dict[str, Any]]:
+    """
+    Pick the tests for shard i of n.
+    Durations come from durations_file if given, else the local run history.
+    Returns (test_modules for this shard, plan summary).
+    """
+    if durations_file:
+        with open(durations_file) as f:
+            known = json.load(f)
+    else:
+        known = load_duration_history()
+
+    tasks = flatten_modules(test_modules)
+    durations = estimate_durations(tasks, known)
+    shards = plan_shards(durations, shard_count)
+
+    selected = shards[shard_index - 1]
+    summary = {
+        "shard": shard_index,
+        "shards": shard_count,
+        "tests": len(selected),
+        "estimated": sum(durations[i] for i in selected),
+        "estimated_per_shard": [sum(durations[i] for i in shard) for shard in shards],
+    }
+
+    return group_by_module([tasks[i] for i in selected]), summary
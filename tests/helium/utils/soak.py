@@ -0,0 +1,295 @@
+"""
+Leak soak mode for Helium tests
+
+Operators keep Production and the Planner open all shift, so leaks that are
+invisible in a single test add up. Soak mode opens a module and cycles
+through its tabs (navigate_to_module / click_tab) hundreds of times. After
+a forced GC each cycle it samples the JS heap (performance.memory and CDP
+Runtime.getHeapUsage), DOM node, document and event listener counts (CDP
+Memory.getDOMCounters), then flags metrics that grow monotonically. Heap
+snapshots can be saved at the start and end for diffing in DevTools.
+"""
+import json
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    MODULES,
+    MASTER_TABS,
+    STORE_TABS,
+    PRODUCTION_TABS,
+    QUALITY_TABS,
+    MAINTENANCE_TABS,
+    SOAK_WARMUP_CYCLES,
+    SOAK_MIN_RHO,
+    SOAK_MIN_GROWTH,
+    HEAP_SNAPSHOT_DIR,
+)
+from utils.helpers import navigate_to_module, click_tab
+from utils.history import percentile
+from utils.network import reset_network
+from utils.perf import reset_views
+
+
+# Tabs cycled per module. Modules without tabs are left and re-entered
+# each cycle (via SOAK_AWAY_MODULE) so their mount/unmount is exercised.
+SOAK_TABS = {
+    MODULES["production"]: PRODUCTION_TABS,
+    MODULES["masters"]: MASTER_TABS,
+    MODULES["store"]: STORE_TABS,
+    MODULES["quality"]: QUALITY_TABS,
+    MODULES["maintenance"]: MAINTENANCE_TABS,
+    MODULES["prod_planner"]: [],
+}
+SOAK_AWAY_MODULE = MODULES["reports"]
+
+PAGE_MEMORY_JS = """
+const memory = performance.memory || {};
+return {
+    js_heap_used: memory.usedJSHeapSize || null,
+    live_nodes: document.getElementsByTagName('*').length,
+};
+"""
+
+# Metrics sampled each cycle, all in bytes or counts
+SOAK_METRICS = [
+    "js_heap_used",      # performance.memory.usedJSHeapSize (coarse in Chrome)
+    "cdp_heap_used",     # Runtime.getHeapUsage usedSize
+    "dom_nodes",         # Memory.getDOMCounters nodes (includes detached)
+    "live_nodes",        # elements attached to the document
+    "documents",         # Memory.getDOMCounters documents
+    "listeners",         # Memory.getDOMCounters jsEventListeners
+]
+
+
+def sample_memory(driver, collect_garbage: bool = True) -> Dict[str, Any]:
+    """
+    Take one memory sample from the current page, after a forced GC so
+    only retained memory is measured.
+    """
+    if collect_garbage:
+        try:
+            driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        except Exception:
+            pass
+
+    sample = dict.fromkeys(SOAK_METRICS)
+    try:
+        sample.update(driver.execute_script(PAGE_MEMORY_JS))
+    except Exception:
+        pass
+    try:
+        sample["cdp_heap_used"] = driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"]
+    except Exception:
+        pass
+    try:
+        counters = driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+        sample["dom_nodes"] = counters["nodes"]
+        sample["documents"] = counters["documents"]
+        sample["listeners"] = counters["jsEventListeners"]
+    except Exception:
+        pass
+
+    return sample
+
+
+def _ranks(values: List[float]) -> List[float]:
+    """
+    Average ranks (1-based), ties sharing their mean rank.
+    """
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def spearman_rho(values: List[float]) -> float:
+    """
+    Rank correlation between values and their position (cycle number).
+    1.0 means every sample is larger than the one before.
+    """
+    n = len(values)
+    if n < 3:
+        return 0.0
+
+    value_ranks = _ranks(values)
+    position_ranks = list(range(1, n + 1))
+    mean = (n + 1) / 2
+    covariance = sum((a - mean) * (b - mean) for a, b in zip(value_ranks, position_ranks))
+    spread_values = sum((a - mean) ** 2 for a in value_ranks) ** 0.5
+    spread_positions = sum((b - mean) ** 2 for b in position_ranks) ** 0.5
+    if not spread_values:
+        return 0.0
+    return covariance / (spread_values * spread_positions)
+
+
+def analyze_growth(
+    values: List[Optional[float]],
+    warmup: int = SOAK_WARMUP_CYCLES,
+    min_rho: float = SOAK_MIN_RHO,
+    min_growth: float = SOAK_MIN_GROWTH
+) -> Dict[str, Any]:
+    """
+    Decide whether a sampled series grows monotonically after warmup.
+    Start and end levels are medians of the first and last tenth of the
+    series, so single GC hiccups do not count.
+
+    Returns dict with keys: samples, start, end, growth (relative),
+    per_cycle (least-squares slope), rho, leaking.
+    """
+    series = [v for v in values[warmup:] if v is not None]
+    if len(series) < 3:
+        return {"samples": len(series), "start": None, "end": None, "growth": None,
+                "per_cycle": None, "rho": None, "leaking": False}
+
+    window = max(1, len(series) // 10)
+    start = percentile(series[:window], 50)
+    end = percentile(series[-window:], 50)
+    growth = (end - start) / start if start else 0.0
+
+    n = len(series)
+    mean_x = (n - 1) / 2
+    mean_y = sum(series) / n
+    per_cycle = (
+        sum((x - mean_x) * (y - mean_y) for x, y in enumerate(series)) /
+        sum((x - mean_x) ** 2 for x in range(n))
+    )
+
+    rho = spearman_rho(series)
+    return {
+        "samples": n,
+        "start": start,
+        "end": end,
+        "growth": growth,
+        "per_cycle": per_cycle,
+        "rho": rho,
+        "leaking": rho >= min_rho and growth >= min_growth,
+    }
+
+
+def _page_websocket_url(driver) -> str:
+    """
+    DevTools websocket URL of the page the driver controls.
+    """
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json", timeout=10) as response:
+        targets = json.load(response)
+
+    pages = [t for t in targets if t.get("type") == "page"]
+    handle = driver.current_window_handle
+    for target in pages:
+        if target.get("id") == handle:
+            return target["webSocketDebuggerUrl"]
+    return pages[0]["webSocketDebuggerUrl"]
+
+
+def take_heap_snapshot(driver, path: Path, timeout: float = 300) -> Path:
+    """
+    Write a .heapsnapshot file (loadable in DevTools > Memory) for the
+    current page. Snapshot chunks arrive as CDP events, which
+    execute_cdp_cmd cannot receive, so this talks to the page's DevTools
+    websocket directly (websocket-client ships with Selenium).
+    """
+    import websocket
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = websocket.create_connection(_page_websocket_url(driver), timeout=timeout, suppress_origin=True)
+    try:
+        conn.send(json.dumps({"id": 1, "method": "HeapProfiler.enable"}))
+        conn.send(json.dumps({
+            "id": 2,
+            "method": "HeapProfiler.takeHeapSnapshot",
+            "params": {"reportProgress": False},
+        }))
+        with open(path, "w") as f:
+            while True:
+                message = json.loads(conn.recv())
+                if message.get("method") == "HeapProfiler.addHeapSnapshotChunk":
+                    f.write(message["params"]["chunk"])
+                elif message.get("id") == 2:
+                    if "error" in message:
+                        raise RuntimeError(f"Heap snapshot failed: {message['error']}")
+                    break
+    finally:
+        conn.close()
+
+    return path
+
+
+def soak_module(
+    module: str,
+    cycles: int,
+    snapshots: bool = False,
+    collect_garbage: bool = True,
+    run_id: str = None
+) -> Dict[str, Any]:
+    """
+    Cycle one module's tabs and sample memory after every cycle.
+
+    Returns dict with keys: module, cycles, samples (one dict per cycle with
+    cycle, seconds and SOAK_METRICS), trends ({metric: analyze_growth()}),
+    leaking (metrics flagged), snapshots (paths), errors (failed clicks).
+    """
+    driver = get_driver()
+    tabs = SOAK_TABS.get(module, [])
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    snapshot_stem = module.lower().replace(" ", "_").replace("&", "and")
+    result = {"module": module, "cycles": cycles, "samples": [], "snapshots": [], "errors": 0}
+
+    navigate_to_module(module)
+    baseline = sample_memory(driver, collect_garbage)
+    result["samples"].append({"cycle": 0, "seconds": 0.0, **baseline})
+
+    if snapshots:
+        path = HEAP_SNAPSHOT_DIR / f"{run_id}_{snapshot_stem}_start.heapsnapshot"
+        result["snapshots"].append(str(take_heap_snapshot(driver, path)))
+
+    for cycle in range(1, cycles + 1):
+        start = time.time()
+
+        if tabs:
+            for tab in tabs:
+                if not click_tab(tab):
+                    result["errors"] += 1
+        else:
+            if not navigate_to_module(SOAK_AWAY_MODULE) or not navigate_to_module(module):
+                result["errors"] += 1
+
+        # Keep per-test buffers from growing over hundreds of cycles
+        reset_views()
+        reset_network()
+
+        sample = sample_memory(driver, collect_garbage)
+        result["samples"].append({"cycle": cycle, "seconds": time.time() - start, **sample})
+
+        if cycle % 25 == 0 or cycle == cycles:
+            print(
+                f"  {module}: cycle {cycle}/{cycles}, "
+                f"heap {(sample['cdp_heap_used'] or 0) / 1e6:.1f} MB, "
+                f"nodes {sample['dom_nodes']}, listeners {sample['listeners']}"
+            )
+
+    if snapshots:
+        path = HEAP_SNAPSHOT_DIR / f"{run_id}_{snapshot_stem}_end.heapsnapshot"
+        result["snapshots"].append(str(take_heap_snapshot(driver, path)))
+
+    result["trends"] = {
+        metric: analyze_growth([s[metric] for s in result["samples"]])
+        for metric in SOAK_METRICS
+    }
+    result["leaking"] = [metric for metric, trend in result["trends"].items() if trend["leaking"]]
+    return result
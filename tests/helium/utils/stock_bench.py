@@ -0,0 +1,294 @@
+"""
+Stock posting throughput and consistency benchmark
+
+Every /api/stock/post/<type>/[id] route reads the current balance, writes a
+ledger entry and then writes the new balance back, so month-end bursts of
+postings are both a throughput problem and a chance for lost updates. This
+benchmark seeds stock adjustments (the one source document that needs no
+POs, BOMs or masters) against a few BENCH-STK- items through Supabase's REST
+API, posts them through the API at increasing parallelism
+(STOCK_BENCH_PARALLELISM) and records postings per second and latency.
+
+Afterwards check_consistency() compares, per item and location, the balance
+from /api/stock/balance with the sum of the /api/stock/ledger entries and
+with the quantities of the documents that posted successfully. It also walks
+the ledger in insertion order and counts entries whose balance_after is not
+the previous balance_after plus their quantity: the mark of two postings
+that read the same balance. Seeded rows are deleted at the end.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import List, Dict, Any
+
+import requests
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import (
+    BASE_URL,
+    LOAD_REQUEST_TIMEOUT,
+    STOCK_BENCH_ITEMS,
+    STOCK_BENCH_LEDGER_PAGE,
+    STOCK_BALANCE_TOLERANCE,
+)
+from utils.load import TOTAL_ROUTE, new_session, send_request, summarize_load
+from utils.supabase import supabase_rest
+
+
+SEED_PREFIX = "BENCH-STK-"
+SEED_BATCH = 1000  # rows per insert request
+SEED_LOCATION = "STORE"
+POST_ROUTE = "POST /api/stock/post/adjustment"
+
+
+def item_codes(count: int = STOCK_BENCH_ITEMS) -> List[str]:
+    return [f"{SEED_PREFIX}{i:03d}" for i in range(count)]
+
+
+def clear_stock_seed() -> None:
+    """
+    Delete seeded ledger entries, balances, adjustments and items.
+    """
+    pattern = f"like.{SEED_PREFIX}*"
+    supabase_rest("DELETE", f"stock_ledger?item_code={pattern}")
+    supabase_rest("DELETE", f"stock_balances?item_code={pattern}")
+    # Adjustment items are removed with their header (ON DELETE CASCADE)
+    supabase_rest("DELETE", f"stock_adjustments?adjustment_no={pattern}")
+    supabase_rest("DELETE", f"stock_items?item_code={pattern}")
+
+
+def seed_stock_items(codes: List[str]) -> None:
+    supabase_rest("POST", "stock_items", [
+        {
+            "item_code": code,
+            "item_name": f"Bench stock item {code[len(SEED_PREFIX):]}",
+            "item_type": "RM",
+            "category": "BENCH",
+            "unit_of_measure": "KG",
+        }
+        for code in codes
+    ])
+
+
+def seed_adjustments(count: int, codes: List[str], tag: str) -> List[Dict[str, Any]]:
+    """
+    Insert count draft adjustments with one line each, spread round-robin
+    over codes. Every fourth one is a DECREASE.
+
+    Returns [{id, item_code, quantity (signed)}] in insertion order.
+    """
+    documents = []
+    for i in range(count):
+        decrease = i % 4 == 3
+        documents.append({
+            "id": str(uuid.uuid4()),
+            "number": f"{SEED_PREFIX}{tag}-{i:06d}",
+            "type": "DECREASE" if decrease else "INCREASE",
+            "item_code": codes[i % len(codes)],
+            "quantity": -(1 + i % 3) if decrease else 1 + i % 10,
+        })
+
+    today = date.today().isoformat()
+    for offset in range(0, count, SEED_BATCH):
+        batch = documents[offset:offset + SEED_BATCH]
+        supabase_rest("POST", "stock_adjustments", [
+            {
+                "id": doc["id"],
+                "adjustment_no": doc["number"],
+                "adjustment_date": today,
+                "adjustment_type": doc["type"],
+                "reason": "Stock posting benchmark",
+                "status": "DRAFT",
+                "created_by": "helium",
+            }
+            for doc in batch
+        ])
+        supabase_rest("POST", "stock_adjustment_items", [
+            {
+                "adjustment_id": doc["id"],
+                "item_code": doc["item_code"],
+                "location_code": SEED_LOCATION,
+                "quantity": abs(doc["quantity"]),
+                "unit_of_measure": "KG",
+            }
+            for doc in batch
+        ])
+
+    return [{"id": d["id"], "item_code": d["item_code"], "quantity": d["quantity"]} for d in documents]
+
+
+def _poster(token: str, documents: List[Dict[str, Any]], samples: List[Dict[str, Any]], lock: threading.Lock) -> None:
+    """
+    Post documents one after another on one keep-alive session.
+    """
+    with new_session(token) as session:
+        for doc in documents:
+            sample = send_request(session, {
+                "name": POST_ROUTE,
+                "method": "POST",
+                "path": f"/api/stock/post/adjustment/{doc['id']}",
+            })
+            sample["document"] = doc["id"]
+            with lock:
+                samples.append(sample)
+
+
+def post_documents(token: str, documents: List[Dict[str, Any]], parallelism: int) -> Dict[str, Any]:
+    """
+    Post documents with parallelism concurrent clients.
+
+    Returns dict with keys: parallelism, documents, seconds, postings_per_s
+    (successful postings per second), posted (ids that returned 2xx) and the
+    summarize_load() statistics for the batch (requests, errors, p50_ms...).
+    """
+    samples: List[Dict[str, Any]] = []
+    lock = threading.Lock()
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=parallelism) as pool:
+        futures = [
+            pool.submit(_poster, token, documents[index::parallelism], samples, lock)
+            for index in range(parallelism)
+        ]
+        for future in futures:
+            future.result()
+    seconds = time.time() - start
+
+    stats = summarize_load(samples, seconds)[TOTAL_ROUTE]
+    posted = {s["document"] for s in samples if s["ok"]}
+    return {
+        **stats,
+        "parallelism": parallelism,
+        "documents": len(documents),
+        "seconds": seconds,
+        "postings_per_s": len(posted) / seconds if seconds else 0.0,
+        "posted": posted,
+    }
+
+
+def _get(session: requests.Session, path: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    response = session.get(f"{BASE_URL}{path}", params=params, timeout=LOAD_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json().get("data") or []
+
+
+def fetch_ledger(session: requests.Session, code: str) -> List[Dict[str, Any]]:
+    """
+    All ledger entries for one item through /api/stock/ledger, oldest first.
+    """
+    entries: Dict[Any, Dict[str, Any]] = {}
+    offset = 0
+    while True:
+        page = _get(session, "/api/stock/ledger", {
+            "item_code": code, "limit": STOCK_BENCH_LEDGER_PAGE, "offset": offset,
+        })
+        for entry in page:
+            entries[entry["id"]] = entry
+        if len(page) < STOCK_BENCH_LEDGER_PAGE:
+            break
+        offset += STOCK_BENCH_LEDGER_PAGE
+    return sorted(entries.values(), key=lambda e: e["id"])
+
+
+def check_consistency(token: str, codes: List[str], expected: Dict[tuple, float]) -> List[Dict[str, Any]]:
+    """
+    Compare /api/stock/balance with the ledger for every seeded item.
+
+    expected maps (item_code, location) to the summed quantities of the
+    documents that posted successfully. Returns one dict per item and
+    location with keys: item_code, location, expected, ledger_sum, balance,
+    entries, chain_breaks, consistent.
+    """
+    rows = []
+    with new_session(token) as session:
+        for code in codes:
+            balances = {
+                b["location_code"]: float(b.get("current_balance") or 0)
+                for b in _get(session, "/api/stock/balance", {"item_code": code})
+            }
+            by_location: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in fetch_ledger(session, code):
+                by_location.setdefault(entry["location_code"], []).append(entry)
+
+            locations = set(balances) | set(by_location) | {loc for c, loc in expected if c == code}
+            for location in sorted(locations):
+                entries = by_location.get(location, [])
+                ledger_sum = 0.0
+                breaks = 0
+                previous = 0.0
+                for entry in entries:
+                    quantity = float(entry["quantity"])
+                    ledger_sum += quantity
+                    if abs(previous + quantity - float(entry["balance_after"])) > STOCK_BALANCE_TOLERANCE:
+                        breaks += 1
+                    previous = float(entry["balance_after"])
+
+                balance = balances.get(location, 0.0)
+                wanted = expected.get((code, location), 0.0)
+                rows.append({
+                    "item_code": code,
+                    "location": location,
+                    "expected": wanted,
+                    "ledger_sum": ledger_sum,
+                    "balance": balance,
+                    "entries": len(entries),
+                    "chain_breaks": breaks,
+                    "consistent": (
+                        abs(balance - ledger_sum) <= STOCK_BALANCE_TOLERANCE
+                        and abs(wanted - ledger_sum) <= STOCK_BALANCE_TOLERANCE
+                        and breaks == 0
+                    ),
+                })
+    return rows
+
+
+def run_stock_bench(
+    token: str,
+    levels: List[int],
+    documents: int,
+    items: int = STOCK_BENCH_ITEMS,
+    keep: bool = False
+) -> Dict[str, Any]:
+    """
+    Seed and post documents at every parallelism level, then check
+    consistency over everything posted. Seeded rows are deleted at the
+    end unless keep is set.
+
+    Returns dict with keys: items, seed_s, levels (post_documents() per
+    level, without the posted ids), consistency (check_consistency()).
+    """
+    codes = item_codes(items)
+    expected: Dict[tuple, float] = {}
+    result = {"items": items, "seed_s": 0.0, "levels": [], "consistency": []}
+
+    clear_stock_seed()
+    try:
+        seed_stock_items(codes)
+        for parallelism in levels:
+            start = time.time()
+            seeded = seed_adjustments(documents, codes, f"{int(start)}-P{parallelism}")
+            result["seed_s"] += time.time() - start
+
+            level = post_documents(token, seeded, parallelism)
+            for doc in seeded:
+                if doc["id"] in level["posted"]:
+                    key = (doc["item_code"], SEED_LOCATION)
+                    expected[key] = expected.get(key, 0.0) + doc["quantity"]
+            del level["posted"]
+            result["levels"].append(level)
+            print(
+                f"  x{parallelism}: {level['postings_per_s']:.1f} postings/s, "
+                f"p50 {level['p50_ms']:.0f} / p95 {level['p95_ms']:.0f} ms, "
+                f"{level['errors']} of {level['requests']} failed"
+            )
+
+        result["consistency"] = check_consistency(token, codes, expected)
+    finally:
+        if not keep:
+            clear_stock_seed()
+
+    return result
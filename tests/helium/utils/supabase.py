@@ -0,0 +1,35 @@
+"""
+Supabase REST helper for benchmark seeding
+
+Benchmarks that need data the UI cannot create fast enough write it straight
+to the database through Supabase's REST API (PostgREST), authenticated with
+the service role key like the app's server routes.
+"""
+import json
+import urllib.request
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
+
+
+def supabase_rest(method: str, path: str, body: Optional[List[Dict[str, Any]]] = None) -> None:
+    """
+    Call Supabase's REST API (PostgREST) with the service role key.
+    path is the table plus query string, e.g. "machines?machine_id=like.BENCH-*".
+    """
+    request = urllib.request.Request(
+        f"{SUPABASE_URL.rstrip('/')}/rest/v1/{path}",
+        data=json.dumps(body).encode() if body is not None else None,
+        method=method,
+        headers={
+            "apikey": SUPABASE_SERVICE_ROLE_KEY,
+            "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE_KEY}",
+            "Content-Type": "application/json",
+            "Prefer": "return=minimal",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=120) as response:
+        response.read()
@@ -0,0 +1,148 @@
+"""
+Web Vitals and Navigation Timing capture for Helium tests
+
+An observer script runs on every new document and records, per page load,
+Navigation Timing (TTFB, DOMContentLoaded, load), paint timings (FP, FCP),
+LCP, CLS and long tasks. Records are kept in sessionStorage so they survive
+the navigations a test triggers, and are harvested once at the end of the
+test.
+"""
+from typing import List, Dict, Any, Optional
+
+from helium import get_driver
+
+
+VITALS_KEY = "__heliumVitals"
+
+VITALS_OBSERVER_JS = """
+(function () {
+    if (window.__heliumVitals) return;
+    const KEY = '__heliumVitals';
+    const pageId = String(performance.timeOrigin);
+    const page = {
+        url: location.href, reused: false,
+        ttfb: null, dom_content_loaded: null, load: null, transfer_size: null,
+        first_paint: null, fcp: null, lcp: null, cls: 0,
+        long_tasks: 0, long_task_ms: 0, tbt: 0,
+    };
+
+    const save = () => {
+        const nav = performance.getEntriesByType('navigation')[0];
+        if (nav) {
+            page.ttfb = nav.responseStart;
+            page.dom_content_loaded = nav.domContentLoadedEventEnd || null;
+            page.load = nav.loadEventEnd || null;
+            page.transfer_size = nav.transferSize;
+        }
+        page.url = location.href;
+        try {
+            const pages = JSON.parse(sessionStorage.getItem(KEY) || '{}');
+            pages[pageId] = page;
+            sessionStorage.setItem(KEY, JSON.stringify(pages));
+        } catch (e) {}
+    };
+
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver(list => { list.getEntries().forEach(onEntry); save(); })
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    };
+
+    observe('paint', e => {
+        if (e.name === 'first-paint') page.first_paint = e.startTime;
+        if (e.name === 'first-contentful-paint') page.fcp = e.startTime;
+    });
+    observe('largest-contentful-paint', e => { page.lcp = e.renderTime || e.loadTime || e.startTime; });
+    observe('layout-shift', e => { if (!e.hadRecentInput) page.cls += e.value; });
+    observe('longtask', e => {
+        page.long_tasks++;
+        page.long_task_ms += e.duration;
+        page.tbt += Math.max(0, e.duration - 50);
+    });
+
+    window.addEventListener('load', () => setTimeout(save, 0));
+    window.addEventListener('pagehide', save);
+
+    window.__heliumVitals = {
+        save: save,
+        // Page was loaded by an earlier test: keep counting interaction
+        // costs from now on, but don't attribute its load metrics again
+        reset: () => {
+            page.reused = true;
+            page.cls = 0;
+            page.long_tasks = 0;
+            page.long_task_ms = 0;
+            page.tbt = 0;
+        },
+    };
+})();
+"""
+
+RESET_JS = """
+try { sessionStorage.removeItem(arguments[0]); } catch (e) {}
+if (window.__heliumVitals) window.__heliumVitals.reset();
+"""
+
+COLLECT_JS = """
+if (window.__heliumVitals) window.__heliumVitals.save();
+try { return Object.values(JSON.parse(sessionStorage.getItem(arguments[0]) || '{}')); }
+catch (e) { return []; }
+"""
+
+# Timing fields reported as the worst (max) value across a test's page loads
+TIMING_FIELDS = ["ttfb", "dom_content_loaded", "load", "first_paint", "fcp", "lcp"]
+
+
+def install_vitals_observer(driver) -> bool:
+    """
+    Register the vitals observer to run on every new document.
+    Returns False if CDP is unavailable.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": VITALS_OBSERVER_JS})
+        return True
+    except Exception:
+        return False
+
+
+def reset_vitals() -> None:
+    """
+    Forget recorded page loads. Called by the runner before each test.
+    """
+    try:
+        get_driver().execute_script(RESET_JS, VITALS_KEY)
+    except Exception:
+        pass
+
+
+def summarize_vitals(pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reduce per-page records to one row per test: worst timings across
+    fresh page loads, worst CLS, and total long-task cost.
+    """
+    loads = [p for p in pages if not p.get("reused")]
+
+    summary: Dict[str, Any] = {"page_loads": len(loads)}
+    for field in TIMING_FIELDS:
+        values = [p[field] for p in loads if p.get(field) is not None]
+        summary[field] = max(values) if values else None
+
+    summary["cls"] = max((p.get("cls") or 0 for p in pages), default=0)
+    summary["long_tasks"] = sum(p.get("long_tasks") or 0 for p in pages)
+    summary["long_task_ms"] = sum(p.get("long_task_ms") or 0 for p in pages)
+    summary["tbt"] = sum(p.get("tbt") or 0 for p in pages)
+    summary["pages"] = pages
+    return summary
+
+
+def collect_vitals() -> Optional[Dict[str, Any]]:
+    """
+    Harvest page records for the current test and summarize them.
+    Returns None if the browser could not be queried.
+    """
+    try:
+        pages = get_driver().execute_script(COLLECT_JS, VITALS_KEY) or []
+    except Exception:
+        return None
+    return summarize_vitals(pages)
@@ -0,0 +1,164 @@
+"""
+Event-driven waits for Helium tests
+
+Replaces fixed time.sleep() calls with bounded waits that return as soon as
+the Next.js app is idle: document loaded, no in-flight fetch/XHR requests,
+no visible loading spinners, and no DOM mutations for a short quiet window.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Any
+
+from helium import get_driver
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import EVENT_WAITS, IDLE_QUIET_MS, IDLE_POLL_INTERVAL
+
+
+# Installed on every new document via CDP so requests started during page
+# load are counted too. Safe to inject more than once. Also marks the last
+# click and counts requests started, for per-view budgets (utils/perf.py).
+IDLE_TRACKER_JS = """
+(function () {
+    if (window.__heliumIdle) return;
+    const state = window.__heliumIdle = {
+        pending: 0, started: 0, lastMutation: performance.now(), lastClick: null, clickStarted: 0,
+    };
+
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            state.started++;
+            return originalFetch.apply(this, arguments).finally(() => { state.pending--; });
+        };
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        state.started++;
+        this.addEventListener('loadend', () => { state.pending--; }, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+
+    new MutationObserver(() => { state.lastMutation = performance.now(); })
+        .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+
+    document.addEventListener('click', () => {
+        state.lastClick = performance.now();
+        state.clickStarted = state.started;
+    }, true);
+})();
+"""
+
+IDLE_STATE_JS = """
+const state = window.__heliumIdle;
+if (!state) return null;
+return {
+    ready: document.readyState === 'complete',
+    pending: state.pending,
+    busy: !!document.querySelector('.animate-spin, [aria-busy="true"]'),
+    quietFor: performance.now() - state.lastMutation,
+};
+"""
+
+# Per-test accounting of fixed sleep budget vs. time actually waited
+_stats = {"sleep_budget": 0.0, "waited": 0.0}
+
+
+def install_idle_tracker(driver) -> bool:
+    """
+    Register the idle tracker to run on every new document.
+    Returns False if CDP is unavailable; trackers are then injected lazily.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": IDLE_TRACKER_JS})
+        return True
+    except Exception:
+        return False
+
+
+def is_app_idle(state: Dict[str, Any], quiet_ms: float) -> bool:
+    """
+    Check an idle state snapshot returned by IDLE_STATE_JS.
+    """
+    return (
+        state["ready"]
+        and state["pending"] <= 0
+        and not state["busy"]
+        and state["quietFor"] >= quiet_ms
+    )
+
+
+def wait_for_idle(timeout: float, quiet_ms: float = IDLE_QUIET_MS) -> bool:
+    """
+    Wait until the app is idle, for at most timeout seconds.
+    The quiet window is measured from when the wait starts, so an action
+    that has not yet touched the DOM is not mistaken for idle.
+    Returns True if idle was reached, False on timeout.
+    """
+    driver = get_driver()
+    start = time.time()
+    deadline = start + timeout
+
+    while True:
+        state = driver.execute_script(IDLE_STATE_JS)
+        if state is None:
+            # Page was loaded before the tracker was registered
+            driver.execute_script(IDLE_TRACKER_JS)
+        else:
+            waited_ms = (time.time() - start) * 1000
+            state["quietFor"] = min(state["quietFor"], waited_ms)
+            if is_app_idle(state, quiet_ms):
+                return True
+
+        if time.time() >= deadline:
+            return False
+        time.sleep(min(IDLE_POLL_INTERVAL, max(0.0, deadline - time.time())))
+
+
+def settle(seconds: float) -> float:
+    """
+    Bounded replacement for time.sleep(seconds).
+    Returns once the app is idle or the original sleep duration has passed,
+    whichever comes first. With EVENT_WAITS disabled it sleeps the full
+    duration, reproducing the sleep-based run.
+    Returns the time actually waited.
+    """
+    start = time.time()
+
+    if EVENT_WAITS:
+        try:
+            wait_for_idle(timeout=seconds)
+        except Exception:
+            # No usable page (alert open, browser gone): keep old behaviour
+            time.sleep(max(0.0, seconds - (time.time() - start)))
+    else:
+        time.sleep(seconds)
+
+    waited = time.time() - start
+    _stats["sleep_budget"] += seconds
+    _stats["waited"] += waited
+    return waited
+
+
+def reset_wait_stats() -> None:
+    """
+    Clear wait accounting. Called by the runner before each test.
+    """
+    _stats["sleep_budget"] = 0.0
+    _stats["waited"] = 0.0
+
+
+def get_wait_stats() -> Dict[str, float]:
+    """
+    Return sleep budget, time actually waited and time saved for the
+    current test, in seconds.
+    """
+    return {
+        "sleep_budget": _stats["sleep_budget"],
+        "waited": _stats["waited"],
+        "saved": max(0.0, _stats["sleep_budget"] - _stats["waited"]),
+    }